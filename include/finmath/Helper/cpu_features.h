@@ -0,0 +1,54 @@
+#ifndef CPU_FEATURES_H
+#define CPU_FEATURES_H
+
+// Architecture detection for runtime-dispatched kernels
+#if defined(__x86_64__) || defined(_M_X64) || defined(__i386__) || defined(_M_IX86)
+    #define FINMATH_ARCH_X86
+#elif defined(__aarch64__) || defined(_M_ARM64)
+    #define FINMATH_ARCH_ARM64
+#endif
+
+namespace finmath {
+namespace cpu {
+
+/**
+ * @brief Instruction set levels that runtime-dispatched kernels are built for
+ *
+ * Each level (other than Scalar) has its own translation unit compiled with
+ * the matching per-file compiler flags, so a single binary carries all of them.
+ */
+enum class SimdLevel {
+    Scalar,
+    SSE42,
+    AVX2,
+    AVX512,
+    NEON
+};
+
+/**
+ * @brief Detect the widest instruction set supported by the running CPU
+ *
+ * The CPU is queried once (std::call_once); subsequent calls return the cached result.
+ *
+ * Every kernel accessor (rolling_vol_fn(), ema_fn(), sma_fn(), ...) and
+ * simd::get_simd_backend() is backed by a const pointer in its .cpp file that
+ * dynamic initialization fills from this function while the library loads, before
+ * any caller can reach it. The accessors are then a plain load: the hot path pays
+ * one indirect call and no once-check. Do not call them from another static
+ * initializer.
+ *
+ * @return Best SimdLevel available on this machine
+ */
+SimdLevel detect_simd_level();
+
+/**
+ * @brief Human-readable name of a SIMD level
+ * @return "AVX-512", "AVX2", "SSE4.2", "NEON", or "Scalar"
+ *         ("SSE (via sse2neon)" instead of "NEON" when built with FINMATH_SSE2NEON)
+ */
+const char* simd_level_name(SimdLevel level);
+
+} // namespace cpu
+} // namespace finmath
+
+#endif // CPU_FEATURES_H
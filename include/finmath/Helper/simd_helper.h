@@ -171,6 +171,20 @@ double vector_min(const double* a, size_t size);
  */
 double vector_conditional_sum(const double* a, size_t size, bool positive);
 
+/**
+ * @brief Cross-platform SIMD split of price changes into gains and losses
+ * Computes: d = prices[i+1] - prices[i], gains[i] = max(d, 0), losses[i] = max(-d, 0)
+ * 
+ * Writes the two series as separate contiguous arrays (structure of arrays)
+ * so later passes over gains or losses stream a single buffer each.
+ * 
+ * @param prices Input price series
+ * @param size Number of prices
+ * @param gains Output gains (must be pre-allocated with size - 1 elements)
+ * @param losses Output losses (must be pre-allocated with size - 1 elements)
+ */
+void vector_gains_losses(const double* prices, size_t size, double* gains, double* losses);
+
 /**
  * @brief Cache-blocked vector sum (optimized for large datasets)
  * Processes data in cache-friendly chunks to improve memory bandwidth utilization
@@ -205,11 +219,32 @@ double vector_variance_blocked(const double* a, size_t size, size_t chunk_size =
 double vector_stddev_blocked(const double* a, size_t size, size_t chunk_size = 4096);
 
 /**
- * @brief Get the SIMD implementation being used
- * @return String description of SIMD backend ("NEON", "AVX", "SSE", "Scalar")
+ * @brief Get the SIMD backend selected at runtime for dispatched kernels
+ * @return String description of SIMD backend ("AVX-512", "AVX2", "SSE4.2", "NEON", "Scalar")
  */
 const char* get_simd_backend();
 
+#if defined(FINMATH_USE_SSE)
+// AVX2 builds of the functions above (same arguments, no null or size checks),
+// compiled with per-file flags. The public functions dispatch to them at runtime
+// when the baseline build has no AVX; do not call them directly without checking
+// cpu::detect_simd_level(). vector_sum_sq_dev_avx2() returns sum((a[i] - mean)^2),
+// the shared core of vector_variance() and vector_variance_blocked().
+void vector_add_avx2(const double* a, const double* b, double* result, size_t size);
+void vector_sub_avx2(const double* a, const double* b, double* result, size_t size);
+void vector_mul_avx2(const double* a, const double* b, double* result, size_t size);
+void vector_div_avx2(const double* a, const double* b, double* result, size_t size);
+void vector_mul_scalar_avx2(const double* a, double scalar, double* result, size_t size);
+void vector_add_scalar_avx2(const double* a, double scalar, double* result, size_t size);
+double dot_product_avx2(const double* a, const double* b, size_t size);
+double vector_sum_avx2(const double* a, size_t size);
+double vector_sum_sq_dev_avx2(const double* a, size_t size, double mean);
+double vector_max_avx2(const double* a, size_t size);
+double vector_min_avx2(const double* a, size_t size);
+double vector_conditional_sum_avx2(const double* a, size_t size, bool positive);
+void vector_gains_losses_avx2(const double* prices, size_t size, double* gains, double* losses);
+#endif
+
 } // namespace simd
 } // namespace finmath
 
@@ -1,6 +1,7 @@
 #ifndef EMA_H
 #define EMA_H
 
+#include <cstddef>
 #include <vector>
 
 // Function to compute the Exponential Moving Average (EMA) using window size
@@ -9,4 +10,7 @@ std::vector<double> compute_ema(const std::vector<double>& prices, size_t window
 // Function to compute the Exponential Moving Average (EMA) using a smoothing factor
 std::vector<double> compute_ema_with_smoothing(const std::vector<double>& prices, double smoothing_factor);
 
+// Pointer-based EMA core shared by the vector and NumPy overloads; writes num_prices values to ema
+void compute_ema_with_smoothing(const double* prices, size_t num_prices, double smoothing_factor, double* ema);
+
 #endif // EMA_H
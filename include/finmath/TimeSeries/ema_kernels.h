@@ -0,0 +1,45 @@
+#ifndef EMA_KERNELS_H
+#define EMA_KERNELS_H
+
+#include <cstddef>
+#include "finmath/Helper/cpu_features.h"
+
+namespace finmath {
+namespace timeseries {
+
+/**
+ * @brief Signature shared by every EMA kernel
+ *
+ * Writes out[0] = prices[0] and out[i] = alpha * prices[i] + (1 - alpha) * out[i - 1]
+ * for i in [1, num_prices).
+ *
+ * @param prices Input prices (num_prices >= 1)
+ * @param num_prices Number of prices
+ * @param alpha Smoothing factor
+ * @param out Output buffer (must hold num_prices elements)
+ */
+using EmaFn = void (*)(const double* prices, size_t num_prices, double alpha, double* out);
+
+// Portable kernel, always available
+void ema_scalar(const double* prices, size_t num_prices, double alpha, double* out);
+
+// Blocked parallel-scan kernels. Within a block of B prices the recurrence unrolls to
+//   y[i+k] = (1-alpha)^(k+1) * y[i-1] + sum_{j<=k} alpha * (1-alpha)^(k-j) * x[i+j]
+// i.e. one lower-triangular B x B product (B FMAs, independent of y[i-1]) plus a
+// single FMA that carries the last output of the previous block forward.
+#if defined(FINMATH_ARCH_X86)
+void ema_avx2(const double* prices, size_t num_prices, double alpha, double* out);
+void ema_avx512(const double* prices, size_t num_prices, double alpha, double* out);
+#endif
+
+/**
+ * @brief Select the EMA kernel for the running CPU
+ *
+ * @return Kernel matching cpu::detect_simd_level()
+ */
+EmaFn ema_fn();
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // EMA_KERNELS_H
@@ -14,18 +14,18 @@ namespace py = pybind11;
  * 
  * @param prices_arr NumPy array of prices (zero-copy, no data duplication)
  * @param window Window size for EMA calculation
- * @return Vector of EMA values
+ * @return NumPy array of EMA values
  */
-std::vector<double> compute_ema_simd(py::array_t<double> prices_arr, size_t window);
+py::array_t<double> compute_ema_simd(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr, size_t window);
 
 /**
  * @brief SIMD-optimized exponential moving average with smoothing factor
  * 
  * @param prices_arr NumPy array of prices (zero-copy, no data duplication)
  * @param smoothing_factor Smoothing factor (typically 2.0 / (window + 1))
- * @return Vector of EMA values
+ * @return NumPy array of EMA values
  */
-std::vector<double> compute_ema_with_smoothing_simd(py::array_t<double> prices_arr, double smoothing_factor);
+py::array_t<double> compute_ema_with_smoothing_simd(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr, double smoothing_factor);
 
 #endif // EMA_SIMD_H
 
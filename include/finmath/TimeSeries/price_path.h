@@ -0,0 +1,27 @@
+#ifndef PRICE_PATH_H
+#define PRICE_PATH_H
+
+#include <cstddef>
+#include <cstdint>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+namespace py = pybind11;
+
+/**
+ * @brief Simulated geometric Brownian motion price path
+ *
+ * Equivalent to s0 * exp(cumsum(normal(drift, vol, n))) in NumPy, but the
+ * normal draw, the running sum and the exp happen in one loop that writes each
+ * price once, instead of three passes over intermediate arrays.
+ *
+ * @param n Number of prices
+ * @param drift Mean of the per-step log return
+ * @param vol Standard deviation of the per-step log return
+ * @param seed Seed for std::mt19937_64 (same seed, same path)
+ * @param s0 Starting price the path is scaled by
+ * @return NumPy array of n strictly positive prices
+ */
+py::array_t<double> make_price_path(size_t n, double drift, double vol, uint64_t seed, double s0 = 100.0);
+
+#endif // PRICE_PATH_H
@@ -0,0 +1,53 @@
+#ifndef ROLLING_STATISTICS_H
+#define ROLLING_STATISTICS_H
+
+#include <cstddef>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+namespace py = pybind11;
+
+/**
+ * @brief Rolling mean, rolling sample variance and EMA for one window size
+ *
+ * One sweep over the prices: each price read updates the running window sum,
+ * the sliding M2 (as in rolling_std_dev()) and the EMA state (alpha =
+ * 2 / (window_size + 1), as in compute_ema()). Runs the kernel selected by
+ * rolling_stats_fn().
+ *
+ * @param prices Input prices
+ * @param num_prices Number of prices
+ * @param window_size Rolling window size (2 <= window_size <= num_prices)
+ * @param sma Output: num_prices - window_size + 1 window means
+ * @param var Output: num_prices - window_size + 1 sample variances (divisor window_size - 1)
+ * @param ema Output: num_prices EMA values
+ */
+void fused_stats(const double* prices, size_t num_prices, size_t window_size,
+                 double* sma, double* var, double* ema);
+
+/**
+ * @brief Fused rolling statistics for NumPy input
+ *
+ * Same results as simple_moving_average(), a rolling sample variance and
+ * compute_ema() for the same window, in one call.
+ *
+ * @param prices_arr NumPy array of prices (read in place when float64 and contiguous)
+ * @param window_size Rolling window size
+ * @return dict with NumPy arrays "sma", "var" and "ema"
+ */
+py::dict rolling_statistics_np(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr,
+                               size_t window_size);
+
+/**
+ * @brief Rolling sample variance for NumPy input
+ *
+ * Forwards to rolling_statistics_np() and returns its "var" entry.
+ *
+ * @param prices_arr NumPy array of prices
+ * @param window_size Rolling window size
+ * @return NumPy array of num_prices - window_size + 1 sample variances
+ */
+py::array_t<double> rolling_variance_np(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr,
+                                        size_t window_size);
+
+#endif // ROLLING_STATISTICS_H
@@ -0,0 +1,90 @@
+#ifndef ROLLING_STATISTICS_KERNELS_H
+#define ROLLING_STATISTICS_KERNELS_H
+
+#include <cstddef>
+#include "finmath/Helper/cpu_features.h"
+
+namespace finmath {
+namespace timeseries {
+
+/**
+ * @brief Signature shared by every fused rolling-statistics kernel
+ *
+ * Writes, for one window size W:
+ *   sma[j] = mean(prices[j .. j + W)) and var[j] = sample variance (divisor W - 1)
+ *   of the same window, for j in [0, num_prices - W + 1);
+ *   ema[i] = alpha * prices[i] + (1 - alpha) * ema[i - 1] with ema[0] = prices[0]
+ *   and alpha = 2 / (W + 1), for i in [0, num_prices).
+ *
+ * @param prices Input prices (2 <= window_size <= num_prices)
+ * @param num_prices Number of prices
+ * @param window_size Rolling window size
+ * @param sma Output: num_prices - window_size + 1 window means
+ * @param var Output: num_prices - window_size + 1 sample variances
+ * @param ema Output: num_prices EMA values
+ */
+using RollingStatsFn = void (*)(const double* prices, size_t num_prices, size_t window_size,
+                                double* sma, double* var, double* ema);
+
+/**
+ * @brief Everything the fused loop carries from one price to the next
+ */
+struct RollingStatsState {
+    double sum;   ///< Sum of the current window
+    double mean;  ///< Mean of the current window
+    double m2;    ///< Sum of squared deviations of the current window
+    double ema;   ///< EMA at the last price read
+};
+
+/**
+ * @brief First window: ema[0 .. window_size), sma[0] and var[0]
+ *
+ * The EMA and the window sum advance together; M2 of the first window is then a
+ * second pass over the window_size prices against the finished mean.
+ *
+ * @return State after prices[window_size - 1]
+ */
+RollingStatsState rolling_stats_seed(const double* prices, size_t window_size,
+                                     double* sma, double* var, double* ema);
+
+/**
+ * @brief Per-price fused update for entering prices [first, num_prices)
+ *
+ * Shared tail of every kernel, built with the baseline flags. Replacing x_out by
+ * x_in moves the window sum by x_in - x_out and M2 by
+ * (x_in - x_out) * (x_in + x_out - new_mean - old_mean), the same update as
+ * rolling_std_dev() with the products expanded.
+ *
+ * @param st State after prices[first - 1]
+ */
+void rolling_stats_slide(const double* prices, size_t first, size_t num_prices, size_t window_size,
+                         RollingStatsState st, double* sma, double* var, double* ema);
+
+// Portable kernel, always available. One loop over the prices carries the EMA
+// state, the running window sum and the sliding M2 together, so each price is
+// read once and feeds all three.
+void rolling_stats_scalar(const double* prices, size_t num_prices, size_t window_size,
+                          double* sma, double* var, double* ema);
+
+// Blocked kernels: the same loop B prices at a time. Window sums and M2 are
+// in-register prefix sums of B independent updates plus the carried value from
+// the previous block (as in the SMA kernels); the EMA is the block operator of
+// the EMA kernels. Each carried chain advances once per B prices.
+#if defined(FINMATH_ARCH_X86)
+void rolling_stats_avx2(const double* prices, size_t num_prices, size_t window_size,
+                        double* sma, double* var, double* ema);
+void rolling_stats_avx512(const double* prices, size_t num_prices, size_t window_size,
+                          double* sma, double* var, double* ema);
+#endif
+
+/**
+ * @brief Select the fused rolling-statistics kernel for the running CPU
+ *
+ * @return Kernel matching cpu::detect_simd_level()
+ */
+RollingStatsFn rolling_stats_fn();
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // ROLLING_STATISTICS_KERNELS_H
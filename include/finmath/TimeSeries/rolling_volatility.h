@@ -1,6 +1,7 @@
 #ifndef ROLLING_VOLATILITY_H
 #define ROLLING_VOLATILITY_H
 
+#include <cstddef>
 #include <vector>
 
 // Function to compute the logarithmic returns from prices
@@ -12,4 +13,9 @@ double compute_std(const std::vector<double>& data);
 // Function to compute the rolling volatility from a time series of prices
 std::vector<double> rolling_volatility(const std::vector<double>& prices, size_t window_size);
 
+// Pointer core shared by the list and NumPy overloads. Writes num_prices - window_size
+// volatilities (requires 0 < window_size < num_prices); returns false if any price is
+// not strictly positive.
+bool rolling_volatility(const double* prices, size_t num_prices, size_t window_size, double* volatilities);
+
 #endif // ROLLING_VOLATILITY_H
@@ -0,0 +1,117 @@
+#ifndef ROLLING_VOLATILITY_KERNELS_H
+#define ROLLING_VOLATILITY_KERNELS_H
+
+#include <cstddef>
+#include "finmath/Helper/cpu_features.h"
+
+namespace finmath {
+namespace timeseries {
+
+/**
+ * @brief Signature shared by every rolling volatility kernel
+ *
+ * Writes out[i] = std_dev(log_returns[i .. i + window_size)) * sqrt(252)
+ * for i in [0, num_windows).
+ *
+ * @param log_returns Log returns (at least num_windows + window_size - 1 elements)
+ * @param num_windows Number of output values
+ * @param window_size Rolling window size
+ * @param out Output buffer (must hold num_windows elements)
+ */
+using RollingVolFn = void (*)(const double* log_returns, size_t num_windows, size_t window_size, double* out);
+
+// Single-precision counterpart (opt-in via rolling_volatility_simd_f32): float log
+// returns in and float volatilities out, half the memory traffic. The AVX2/AVX-512
+// kernels seed the first window on packed float lanes with compensated sums; the
+// slide then carries mean and M2 in double (see rolling_vol_slide()).
+using RollingVolFnF32 = void (*)(const float* log_returns, size_t num_windows, size_t window_size, float* out);
+
+/**
+ * @brief Signature shared by every log-return kernel
+ *
+ * Writes out[i] = log(prices[i + 1] / prices[i]) for i in [0, num_prices - 1),
+ * with std::log semantics for every input (non-positive prices give NaN/inf).
+ *
+ * @param prices Input prices
+ * @param num_prices Number of prices
+ * @param out Output buffer (must hold num_prices - 1 elements)
+ * @return false if any price is not strictly positive, so callers can reject the series
+ */
+using LogReturnsFn = bool (*)(const double* prices, size_t num_prices, double* out);
+using LogReturnsFnF32 = bool (*)(const float* prices, size_t num_prices, float* out);
+
+/**
+ * @brief O(1)-per-step Welford update shared by every kernel
+ *
+ * Given the mean and sum of squared deviations (M2) of the first window,
+ * emits all num_windows outputs by adding the entering log return and
+ * removing the leaving one. Compiled for the baseline ISA only; the per-ISA
+ * kernels differ solely in how they compute the first window's moments.
+ * The float overload carries mean and M2 in double as well: M2 rounding error
+ * is absolute, and in float it would be set by the most volatile stretch since
+ * the last re-seed and dominate the windows of a later calm one.
+ *
+ * @param log_returns Log returns (at least num_windows + window_size - 1 elements)
+ * @param num_windows Number of output values
+ * @param window_size Rolling window size
+ * @param mean Mean of log_returns[0 .. window_size)
+ * @param m2 Sum of squared deviations of log_returns[0 .. window_size)
+ * @param out Output buffer (must hold num_windows elements)
+ */
+void rolling_vol_slide(const double* log_returns, size_t num_windows, size_t window_size,
+                       double mean, double m2, double* out);
+void rolling_vol_slide(const float* log_returns, size_t num_windows, size_t window_size,
+                       double mean, double m2, float* out);
+
+// Portable kernels, always available
+void rolling_vol_scalar(const double* log_returns, size_t num_windows, size_t window_size, double* out);
+void rolling_vol_scalar(const float* log_returns, size_t num_windows, size_t window_size, float* out);
+bool log_returns_scalar(const double* prices, size_t num_prices, double* out);
+bool log_returns_scalar(const float* prices, size_t num_prices, float* out);
+
+// Per-ISA kernels, each in its own translation unit built with the matching
+// compiler flags. Only call these after checking cpu::detect_simd_level().
+#if defined(FINMATH_ARCH_X86)
+void rolling_vol_sse42(const double* log_returns, size_t num_windows, size_t window_size, double* out);
+void rolling_vol_avx2(const double* log_returns, size_t num_windows, size_t window_size, double* out);
+void rolling_vol_avx2(const float* log_returns, size_t num_windows, size_t window_size, float* out);
+void rolling_vol_avx512(const double* log_returns, size_t num_windows, size_t window_size, double* out);
+void rolling_vol_avx512(const float* log_returns, size_t num_windows, size_t window_size, float* out);
+// Packed log (exponent/mantissa split + atanh series): ~1 ulp in double, ~3 ulp in float
+bool log_returns_avx2(const double* prices, size_t num_prices, double* out);
+bool log_returns_avx2(const float* prices, size_t num_prices, float* out);
+bool log_returns_avx512(const double* prices, size_t num_prices, double* out);
+bool log_returns_avx512(const float* prices, size_t num_prices, float* out);
+#elif defined(FINMATH_SSE2NEON)
+// aarch64 with sse2neon.h: the SSE4.2 source is compiled for NEON
+void rolling_vol_sse42(const double* log_returns, size_t num_windows, size_t window_size, double* out);
+#elif defined(FINMATH_ARCH_ARM64)
+void rolling_vol_neon(const double* log_returns, size_t num_windows, size_t window_size, double* out);
+#endif
+
+/**
+ * @brief Select the rolling volatility kernel for the running CPU
+ *
+ * @return Kernel matching cpu::detect_simd_level()
+ */
+RollingVolFn rolling_vol_fn();
+
+/**
+ * @brief Single-precision kernel for the running CPU
+ *
+ * AVX2 and AVX-512 have float kernels; other levels use the scalar one.
+ */
+RollingVolFnF32 rolling_vol_fn_f32();
+
+/**
+ * @brief Log-return kernel for the running CPU
+ *
+ * AVX2 and AVX-512 have vectorized kernels; other levels use std::log.
+ */
+LogReturnsFn log_returns_fn();
+LogReturnsFnF32 log_returns_fn_f32();
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // ROLLING_VOLATILITY_KERNELS_H
@@ -11,16 +11,59 @@ namespace py = pybind11;
  * @brief SIMD-optimized rolling volatility calculation
  * 
  * Computes annualized rolling volatility using cross-platform SIMD optimizations.
- * Automatically selects the best SIMD backend (AVX, SSE, NEON, or scalar fallback).
+ * The kernel is picked at runtime from the CPU's capabilities
+ * (AVX-512, AVX2, SSE4.2, NEON, or scalar fallback); see rolling_volatility_kernels.h.
  * 
  * Uses log returns: ln(P_t / P_{t-1})
  * Volatility = std_dev(returns) * sqrt(252)
  * 
  * @param prices_arr NumPy array of prices (zero-copy, no data duplication)
  * @param window_size Rolling window size
- * @return Vector of annualized volatility values
+ * @return NumPy array of annualized volatility values
  */
-std::vector<double> rolling_volatility_simd(py::array_t<double> prices_arr, size_t window_size);
+py::array_t<double> rolling_volatility_simd(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr, size_t window_size);
+
+/**
+ * @brief Single-precision rolling volatility (opt-in)
+ * 
+ * Same algorithm as rolling_volatility_simd() with float log returns and
+ * float output (half the memory traffic); window mean and M2 are still
+ * accumulated in double, so calm stretches after volatile ones keep their
+ * precision. Agrees with rolling_volatility_simd() on the same float32 prices
+ * to about 1e-5 relative, set by the rounding of the float log returns.
+ * 
+ * @param prices_arr NumPy array of prices (converted to float32 if needed)
+ * @param window_size Rolling window size
+ * @return float32 NumPy array of annualized volatility values
+ */
+py::array_t<float> rolling_volatility_simd_f32(py::array_t<float, py::array::c_style | py::array::forcecast> prices_arr,
+                                               size_t window_size);
+
+/**
+ * @brief Python entry point for rolling_volatility_simd
+ *
+ * float32 arrays (contiguous or not) go to rolling_volatility_simd_f32() and
+ * return float32; anything else is converted to float64.
+ *
+ * @param prices NumPy array or sequence of prices
+ * @param window_size Rolling window size
+ * @return NumPy array of annualized volatility values
+ */
+py::array rolling_volatility_simd_obj(py::object prices, size_t window_size);
+
+/**
+ * @brief Rolling volatility for several window sizes in one pass
+ * 
+ * Same values as calling rolling_volatility_simd() once per window, but the
+ * log returns are computed once per L2-sized tile and shared by every window,
+ * instead of re-reading the prices and recomputing the logs for each window.
+ * 
+ * @param prices_arr NumPy array of prices
+ * @param window_sizes Window sizes (each at least 2 and smaller than the number of prices)
+ * @return List of NumPy arrays, one per window size, in the order given
+ */
+py::list rolling_volatility_multi(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr,
+                                  const std::vector<size_t>& window_sizes);
 
 #endif // ROLLING_VOLATILITY_SIMD_H
 
@@ -14,9 +14,9 @@ namespace py = pybind11;
  * 
  * @param prices_arr NumPy array of prices (zero-copy, no data duplication)
  * @param window_size Window size for RSI calculation
- * @return Vector of RSI values
+ * @return NumPy array of RSI values
  */
-std::vector<double> compute_smoothed_rsi_simd(py::array_t<double> prices_arr, size_t window_size);
+py::array_t<double> compute_smoothed_rsi_simd(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr, size_t window_size);
 
 #endif // RSI_SIMD_H
 
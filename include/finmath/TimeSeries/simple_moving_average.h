@@ -3,7 +3,14 @@
 
 #include <vector>
 
+#include <cstddef>
+
 // Function to compute the moving average from a time series
 std::vector<double> simple_moving_average(const std::vector<double>& data, size_t window_size);
 
+// Pointer core shared by every SMA entry point: single pass with a running window sum,
+// through the kernel sma_fn() selected for this CPU.
+// Writes num_data - window_size + 1 averages (requires 0 < window_size <= num_data).
+void simple_moving_average(const double* data, size_t num_data, size_t window_size, double* averages);
+
 #endif // MOVING_AVERAGE_H
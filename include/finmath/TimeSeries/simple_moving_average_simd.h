@@ -14,9 +14,33 @@ namespace py = pybind11;
  * 
  * @param data_arr NumPy array of data (zero-copy, no data duplication)
  * @param window_size Rolling window size
- * @return Vector of moving average values
+ * @return NumPy array of moving average values
  */
-std::vector<double> simple_moving_average_simd(py::array_t<double> data_arr, size_t window_size);
+py::array_t<double> simple_moving_average_simd(py::array_t<double, py::array::c_style | py::array::forcecast> data_arr, size_t window_size);
+
+/**
+ * @brief Single-precision simple moving average
+ *
+ * Reads and writes float32 (half the memory traffic of the float64 version);
+ * the running window sum is still carried in double.
+ *
+ * @param data_arr NumPy float32 array of data
+ * @param window_size Rolling window size
+ * @return NumPy float32 array of moving average values
+ */
+py::array_t<float> simple_moving_average_simd_f32(py::array_t<float, py::array::c_style | py::array::forcecast> data_arr, size_t window_size);
+
+/**
+ * @brief Python entry point for simple_moving_average_simd
+ *
+ * float32 arrays (contiguous or not) go to simple_moving_average_simd_f32()
+ * and return float32; anything else is converted to float64.
+ *
+ * @param data NumPy array or sequence of data
+ * @param window_size Rolling window size
+ * @return NumPy array of moving average values
+ */
+py::array simple_moving_average_simd_obj(py::object data, size_t window_size);
 
 #endif // SIMPLE_MOVING_AVERAGE_SIMD_H
 
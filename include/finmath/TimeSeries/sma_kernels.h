@@ -0,0 +1,52 @@
+#ifndef SMA_KERNELS_H
+#define SMA_KERNELS_H
+
+#include <cstddef>
+#include "finmath/Helper/cpu_features.h"
+
+namespace finmath {
+namespace timeseries {
+
+/**
+ * @brief Signature shared by every SMA kernel
+ *
+ * Writes averages[i] = mean(data[i .. i + window_size)) for
+ * i in [0, num_data - window_size + 1).
+ *
+ * @param data Input data (0 < window_size <= num_data)
+ * @param num_data Number of data points
+ * @param window_size Rolling window size
+ * @param averages Output buffer (must hold num_data - window_size + 1 elements)
+ */
+using SmaFn = void (*)(const double* data, size_t num_data, size_t window_size, double* averages);
+
+// float32 data, same contract. The window sum is carried in double: a float
+// running sum would drift by ~1e-7 relative per step over long series.
+using SmaFnF32 = void (*)(const float* data, size_t num_data, size_t window_size, float* averages);
+
+// Portable kernel, always available: running window sum, one add per output
+void sma_scalar(const double* data, size_t num_data, size_t window_size, double* averages);
+void sma_scalar(const float* data, size_t num_data, size_t window_size, float* averages);
+
+// Blocked-scan kernels. The window sum follows S[j] = S[j-1] + (data[j+w-1] - data[j-1]),
+// so a block of B sums is an in-register prefix sum of B independent differences
+// plus the carried S from the previous block: one add on the carried chain per B outputs.
+#if defined(FINMATH_ARCH_X86)
+void sma_avx2(const double* data, size_t num_data, size_t window_size, double* averages);
+void sma_avx2(const float* data, size_t num_data, size_t window_size, float* averages);
+void sma_avx512(const double* data, size_t num_data, size_t window_size, double* averages);
+void sma_avx512(const float* data, size_t num_data, size_t window_size, float* averages);
+#endif
+
+/**
+ * @brief Select the SMA kernel for the running CPU
+ *
+ * @return Kernel matching cpu::detect_simd_level()
+ */
+SmaFn sma_fn();
+SmaFnF32 sma_fn_f32();
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // SMA_KERNELS_H
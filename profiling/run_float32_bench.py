@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Check that the float32 SIMD paths beat upcasting to float64.
+
+A float32 array passed to simple_moving_average_simd / rolling_volatility_simd
+stays float32. That is only worth having if it is faster than what a caller
+could do anyway: x.astype(np.float64) followed by the float64 path. This script
+times both for each function and exits non-zero if float32 is not faster.
+
+  python profiling/run_float32_bench.py                    # 4M prices, window 20
+  python profiling/run_float32_bench.py --size 1000000 --window 252
+
+Run from repo root.
+"""
+
+import sys
+import time
+import argparse
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="float32 SIMD paths vs astype(float64) + float64 path")
+    parser.add_argument("--size", type=int, default=4_000_000, help="Number of prices (default 4000000)")
+    parser.add_argument("--window", type=int, default=20, help="Window size (default 20)")
+    parser.add_argument("--repeat", type=int, default=15, help="Timed runs per path; the best is kept (default 15)")
+    args = parser.parse_args()
+
+    try:
+        import finmath
+    except ImportError:
+        sys.path.insert(0, "src")
+        import finmath
+
+    import numpy as np
+    prices32 = finmath.make_price_path(args.size, 0.0, 0.01, 42).astype(np.float32)
+
+    slower = []
+    for name in ("simple_moving_average_simd", "rolling_volatility_simd"):
+        fn = getattr(finmath, name)
+        assert fn(prices32, args.window).dtype == np.float32
+        t32 = best_of(lambda: fn(prices32, args.window), args.repeat)
+        t64 = best_of(lambda: fn(prices32.astype(np.float64), args.window), args.repeat)
+        print(f"{name:28s} float32: {t32 * 1e3:7.2f} ms   astype(float64): {t64 * 1e3:7.2f} ms   "
+              f"speedup {t64 / t32:.2f}x  (n={args.size}, window={args.window})")
+        if t32 >= t64:
+            slower.append(name)
+
+    if slower:
+        print(f"float32 is not faster than upcasting for: {', '.join(slower)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
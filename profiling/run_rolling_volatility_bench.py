@@ -6,6 +6,10 @@ Run from repo root. Use --scalar or --simd to profile one path; default runs bot
   python profiling/run_rolling_volatility_bench.py --scalar   # scalar only
   python profiling/run_rolling_volatility_bench.py --simd       # SIMD only
   python profiling/run_rolling_volatility_bench.py            # both, print comparison
+  python profiling/run_rolling_volatility_bench.py --list     # scalar path fed a Python list
+
+Both paths receive the same float64 NumPy array by default, so the ratio compares
+kernels rather than list -> std::vector marshalling. Pass --list to include that cost.
 
 For perf on Linux:
   ./profiling/profile perf-stat rolling_volatility
@@ -16,6 +20,20 @@ import sys
 import time
 import argparse
 
+def generate_price_data(n, s0=100.0, mu=0.0, sigma=0.01, seed=42):
+    """Geometric Brownian motion prices, built with NumPy's C loops (no per-element Python).
+
+    Prices stay strictly positive at any size, which rolling_volatility requires
+    for its log returns.
+    """
+    import numpy as np
+    np.random.seed(seed)
+    log_returns = np.random.normal(mu, sigma, n - 1)
+    prices = np.empty(n)
+    prices[0] = s0
+    np.multiply(s0, np.cumprod(np.exp(log_returns)), out=prices[1:])
+    return prices
+
 def main():
     parser = argparse.ArgumentParser(description="Benchmark rolling_volatility vs rolling_volatility_simd")
     parser.add_argument("--scalar", action="store_true", help="Run only scalar (vector) path")
@@ -23,6 +41,8 @@ def main():
     parser.add_argument("--size", type=int, default=100_000, help="Number of prices (default 100000)")
     parser.add_argument("--window", type=int, default=252, help="Window size (default 252)")
     parser.add_argument("--iterations", type=int, default=50, help="Iterations per path (default 50)")
+    parser.add_argument("--list", action="store_true",
+                        help="Pass a Python list to the scalar path (includes per-call list conversion)")
     args = parser.parse_args()
 
     if not args.scalar and not args.simd:
@@ -36,13 +56,12 @@ def main():
         import finmath
 
     import numpy as np
-    np.random.seed(42)
-    prices = np.abs(np.cumsum(np.random.randn(args.size)) + 100.0).astype(np.float64)
-    prices_list = prices.tolist()
+    prices = generate_price_data(args.size)
+    scalar_input = prices.tolist() if args.list else prices
 
     def run_scalar():
         for _ in range(args.iterations):
-            finmath.rolling_volatility(prices_list, args.window)
+            finmath.rolling_volatility(scalar_input, args.window)
 
     def run_simd():
         for _ in range(args.iterations):
@@ -60,6 +79,14 @@ def main():
         print(f"rolling_volatility_simd:      {elapsed:.4f}s  ({args.iterations} iter, n={args.size}, window={args.window})")
 
     if args.scalar and args.simd:
+        # Both results are NumPy arrays, so compare them directly; on large inputs a
+        # strided sample (~4 KB) keeps the correctness check off the timing budget.
+        result_baseline = finmath.rolling_volatility(scalar_input, args.window)
+        result_simd = finmath.rolling_volatility_simd(prices, args.window)
+        step = max(1, len(result_simd) // 512) if len(result_simd) > 1_000_000 else 1
+        max_diff = np.max(np.abs(result_baseline[::step] - result_simd[::step]))
+        print(f"Max |scalar - simd|: {max_diff:.3e}")
+
         # Run again for a quick ratio (same order)
         t_scalar = time.perf_counter()
         run_scalar()
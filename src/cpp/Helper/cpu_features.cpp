@@ -0,0 +1,78 @@
+#include "finmath/Helper/cpu_features.h"
+#include <mutex>
+
+#if defined(FINMATH_ARCH_ARM64)
+    #if defined(__linux__)
+        #include <sys/auxv.h>
+        #include <asm/hwcap.h>
+    #elif defined(__APPLE__)
+        #include <sys/sysctl.h>
+    #endif
+#endif
+
+namespace finmath {
+namespace cpu {
+
+namespace {
+
+SimdLevel query_simd_level() {
+#if defined(FINMATH_ARCH_X86) && (defined(__GNUC__) || defined(__clang__))
+    __builtin_cpu_init();
+    if (__builtin_cpu_supports("avx512f") && __builtin_cpu_supports("avx512dq")) {
+        return SimdLevel::AVX512;
+    }
+    if (__builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma")) {
+        return SimdLevel::AVX2;
+    }
+    if (__builtin_cpu_supports("sse4.2")) {
+        return SimdLevel::SSE42;
+    }
+    return SimdLevel::Scalar;
+#elif defined(FINMATH_ARCH_ARM64)
+    #if defined(__linux__)
+    if (getauxval(AT_HWCAP) & HWCAP_ASIMD) {
+        return SimdLevel::NEON;
+    }
+    return SimdLevel::Scalar;
+    #elif defined(__APPLE__)
+    int has_neon = 0;
+    size_t len = sizeof(has_neon);
+    if (sysctlbyname("hw.optional.neon", &has_neon, &len, nullptr, 0) == 0 && has_neon) {
+        return SimdLevel::NEON;
+    }
+    return SimdLevel::Scalar;
+    #else
+    // Advanced SIMD is mandatory on ARMv8-A
+    return SimdLevel::NEON;
+    #endif
+#else
+    return SimdLevel::Scalar;
+#endif
+}
+
+} // namespace
+
+SimdLevel detect_simd_level() {
+    static std::once_flag once;
+    static SimdLevel level = SimdLevel::Scalar;
+    std::call_once(once, [] { level = query_simd_level(); });
+    return level;
+}
+
+const char* simd_level_name(SimdLevel level) {
+    switch (level) {
+        case SimdLevel::AVX512: return "AVX-512";
+        case SimdLevel::AVX2:   return "AVX2";
+        case SimdLevel::SSE42:  return "SSE4.2";
+#if defined(FINMATH_SSE2NEON)
+        case SimdLevel::NEON:   return "SSE (via sse2neon)";
+#else
+        case SimdLevel::NEON:   return "NEON";
+#endif
+        case SimdLevel::Scalar: break;
+    }
+    return "Scalar";
+}
+
+} // namespace cpu
+} // namespace finmath
@@ -1,20 +1,27 @@
 #include "finmath/Helper/simd_helper.h"
+#include "finmath/Helper/cpu_features.h"
 #include <cmath>
 #include <algorithm>
 
 namespace finmath {
 namespace simd {
 
-const char* get_simd_backend() {
-#ifdef FINMATH_USE_AVX
-    return "AVX";
-#elif defined(FINMATH_USE_SSE)
-    return "SSE";
-#elif defined(FINMATH_USE_NEON)
-    return "NEON";
-#else
-    return "Scalar";
+namespace {
+
+const char* const g_simd_backend = cpu::simd_level_name(cpu::detect_simd_level());
+
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+// Without FINMATH_BASELINE_AVX this file only has its SSE2 paths; every helper
+// with its own SIMD loop switches to its AVX2 build (simd_helper_avx2.cpp) on CPUs
+// that have it. The others (vector_mean, vector_stddev, ...) call those.
+const bool g_use_avx2 = cpu::detect_simd_level() == cpu::SimdLevel::AVX2 ||
+                        cpu::detect_simd_level() == cpu::SimdLevel::AVX512;
 #endif
+
+} // namespace
+
+const char* get_simd_backend() {
+    return g_simd_backend;
 }
 
 // ============================================================================
@@ -23,6 +30,12 @@ const char* get_simd_backend() {
 
 void vector_add(const double* a, const double* b, double* result, size_t size) {
     if (!a || !b || !result || size == 0) return;
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) {
+        vector_add_avx2(a, b, result, size);
+        return;
+    }
+#endif
     size_t i = 0;
 
 #ifdef FINMATH_USE_AVX
@@ -63,6 +76,12 @@ void vector_add(const double* a, const double* b, double* result, size_t size) {
 
 void vector_sub(const double* a, const double* b, double* result, size_t size) {
     if (!a || !b || !result || size == 0) return;
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) {
+        vector_sub_avx2(a, b, result, size);
+        return;
+    }
+#endif
     size_t i = 0;
 
 #ifdef FINMATH_USE_AVX
@@ -99,6 +118,12 @@ void vector_sub(const double* a, const double* b, double* result, size_t size) {
 
 void vector_mul(const double* a, const double* b, double* result, size_t size) {
     if (!a || !b || !result || size == 0) return;
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) {
+        vector_mul_avx2(a, b, result, size);
+        return;
+    }
+#endif
     size_t i = 0;
 
 #ifdef FINMATH_USE_AVX
@@ -135,6 +160,9 @@ void vector_mul(const double* a, const double* b, double* result, size_t size) {
 
 double dot_product(const double* a, const double* b, size_t size) {
     if (!a || !b || size == 0) return 0.0;
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) return dot_product_avx2(a, b, size);
+#endif
     double sum = 0.0;
     size_t i = 0;
 
@@ -188,6 +216,9 @@ double dot_product(const double* a, const double* b, size_t size) {
 
 double vector_sum(const double* a, size_t size) {
     if (!a || size == 0) return 0.0;
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) return vector_sum_avx2(a, size);
+#endif
     double sum = 0.0;
     size_t i = 0;
 
@@ -242,6 +273,9 @@ double vector_variance(const double* a, size_t size) {
     if (size == 0) return 0.0;
     
     double mean = vector_mean(a, size);
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) return vector_sum_sq_dev_avx2(a, size, mean) / static_cast<double>(size);
+#endif
     double sum_sq = 0.0;
     size_t i = 0;
 
@@ -309,6 +343,12 @@ double vector_stddev(const double* a, size_t size) {
 
 void vector_mul_scalar(const double* a, double scalar, double* result, size_t size) {
     if (!a || !result || size == 0) return;
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) {
+        vector_mul_scalar_avx2(a, scalar, result, size);
+        return;
+    }
+#endif
     size_t i = 0;
 
 #ifdef FINMATH_USE_AVX
@@ -345,6 +385,12 @@ void vector_mul_scalar(const double* a, double scalar, double* result, size_t si
 
 void vector_add_scalar(const double* a, double scalar, double* result, size_t size) {
     if (!a || !result || size == 0) return;
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) {
+        vector_add_scalar_avx2(a, scalar, result, size);
+        return;
+    }
+#endif
     size_t i = 0;
 
 #ifdef FINMATH_USE_AVX
@@ -381,6 +427,12 @@ void vector_add_scalar(const double* a, double scalar, double* result, size_t si
 
 void vector_div(const double* a, const double* b, double* result, size_t size) {
     if (!a || !b || !result || size == 0) return;
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) {
+        vector_div_avx2(a, b, result, size);
+        return;
+    }
+#endif
     size_t i = 0;
 
 #ifdef FINMATH_USE_AVX
@@ -417,6 +469,9 @@ void vector_div(const double* a, const double* b, double* result, size_t size) {
 
 double vector_max(const double* a, size_t size) {
     if (size == 0) return 0.0;
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) return vector_max_avx2(a, size);
+#endif
     
     double max_val = a[0];
     size_t i = 1;
@@ -463,6 +518,9 @@ double vector_max(const double* a, size_t size) {
 
 double vector_min(const double* a, size_t size) {
     if (size == 0) return 0.0;
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) return vector_min_avx2(a, size);
+#endif
     
     double min_val = a[0];
     size_t i = 1;
@@ -509,6 +567,9 @@ double vector_min(const double* a, size_t size) {
 
 double vector_conditional_sum(const double* a, size_t size, bool positive) {
     if (!a || size == 0) return 0.0;
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) return vector_conditional_sum_avx2(a, size, positive);
+#endif
     double sum = 0.0;
     size_t i = 0;
 
@@ -586,6 +647,52 @@ double vector_conditional_sum(const double* a, size_t size, bool positive) {
     return sum;
 }
 
+// ============================================================================
+// Gains/Losses Split: gains[i] = max(d, 0), losses[i] = max(-d, 0),
+// with d = prices[i+1] - prices[i]
+// ============================================================================
+
+void vector_gains_losses(const double* prices, size_t size, double* gains, double* losses) {
+    if (!prices || !gains || !losses || size < 2) return;
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+    if (g_use_avx2) {
+        vector_gains_losses_avx2(prices, size, gains, losses);
+        return;
+    }
+#endif
+    const size_t n = size - 1;
+    size_t i = 0;
+
+#ifdef FINMATH_USE_AVX
+    __m256d vzero = _mm256_setzero_pd();
+    for (; i + 4 <= n; i += 4) {
+        __m256d vdiff = _mm256_sub_pd(_mm256_loadu_pd(&prices[i + 1]), _mm256_loadu_pd(&prices[i]));
+        _mm256_storeu_pd(&gains[i], _mm256_max_pd(vdiff, vzero));
+        _mm256_storeu_pd(&losses[i], _mm256_max_pd(_mm256_sub_pd(vzero, vdiff), vzero));
+    }
+#elif defined(FINMATH_USE_SSE)
+    __m128d vzero = _mm_setzero_pd();
+    for (; i + 2 <= n; i += 2) {
+        __m128d vdiff = _mm_sub_pd(_mm_loadu_pd(&prices[i + 1]), _mm_loadu_pd(&prices[i]));
+        _mm_storeu_pd(&gains[i], _mm_max_pd(vdiff, vzero));
+        _mm_storeu_pd(&losses[i], _mm_max_pd(_mm_sub_pd(vzero, vdiff), vzero));
+    }
+#elif defined(FINMATH_USE_NEON)
+    float64x2_t vzero = vdupq_n_f64(0.0);
+    for (; i + 2 <= n; i += 2) {
+        float64x2_t vdiff = vsubq_f64(vld1q_f64(&prices[i + 1]), vld1q_f64(&prices[i]));
+        vst1q_f64(&gains[i], vmaxq_f64(vdiff, vzero));
+        vst1q_f64(&losses[i], vmaxq_f64(vnegq_f64(vdiff), vzero));
+    }
+#endif
+
+    for (; i < n; ++i) {
+        double diff = prices[i + 1] - prices[i];
+        gains[i] = diff > 0 ? diff : 0.0;
+        losses[i] = diff < 0 ? -diff : 0.0;
+    }
+}
+
 // ============================================================================
 // Cache-Blocked Vector Sum: Processes data in cache-friendly chunks
 // ============================================================================
@@ -637,6 +744,14 @@ double vector_variance_blocked(const double* a, size_t size, size_t chunk_size)
         size_t current_chunk = std::min(chunk_size, size - processed);
         const double* chunk_data = a + processed;
         
+#if defined(FINMATH_USE_SSE) && !defined(FINMATH_USE_AVX)
+        if (g_use_avx2) {
+            total_sum_sq += vector_sum_sq_dev_avx2(chunk_data, current_chunk, mean);
+            processed += current_chunk;
+            continue;
+        }
+#endif
+
         // Compute sum of squares for this chunk using SIMD
         double chunk_sum_sq = 0.0;
         size_t i = 0;
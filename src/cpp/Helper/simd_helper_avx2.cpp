@@ -0,0 +1,222 @@
+// AVX2 builds of the simd_helper functions. Built with -mavx2 -mfma (see
+// CMakeLists.txt); only reached from the public functions in simd_helper.cpp
+// when the baseline build has no AVX and the CPU reports AVX2. Argument checks
+// are done by the callers.
+#include "finmath/Helper/simd_helper.h"
+
+#if defined(FINMATH_USE_SSE)
+#include <immintrin.h>
+#include <algorithm>
+
+namespace finmath {
+namespace simd {
+
+namespace {
+
+inline double hsum(__m256d v)
+{
+    double temp[4];
+    _mm256_storeu_pd(temp, v);
+    return temp[0] + temp[1] + temp[2] + temp[3];
+}
+
+} // namespace
+
+void vector_add_avx2(const double* a, const double* b, double* result, size_t size)
+{
+    size_t i = 0;
+    for (; i + 4 <= size; i += 4) {
+        _mm256_storeu_pd(&result[i], _mm256_add_pd(_mm256_loadu_pd(&a[i]), _mm256_loadu_pd(&b[i])));
+    }
+    for (; i < size; ++i) {
+        result[i] = a[i] + b[i];
+    }
+}
+
+void vector_sub_avx2(const double* a, const double* b, double* result, size_t size)
+{
+    size_t i = 0;
+    for (; i + 4 <= size; i += 4) {
+        _mm256_storeu_pd(&result[i], _mm256_sub_pd(_mm256_loadu_pd(&a[i]), _mm256_loadu_pd(&b[i])));
+    }
+    for (; i < size; ++i) {
+        result[i] = a[i] - b[i];
+    }
+}
+
+void vector_mul_avx2(const double* a, const double* b, double* result, size_t size)
+{
+    size_t i = 0;
+    for (; i + 4 <= size; i += 4) {
+        _mm256_storeu_pd(&result[i], _mm256_mul_pd(_mm256_loadu_pd(&a[i]), _mm256_loadu_pd(&b[i])));
+    }
+    for (; i < size; ++i) {
+        result[i] = a[i] * b[i];
+    }
+}
+
+void vector_div_avx2(const double* a, const double* b, double* result, size_t size)
+{
+    size_t i = 0;
+    for (; i + 4 <= size; i += 4) {
+        _mm256_storeu_pd(&result[i], _mm256_div_pd(_mm256_loadu_pd(&a[i]), _mm256_loadu_pd(&b[i])));
+    }
+    for (; i < size; ++i) {
+        result[i] = a[i] / b[i];
+    }
+}
+
+void vector_mul_scalar_avx2(const double* a, double scalar, double* result, size_t size)
+{
+    const __m256d vscalar = _mm256_set1_pd(scalar);
+    size_t i = 0;
+    for (; i + 4 <= size; i += 4) {
+        _mm256_storeu_pd(&result[i], _mm256_mul_pd(_mm256_loadu_pd(&a[i]), vscalar));
+    }
+    for (; i < size; ++i) {
+        result[i] = a[i] * scalar;
+    }
+}
+
+void vector_add_scalar_avx2(const double* a, double scalar, double* result, size_t size)
+{
+    const __m256d vscalar = _mm256_set1_pd(scalar);
+    size_t i = 0;
+    for (; i + 4 <= size; i += 4) {
+        _mm256_storeu_pd(&result[i], _mm256_add_pd(_mm256_loadu_pd(&a[i]), vscalar));
+    }
+    for (; i < size; ++i) {
+        result[i] = a[i] + scalar;
+    }
+}
+
+double dot_product_avx2(const double* a, const double* b, size_t size)
+{
+    __m256d vsum = _mm256_setzero_pd();
+    size_t i = 0;
+    for (; i + 4 <= size; i += 4) {
+        vsum = _mm256_add_pd(vsum, _mm256_mul_pd(_mm256_loadu_pd(&a[i]), _mm256_loadu_pd(&b[i])));
+    }
+    double sum = hsum(vsum);
+    for (; i < size; ++i) {
+        sum += a[i] * b[i];
+    }
+    return sum;
+}
+
+double vector_sum_avx2(const double* a, size_t size)
+{
+    __m256d vsum = _mm256_setzero_pd();
+    size_t i = 0;
+    for (; i + 4 <= size; i += 4) {
+        vsum = _mm256_add_pd(vsum, _mm256_loadu_pd(&a[i]));
+    }
+    double sum = hsum(vsum);
+    for (; i < size; ++i) {
+        sum += a[i];
+    }
+    return sum;
+}
+
+double vector_sum_sq_dev_avx2(const double* a, size_t size, double mean)
+{
+    const __m256d vmean = _mm256_set1_pd(mean);
+    __m256d vsum_sq = _mm256_setzero_pd();
+    size_t i = 0;
+    for (; i + 4 <= size; i += 4) {
+        __m256d vdiff = _mm256_sub_pd(_mm256_loadu_pd(&a[i]), vmean);
+        vsum_sq = _mm256_add_pd(vsum_sq, _mm256_mul_pd(vdiff, vdiff));
+    }
+    double sum_sq = hsum(vsum_sq);
+    for (; i < size; ++i) {
+        double diff = a[i] - mean;
+        sum_sq += diff * diff;
+    }
+    return sum_sq;
+}
+
+double vector_max_avx2(const double* a, size_t size)
+{
+    double max_val = a[0];
+    size_t i = 1;
+    __m256d vmax = _mm256_set1_pd(max_val);
+    for (; i + 4 <= size; i += 4) {
+        vmax = _mm256_max_pd(vmax, _mm256_loadu_pd(&a[i]));
+    }
+    double temp[4];
+    _mm256_storeu_pd(temp, vmax);
+    max_val = std::max({temp[0], temp[1], temp[2], temp[3]});
+    for (; i < size; ++i) {
+        if (a[i] > max_val) {
+            max_val = a[i];
+        }
+    }
+    return max_val;
+}
+
+double vector_min_avx2(const double* a, size_t size)
+{
+    double min_val = a[0];
+    size_t i = 1;
+    __m256d vmin = _mm256_set1_pd(min_val);
+    for (; i + 4 <= size; i += 4) {
+        vmin = _mm256_min_pd(vmin, _mm256_loadu_pd(&a[i]));
+    }
+    double temp[4];
+    _mm256_storeu_pd(temp, vmin);
+    min_val = std::min({temp[0], temp[1], temp[2], temp[3]});
+    for (; i < size; ++i) {
+        if (a[i] < min_val) {
+            min_val = a[i];
+        }
+    }
+    return min_val;
+}
+
+double vector_conditional_sum_avx2(const double* a, size_t size, bool positive)
+{
+    const __m256d vzero = _mm256_setzero_pd();
+    __m256d vsum = _mm256_setzero_pd();
+    size_t i = 0;
+    for (; i + 4 <= size; i += 4) {
+        __m256d va = _mm256_loadu_pd(&a[i]);
+        // positive: max(0, a[i]); otherwise the absolute value of the negatives, max(0, -a[i])
+        vsum = _mm256_add_pd(vsum, _mm256_max_pd(vzero, positive ? va : _mm256_sub_pd(vzero, va)));
+    }
+    double sum = hsum(vsum);
+    for (; i < size; ++i) {
+        if (positive) {
+            if (a[i] > 0) {
+                sum += a[i];
+            }
+        } else {
+            if (a[i] < 0) {
+                sum += (-a[i]);
+            }
+        }
+    }
+    return sum;
+}
+
+void vector_gains_losses_avx2(const double* prices, size_t size, double* gains, double* losses)
+{
+    const size_t n = size - 1;
+    const __m256d vzero = _mm256_setzero_pd();
+    size_t i = 0;
+    for (; i + 4 <= n; i += 4) {
+        __m256d vdiff = _mm256_sub_pd(_mm256_loadu_pd(&prices[i + 1]), _mm256_loadu_pd(&prices[i]));
+        _mm256_storeu_pd(&gains[i], _mm256_max_pd(vdiff, vzero));
+        _mm256_storeu_pd(&losses[i], _mm256_max_pd(_mm256_sub_pd(vzero, vdiff), vzero));
+    }
+
+    for (; i < n; ++i) {
+        double diff = prices[i + 1] - prices[i];
+        gains[i] = diff > 0 ? diff : 0.0;
+        losses[i] = diff < 0 ? -diff : 0.0;
+    }
+}
+
+} // namespace simd
+} // namespace finmath
+
+#endif // FINMATH_USE_SSE
@@ -1,4 +1,12 @@
 #include "finmath/TimeSeries/ema.h"
+#include "finmath/TimeSeries/ema_kernels.h"
+#include <pybind11/numpy.h>    // Include numpy header
+#include <pybind11/pybind11.h> // Include core pybind11 header for exceptions
+#include <pybind11/stl.h>      // sequence <-> std::vector conversion
+
+#include <stdexcept>
+
+namespace py = pybind11;
 
 std::vector<double> compute_ema(const std::vector<double>& prices, size_t window)
 {
@@ -13,11 +21,117 @@ std::vector<double> compute_ema(const std::vector<double>& prices, size_t window
 std::vector<double> compute_ema_with_smoothing(const std::vector<double>& prices, double smoothing_factor)
 {
     std::vector<double> ema(prices.size(), 0.0);
-    ema[0] = prices[0]; // Initialize the first EMA value
+    if (!prices.empty()) {
+        compute_ema_with_smoothing(prices.data(), prices.size(), smoothing_factor, ema.data());
+    }
+    return ema;
+}
+
+void compute_ema_with_smoothing(const double* prices, size_t num_prices, double smoothing_factor, double* ema)
+{
+    finmath::timeseries::ema_fn()(prices, num_prices, smoothing_factor, ema);
+}
+
+namespace finmath {
+namespace timeseries {
+
+void ema_scalar(const double* prices, size_t num_prices, double alpha, double* out)
+{
+    out[0] = prices[0]; // Initialize the first EMA value
 
-    for (size_t i = 1; i < prices.size(); ++i) {
-        ema[i] = ((prices[i] - ema[i - 1]) * smoothing_factor) + ema[i - 1];
+    for (size_t i = 1; i < num_prices; ++i) {
+        out[i] = ((prices[i] - out[i - 1]) * alpha) + out[i - 1];
     }
+}
+
+namespace {
+
+EmaFn resolve_ema_fn()
+{
+    switch (cpu::detect_simd_level()) {
+#if defined(FINMATH_ARCH_X86)
+        case cpu::SimdLevel::AVX512: return ema_avx512;
+        case cpu::SimdLevel::AVX2:   return ema_avx2;
+#endif
+        default:                     return ema_scalar;
+    }
+}
+
+const EmaFn g_ema_fn = resolve_ema_fn();
+
+} // namespace
+
+EmaFn ema_fn()
+{
+    return g_ema_fn;
+}
 
+} // namespace timeseries
+} // namespace finmath
+
+// Implementation for the NumPy array version (smoothing factor)
+py::array_t<double> compute_ema_with_smoothing_np(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr, double smoothing_factor)
+{
+    py::buffer_info buf_info = prices_arr.request();
+
+    if (buf_info.ndim != 1)
+    {
+        throw std::runtime_error("Input array must be 1-dimensional.");
+    }
+
+    size_t num_prices = static_cast<size_t>(buf_info.shape[0]);
+    py::array_t<double> ema(num_prices);
+    if (num_prices == 0)
+    {
+        return ema;
+    }
+
+    // Read the input buffer in place and write straight into the returned array
+    const double *prices_ptr = static_cast<const double *>(buf_info.ptr);
+    double *ema_ptr = ema.mutable_data();
+    {
+        // Pure C++ on raw pointers: no Python objects are touched until the GIL is back
+        py::gil_scoped_release release;
+        compute_ema_with_smoothing(prices_ptr, num_prices, smoothing_factor, ema_ptr);
+    }
     return ema;
 }
+
+// Single Python entry point (smoothing factor). NumPy arrays, in any layout, go to the
+// buffer path and return an array. Other sequences (lists, tuples, Pandas Series) keep
+// the list result of the sequence API; a Series is still read through its .values buffer
+py::object compute_ema_with_smoothing_obj(py::object prices, double smoothing_factor)
+{
+    if (py::isinstance<py::array>(prices))
+    {
+        return compute_ema_with_smoothing_np(prices.cast<py::array_t<double, py::array::c_style | py::array::forcecast>>(), smoothing_factor);
+    }
+    if (py::hasattr(prices, "values"))
+    {
+        py::object values = prices.attr("values");
+        return compute_ema_with_smoothing_np(values.cast<py::array_t<double, py::array::c_style | py::array::forcecast>>(), smoothing_factor)
+            .attr("tolist")();
+    }
+    std::vector<double> values;
+    try
+    {
+        values = prices.cast<std::vector<double>>();
+    }
+    catch (const py::cast_error &)
+    {
+        throw py::type_error("prices must be a list, NumPy array or Pandas Series of numbers");
+    }
+    return py::cast(compute_ema_with_smoothing(values, smoothing_factor));
+}
+
+// Single Python entry point (window); same input/output mapping as above
+py::object compute_ema_obj(py::object prices, size_t window)
+{
+    if (window == 0)
+    {
+        throw std::runtime_error("EMA window cannot be zero.");
+    }
+
+    double multiplier = 2.0 / (window + 1);
+    return compute_ema_with_smoothing_obj(prices, multiplier);
+}
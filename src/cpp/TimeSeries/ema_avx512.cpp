@@ -0,0 +1,67 @@
+// AVX-512 EMA kernel. Built with -mavx512f -mavx512dq (see CMakeLists.txt);
+// only reached through ema_fn() when the CPU reports AVX-512F and AVX-512DQ.
+#include "finmath/TimeSeries/ema_kernels.h"
+
+#if defined(FINMATH_ARCH_X86)
+#include <immintrin.h>
+
+namespace finmath {
+namespace timeseries {
+
+void ema_avx512(const double* prices, size_t num_prices, double alpha, double* out)
+{
+    constexpr size_t B = 8;
+    const double beta = 1.0 - alpha;
+
+    // beta_pow[k] = (1 - alpha)^k
+    double beta_pow[B + 1];
+    beta_pow[0] = 1.0;
+    for (size_t k = 1; k <= B; ++k) {
+        beta_pow[k] = beta_pow[k - 1] * beta;
+    }
+
+    // Column j of the block operator: lane k holds alpha * beta^(k-j) for k >= j, else 0
+    __m512d col[B];
+    for (size_t j = 0; j < B; ++j) {
+        double lanes[B];
+        for (size_t k = 0; k < B; ++k) {
+            lanes[k] = k >= j ? alpha * beta_pow[k - j] : 0.0;
+        }
+        col[j] = _mm512_loadu_pd(lanes);
+    }
+    // Weight of the carried-in value for each lane: beta^(k+1)
+    const __m512d carry = _mm512_loadu_pd(beta_pow + 1);
+    const __m512d carry_last = _mm512_set1_pd(beta_pow[B]);
+    const __m512i last_lane = _mm512_set1_epi64(B - 1);
+
+    out[0] = prices[0];
+    __m512d y_prev = _mm512_set1_pd(out[0]);
+    size_t i = 1;
+    for (; i + B <= num_prices; i += B) {
+        // Two partial sums so the eight FMAs form two chains of four
+        __m512d acc0 = _mm512_mul_pd(_mm512_set1_pd(prices[i]), col[0]);
+        __m512d acc1 = _mm512_mul_pd(_mm512_set1_pd(prices[i + 1]), col[1]);
+        acc0 = _mm512_fmadd_pd(_mm512_set1_pd(prices[i + 2]), col[2], acc0);
+        acc1 = _mm512_fmadd_pd(_mm512_set1_pd(prices[i + 3]), col[3], acc1);
+        acc0 = _mm512_fmadd_pd(_mm512_set1_pd(prices[i + 4]), col[4], acc0);
+        acc1 = _mm512_fmadd_pd(_mm512_set1_pd(prices[i + 5]), col[5], acc1);
+        acc0 = _mm512_fmadd_pd(_mm512_set1_pd(prices[i + 6]), col[6], acc0);
+        acc1 = _mm512_fmadd_pd(_mm512_set1_pd(prices[i + 7]), col[7], acc1);
+        const __m512d acc = _mm512_add_pd(acc0, acc1);
+        _mm512_storeu_pd(out + i, _mm512_fmadd_pd(y_prev, carry, acc));
+        // Next block's carry, already broadcast: beta^B * y_prev + acc[B-1]. The shuffle
+        // works on acc, off the carried chain, so each block waits on one FMA only.
+        y_prev = _mm512_fmadd_pd(y_prev, carry_last, _mm512_permutexvar_pd(last_lane, acc));
+    }
+
+    double prev = out[i - 1];
+    for (; i < num_prices; ++i) {
+        prev = alpha * prices[i] + beta * prev;
+        out[i] = prev;
+    }
+}
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // FINMATH_ARCH_X86
@@ -1,9 +1,10 @@
 #include "finmath/TimeSeries/ema_simd.h"
+#include "finmath/TimeSeries/ema_kernels.h"
 #include <cmath>
 #include <stdexcept>
 #include <vector>
 
-std::vector<double> compute_ema_simd(py::array_t<double> prices_arr, size_t window)
+py::array_t<double> compute_ema_simd(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr, size_t window)
 {
     if (window == 0) {
         throw std::runtime_error("EMA window cannot be zero.");
@@ -13,14 +14,14 @@ std::vector<double> compute_ema_simd(py::array_t<double> prices_arr, size_t wind
     return compute_ema_with_smoothing_simd(prices_arr, multiplier);
 }
 
-std::vector<double> compute_ema_with_smoothing_simd(py::array_t<double> prices_arr, double smoothing_factor)
+py::array_t<double> compute_ema_with_smoothing_simd(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr, double smoothing_factor)
 {
     // Get buffer info for zero-copy access
     py::buffer_info buf_info = prices_arr.request();
 
     // Validate input
     if (buf_info.ndim != 1) {
-        throw std::runtime_error("Input must be a 1-dimensional array");
+        throw std::runtime_error("Input array must be 1-dimensional.");
     }
 
     size_t num_prices = static_cast<size_t>(buf_info.shape[0]);
@@ -30,7 +31,7 @@ std::vector<double> compute_ema_with_smoothing_simd(py::array_t<double> prices_a
     }
     
     if (num_prices == 0) {
-        return {};
+        return py::array_t<double>(0);
     }
 
     // Zero-copy access to NumPy data
@@ -40,24 +41,11 @@ std::vector<double> compute_ema_with_smoothing_simd(py::array_t<double> prices_a
         throw std::runtime_error("Invalid buffer pointer from NumPy array");
     }
 
-    // EMA calculation: ema[i] = (prices[i] - ema[i-1]) * smoothing_factor + ema[i-1]
-    // This can be rewritten as: ema[i] = prices[i] * smoothing_factor + ema[i-1] * (1 - smoothing_factor)
-    std::vector<double> ema(num_prices, 0.0);
-    ema[0] = prices_ptr[0]; // Initialize the first EMA value
-
-    // Pre-compute (1 - smoothing_factor) for efficiency
-    double one_minus_smoothing = 1.0 - smoothing_factor;
-
-    // Sequential calculation (EMA is inherently sequential, but we can optimize the arithmetic)
-    for (size_t i = 1; i < num_prices; ++i) {
-        // ema[i] = prices[i] * smoothing_factor + ema[i-1] * (1 - smoothing_factor)
-        ema[i] = prices_ptr[i] * smoothing_factor + ema[i - 1] * one_minus_smoothing;
-    }
-
-    // Note: EMA is inherently sequential (each value depends on the previous),
-    // so we can't fully parallelize it. However, we could use SIMD for batch processing
-    // if we process multiple time series in parallel. For now, we keep it sequential
-    // but use optimized arithmetic operations.
+    // ema[i] = prices[i] * smoothing_factor + ema[i-1] * (1 - smoothing_factor).
+    // The recurrence is evaluated as a blocked parallel scan (one triangular
+    // block product per 4/8 outputs plus a carried FMA) on AVX2/AVX-512 CPUs.
+    py::array_t<double> ema(num_prices);
+    finmath::timeseries::ema_fn()(prices_ptr, num_prices, smoothing_factor, ema.mutable_data());
 
     return ema;
 }
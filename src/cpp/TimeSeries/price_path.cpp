@@ -0,0 +1,32 @@
+#include "finmath/TimeSeries/price_path.h"
+#include <cmath>
+#include <random>
+#include <stdexcept>
+
+py::array_t<double> make_price_path(size_t n, double drift, double vol, uint64_t seed, double s0)
+{
+    if (vol < 0) {
+        throw std::runtime_error("Volatility must be non-negative.");
+    }
+    if (s0 <= 0) {
+        throw std::runtime_error("Starting price must be positive.");
+    }
+
+    py::array_t<double> prices(n);
+    double* out = prices.mutable_data();
+    {
+        py::gil_scoped_release release;
+
+        std::mt19937_64 rng(seed);
+        std::normal_distribution<double> step(drift, vol);
+
+        // Running log price: each step is drawn, accumulated and exponentiated
+        // in place, so the path is written exactly once
+        double log_price = 0.0;
+        for (size_t i = 0; i < n; ++i) {
+            log_price += step(rng);
+            out[i] = s0 * std::exp(log_price);
+        }
+    }
+    return prices;
+}
@@ -0,0 +1,139 @@
+#include "finmath/TimeSeries/rolling_statistics.h"
+#include "finmath/TimeSeries/rolling_statistics_kernels.h"
+#include <algorithm>
+#include <stdexcept>
+
+namespace finmath {
+namespace timeseries {
+
+RollingStatsState rolling_stats_seed(const double* prices, size_t window_size,
+                                     double* sma, double* var, double* ema)
+{
+    // alpha = 2 / (window + 1), as compute_ema()
+    const double alpha = 2.0 / (static_cast<double>(window_size) + 1.0);
+    const double beta = 1.0 - alpha;
+
+    RollingStatsState st{prices[0], 0.0, 0.0, prices[0]};
+    ema[0] = st.ema;
+    for (size_t i = 1; i < window_size; ++i) {
+        st.sum += prices[i];
+        st.ema = alpha * prices[i] + beta * st.ema;
+        ema[i] = st.ema;
+    }
+    st.mean = st.sum * (1.0 / static_cast<double>(window_size));
+    for (size_t i = 0; i < window_size; ++i) {
+        const double diff = prices[i] - st.mean;
+        st.m2 += diff * diff;
+    }
+    sma[0] = st.mean;
+    var[0] = st.m2 * (1.0 / static_cast<double>(window_size - 1));
+    return st;
+}
+
+void rolling_stats_slide(const double* prices, size_t first, size_t num_prices, size_t window_size,
+                         RollingStatsState st, double* sma, double* var, double* ema)
+{
+    const double alpha = 2.0 / (static_cast<double>(window_size) + 1.0);
+    const double beta = 1.0 - alpha;
+    const double inv_n = 1.0 / static_cast<double>(window_size);
+    const double inv_n1 = 1.0 / static_cast<double>(window_size - 1);
+
+    for (size_t i = first; i < num_prices; ++i) {
+        const size_t w = i - window_size + 1;
+        const double x_in = prices[i];
+        const double x_out = prices[i - window_size];
+
+        st.ema = alpha * x_in + beta * st.ema;
+        ema[i] = st.ema;
+
+        st.sum += x_in - x_out;
+        const double old_mean = st.mean;
+        st.mean = st.sum * inv_n;
+        sma[w] = st.mean;
+
+        st.m2 += (x_in - x_out) * (x_in + x_out - st.mean - old_mean);
+        // Rounding can push M2 a hair below zero on flat stretches
+        var[w] = std::max(st.m2, 0.0) * inv_n1;
+    }
+}
+
+void rolling_stats_scalar(const double* prices, size_t num_prices, size_t window_size,
+                          double* sma, double* var, double* ema)
+{
+    const RollingStatsState st = rolling_stats_seed(prices, window_size, sma, var, ema);
+    rolling_stats_slide(prices, window_size, num_prices, window_size, st, sma, var, ema);
+}
+
+namespace {
+
+RollingStatsFn resolve_rolling_stats_fn()
+{
+    switch (cpu::detect_simd_level()) {
+#if defined(FINMATH_ARCH_X86)
+        case cpu::SimdLevel::AVX512: return rolling_stats_avx512;
+        case cpu::SimdLevel::AVX2:   return rolling_stats_avx2;
+#endif
+        default:                     return rolling_stats_scalar;
+    }
+}
+
+const RollingStatsFn g_rolling_stats_fn = resolve_rolling_stats_fn();
+
+} // namespace
+
+RollingStatsFn rolling_stats_fn()
+{
+    return g_rolling_stats_fn;
+}
+
+} // namespace timeseries
+} // namespace finmath
+
+void fused_stats(const double* prices, size_t num_prices, size_t window_size,
+                 double* sma, double* var, double* ema)
+{
+    finmath::timeseries::rolling_stats_fn()(prices, num_prices, window_size, sma, var, ema);
+}
+
+py::dict rolling_statistics_np(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr,
+                               size_t window_size)
+{
+    if (prices_arr.ndim() != 1) {
+        throw std::runtime_error("Input array must be 1-dimensional.");
+    }
+    if (window_size < 2) {
+        throw std::runtime_error("Window size must be at least 2");
+    }
+
+    size_t num_prices = static_cast<size_t>(prices_arr.shape(0));
+    if (num_prices < window_size) {
+        throw std::runtime_error("Window size must not exceed the number of prices.");
+    }
+
+    const size_t num_windows = num_prices - window_size + 1;
+    py::array_t<double> sma(num_windows);
+    py::array_t<double> var(num_windows);
+    py::array_t<double> ema(num_prices);
+
+    const double* prices_ptr = prices_arr.data();
+    double* sma_ptr = sma.mutable_data();
+    double* var_ptr = var.mutable_data();
+    double* ema_ptr = ema.mutable_data();
+    {
+        py::gil_scoped_release release;
+        fused_stats(prices_ptr, num_prices, window_size, sma_ptr, var_ptr, ema_ptr);
+    }
+
+    py::dict result;
+    result["sma"] = sma;
+    result["var"] = var;
+    result["ema"] = ema;
+    return result;
+}
+
+// Forwarding wrapper: the "var" entry of rolling_statistics_np()
+py::array_t<double> rolling_variance_np(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr,
+                                        size_t window_size)
+{
+    return rolling_statistics_np(prices_arr, window_size)["var"].cast<py::array_t<double>>();
+}
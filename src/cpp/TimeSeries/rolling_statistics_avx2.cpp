@@ -0,0 +1,101 @@
+// AVX2 + FMA fused rolling-statistics kernel. Built with -mavx2 -mfma (see
+// CMakeLists.txt); only reached through rolling_stats_fn() when the CPU reports AVX2.
+#include "finmath/TimeSeries/rolling_statistics_kernels.h"
+
+#if defined(FINMATH_ARCH_X86)
+#include <immintrin.h>
+
+namespace finmath {
+namespace timeseries {
+
+namespace {
+
+// Inclusive prefix sum across the 4 lanes: shift by one lane, then by two
+inline __m256d prefix_sum(__m256d v)
+{
+    const __m256d zero = _mm256_setzero_pd();
+    v = _mm256_add_pd(v, _mm256_blend_pd(zero, _mm256_permute4x64_pd(v, 0x90), 0xE));
+    return _mm256_add_pd(v, _mm256_blend_pd(zero, _mm256_permute4x64_pd(v, 0x40), 0xC));
+}
+
+} // namespace
+
+void rolling_stats_avx2(const double* prices, size_t num_prices, size_t window_size,
+                        double* sma, double* var, double* ema)
+{
+    constexpr size_t B = 4;
+    const double alpha = 2.0 / (static_cast<double>(window_size) + 1.0);
+    const double beta = 1.0 - alpha;
+    const __m256d inv_n = _mm256_set1_pd(1.0 / static_cast<double>(window_size));
+    const __m256d inv_n1 = _mm256_set1_pd(1.0 / static_cast<double>(window_size - 1));
+    const __m256d zero = _mm256_setzero_pd();
+    const __m256d two = _mm256_set1_pd(2.0);
+
+    // EMA block operator, as in ema_avx2(): column j holds alpha * beta^(k-j) in lanes k >= j
+    double beta_pow[B + 1];
+    beta_pow[0] = 1.0;
+    for (size_t k = 1; k <= B; ++k) {
+        beta_pow[k] = beta_pow[k - 1] * beta;
+    }
+    __m256d col[B];
+    for (size_t j = 0; j < B; ++j) {
+        double lanes[B];
+        for (size_t k = 0; k < B; ++k) {
+            lanes[k] = k >= j ? alpha * beta_pow[k - j] : 0.0;
+        }
+        col[j] = _mm256_loadu_pd(lanes);
+    }
+    const __m256d ema_carry = _mm256_loadu_pd(beta_pow + 1);
+    const __m256d ema_carry_last = _mm256_set1_pd(beta_pow[B]);
+
+    RollingStatsState st = rolling_stats_seed(prices, window_size, sma, var, ema);
+
+    // Carried values, kept broadcast so no block waits on a shuffle of the previous one
+    __m256d sum = _mm256_set1_pd(st.sum);
+    __m256d m2 = _mm256_set1_pd(st.m2);
+    __m256d y_prev = _mm256_set1_pd(st.ema);
+
+    // i indexes the entering price; window outputs go to sma/var[i - window_size + 1 ..]
+    size_t i = window_size;
+    for (; i + B <= num_prices; i += B) {
+        const size_t w = i - window_size + 1;
+        const __m256d x_in = _mm256_loadu_pd(prices + i);
+        const __m256d x_out = _mm256_loadu_pd(prices + i - window_size);
+
+        // EMA: triangular block product of the entering prices plus the carried output
+        __m256d acc = _mm256_mul_pd(_mm256_set1_pd(prices[i]), col[0]);
+        acc = _mm256_fmadd_pd(_mm256_set1_pd(prices[i + 1]), col[1], acc);
+        acc = _mm256_fmadd_pd(_mm256_set1_pd(prices[i + 2]), col[2], acc);
+        acc = _mm256_fmadd_pd(_mm256_set1_pd(prices[i + 3]), col[3], acc);
+        _mm256_storeu_pd(ema + i, _mm256_fmadd_pd(y_prev, ema_carry, acc));
+        y_prev = _mm256_fmadd_pd(y_prev, ema_carry_last, _mm256_permute4x64_pd(acc, 0xFF));
+
+        // Window sums: prefix sum of the B independent differences plus the carried sum
+        const __m256d diff = _mm256_sub_pd(x_in, x_out);
+        const __m256d sum_steps = prefix_sum(diff);
+        const __m256d window_sum = _mm256_add_pd(sum, sum_steps);
+        _mm256_storeu_pd(sma + w, _mm256_mul_pd(window_sum, inv_n));
+
+        // M2: lane k also needs the mean before its step, whose window sum is lane k's
+        // minus diff. So mean + mean_before = (2 * window_sum - diff) / n comes from the
+        // same registers without a shuffle. With both means known the M2 steps are
+        // independent and get the same prefix-sum treatment as the window sums.
+        const __m256d mean_pair = _mm256_mul_pd(_mm256_fmsub_pd(window_sum, two, diff), inv_n);
+        const __m256d m2_steps = prefix_sum(_mm256_mul_pd(diff, _mm256_sub_pd(_mm256_add_pd(x_in, x_out), mean_pair)));
+        // Rounding can push M2 a hair below zero on flat stretches
+        _mm256_storeu_pd(var + w, _mm256_mul_pd(_mm256_max_pd(_mm256_add_pd(m2, m2_steps), zero), inv_n1));
+        m2 = _mm256_add_pd(m2, _mm256_permute4x64_pd(m2_steps, 0xFF));
+        sum = _mm256_add_pd(sum, _mm256_permute4x64_pd(sum_steps, 0xFF));
+    }
+
+    st.sum = _mm256_cvtsd_f64(sum);
+    st.mean = st.sum * (1.0 / static_cast<double>(window_size));
+    st.m2 = _mm256_cvtsd_f64(m2);
+    st.ema = ema[i - 1];
+    rolling_stats_slide(prices, i, num_prices, window_size, st, sma, var, ema);
+}
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // FINMATH_ARCH_X86
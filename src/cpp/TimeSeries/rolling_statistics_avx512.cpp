@@ -0,0 +1,103 @@
+// AVX-512 fused rolling-statistics kernel. Built with -mavx512f -mavx512dq (see
+// CMakeLists.txt); only reached through rolling_stats_fn() when the CPU reports AVX-512F.
+#include "finmath/TimeSeries/rolling_statistics_kernels.h"
+
+#if defined(FINMATH_ARCH_X86)
+#include <immintrin.h>
+
+namespace finmath {
+namespace timeseries {
+
+void rolling_stats_avx512(const double* prices, size_t num_prices, size_t window_size,
+                          double* sma, double* var, double* ema)
+{
+    constexpr size_t B = 8;
+    const double alpha = 2.0 / (static_cast<double>(window_size) + 1.0);
+    const double beta = 1.0 - alpha;
+    const __m512d inv_n = _mm512_set1_pd(1.0 / static_cast<double>(window_size));
+    const __m512d inv_n1 = _mm512_set1_pd(1.0 / static_cast<double>(window_size - 1));
+    const __m512d zero = _mm512_setzero_pd();
+    const __m512d two = _mm512_set1_pd(2.0);
+
+    // Lane k takes lane k - s (masked to zero for k < s) for shifts s = 1, 2, 4
+    const __m512i shift1 = _mm512_set_epi64(6, 5, 4, 3, 2, 1, 0, 0);
+    const __m512i shift2 = _mm512_set_epi64(5, 4, 3, 2, 1, 0, 0, 0);
+    const __m512i shift4 = _mm512_set_epi64(3, 2, 1, 0, 0, 0, 0, 0);
+    const __m512i last = _mm512_set1_epi64(B - 1);
+    // Inclusive prefix sum across the 8 lanes in three shift-and-add steps
+    auto prefix_sum = [&](__m512d v) {
+        v = _mm512_add_pd(v, _mm512_maskz_permutexvar_pd(0xFE, shift1, v));
+        v = _mm512_add_pd(v, _mm512_maskz_permutexvar_pd(0xFC, shift2, v));
+        return _mm512_add_pd(v, _mm512_maskz_permutexvar_pd(0xF0, shift4, v));
+    };
+
+    // EMA block operator, as in ema_avx512(): column j holds alpha * beta^(k-j) in lanes k >= j
+    double beta_pow[B + 1];
+    beta_pow[0] = 1.0;
+    for (size_t k = 1; k <= B; ++k) {
+        beta_pow[k] = beta_pow[k - 1] * beta;
+    }
+    __m512d col[B];
+    for (size_t j = 0; j < B; ++j) {
+        double lanes[B];
+        for (size_t k = 0; k < B; ++k) {
+            lanes[k] = k >= j ? alpha * beta_pow[k - j] : 0.0;
+        }
+        col[j] = _mm512_loadu_pd(lanes);
+    }
+    const __m512d ema_carry = _mm512_loadu_pd(beta_pow + 1);
+    const __m512d ema_carry_last = _mm512_set1_pd(beta_pow[B]);
+
+    RollingStatsState st = rolling_stats_seed(prices, window_size, sma, var, ema);
+
+    // Carried values, kept broadcast so no block waits on a shuffle of the previous one
+    __m512d sum = _mm512_set1_pd(st.sum);
+    __m512d m2 = _mm512_set1_pd(st.m2);
+    __m512d y_prev = _mm512_set1_pd(st.ema);
+
+    // i indexes the entering price; window outputs go to sma/var[i - window_size + 1 ..]
+    size_t i = window_size;
+    for (; i + B <= num_prices; i += B) {
+        const size_t w = i - window_size + 1;
+        const __m512d x_in = _mm512_loadu_pd(prices + i);
+        const __m512d x_out = _mm512_loadu_pd(prices + i - window_size);
+
+        // EMA: triangular block product in two chains of four FMAs, plus the carried output
+        __m512d acc0 = _mm512_mul_pd(_mm512_set1_pd(prices[i]), col[0]);
+        __m512d acc1 = _mm512_mul_pd(_mm512_set1_pd(prices[i + 1]), col[1]);
+        acc0 = _mm512_fmadd_pd(_mm512_set1_pd(prices[i + 2]), col[2], acc0);
+        acc1 = _mm512_fmadd_pd(_mm512_set1_pd(prices[i + 3]), col[3], acc1);
+        acc0 = _mm512_fmadd_pd(_mm512_set1_pd(prices[i + 4]), col[4], acc0);
+        acc1 = _mm512_fmadd_pd(_mm512_set1_pd(prices[i + 5]), col[5], acc1);
+        acc0 = _mm512_fmadd_pd(_mm512_set1_pd(prices[i + 6]), col[6], acc0);
+        acc1 = _mm512_fmadd_pd(_mm512_set1_pd(prices[i + 7]), col[7], acc1);
+        const __m512d acc = _mm512_add_pd(acc0, acc1);
+        _mm512_storeu_pd(ema + i, _mm512_fmadd_pd(y_prev, ema_carry, acc));
+        y_prev = _mm512_fmadd_pd(y_prev, ema_carry_last, _mm512_permutexvar_pd(last, acc));
+
+        // Window sums: prefix sum of the B independent differences plus the carried sum
+        const __m512d diff = _mm512_sub_pd(x_in, x_out);
+        const __m512d sum_steps = prefix_sum(diff);
+        const __m512d window_sum = _mm512_add_pd(sum, sum_steps);
+        _mm512_storeu_pd(sma + w, _mm512_mul_pd(window_sum, inv_n));
+
+        // M2: mean + mean_before = (2 * window_sum - diff) / n, as in rolling_stats_avx2()
+        const __m512d mean_pair = _mm512_mul_pd(_mm512_fmsub_pd(window_sum, two, diff), inv_n);
+        const __m512d m2_steps = prefix_sum(_mm512_mul_pd(diff, _mm512_sub_pd(_mm512_add_pd(x_in, x_out), mean_pair)));
+        // Rounding can push M2 a hair below zero on flat stretches
+        _mm512_storeu_pd(var + w, _mm512_mul_pd(_mm512_max_pd(_mm512_add_pd(m2, m2_steps), zero), inv_n1));
+        m2 = _mm512_add_pd(m2, _mm512_permutexvar_pd(last, m2_steps));
+        sum = _mm512_add_pd(sum, _mm512_permutexvar_pd(last, sum_steps));
+    }
+
+    st.sum = _mm512_cvtsd_f64(sum);
+    st.mean = st.sum * (1.0 / static_cast<double>(window_size));
+    st.m2 = _mm512_cvtsd_f64(m2);
+    st.ema = ema[i - 1];
+    rolling_stats_slide(prices, i, num_prices, window_size, st, sma, var, ema);
+}
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // FINMATH_ARCH_X86
@@ -1,21 +1,104 @@
 #include "finmath/TimeSeries/rolling_volatility.h"
+#include "finmath/TimeSeries/rolling_volatility_kernels.h"
 #include "finmath/Helper/simd_helper.h"
 #include <pybind11/numpy.h>    // Include numpy header
 #include <pybind11/pybind11.h> // Include core pybind11 header for exceptions
+#include <pybind11/stl.h>      // list -> std::vector conversion
 
 #include <cmath>
 #include <vector>
 
 namespace py = pybind11;
 
+namespace finmath {
+namespace timeseries {
+
+namespace {
+
+template <typename T>
+bool log_returns_std(const T *prices, size_t num_prices, T *out)
+{
+    if (num_prices == 0)
+        return true;
+    bool all_positive = prices[0] > 0;
+    for (size_t i = 0; i + 1 < num_prices; ++i)
+    {
+#if defined(__aarch64__)
+        // Apple M-series prefetchers are tuned for short strides: request the
+        // price 64 elements ahead once per 8 iterations. Prefetches never fault,
+        // so running past the end is harmless.
+        if ((i & 7) == 0)
+            __builtin_prefetch(prices + i + 64, 0, 0);
+#endif
+        all_positive &= prices[i + 1] > 0;
+        out[i] = std::log(prices[i + 1] / prices[i]);
+    }
+    return all_positive;
+}
+
+} // namespace
+
+bool log_returns_scalar(const double *prices, size_t num_prices, double *out)
+{
+    return log_returns_std(prices, num_prices, out);
+}
+
+bool log_returns_scalar(const float *prices, size_t num_prices, float *out)
+{
+    return log_returns_std(prices, num_prices, out);
+}
+
+namespace {
+
+LogReturnsFn resolve_log_returns_fn()
+{
+    switch (cpu::detect_simd_level()) {
+#if defined(FINMATH_ARCH_X86)
+        case cpu::SimdLevel::AVX512: return log_returns_avx512;
+        case cpu::SimdLevel::AVX2:   return log_returns_avx2;
+#endif
+        default:                     return log_returns_scalar;
+    }
+}
+
+LogReturnsFnF32 resolve_log_returns_fn_f32()
+{
+    switch (cpu::detect_simd_level()) {
+#if defined(FINMATH_ARCH_X86)
+        case cpu::SimdLevel::AVX512: return log_returns_avx512;
+        case cpu::SimdLevel::AVX2:   return log_returns_avx2;
+#endif
+        default:                     return log_returns_scalar;
+    }
+}
+
+const LogReturnsFn g_log_returns_fn = resolve_log_returns_fn();
+const LogReturnsFnF32 g_log_returns_fn_f32 = resolve_log_returns_fn_f32();
+
+} // namespace
+
+LogReturnsFn log_returns_fn()
+{
+    return g_log_returns_fn;
+}
+
+LogReturnsFnF32 log_returns_fn_f32()
+{
+    return g_log_returns_fn_f32;
+}
+
+} // namespace timeseries
+} // namespace finmath
+
 // Function to compute the logarithmic returns
 std::vector<double> compute_log_returns(const std::vector<double> &prices)
 {
-    std::vector<double> log_returns;
-    for (size_t i = 1; i < prices.size(); ++i)
+    if (prices.size() < 2)
     {
-        log_returns.push_back(std::log(prices[i] / prices[i - 1]));
+        return {};
     }
+    std::vector<double> log_returns(prices.size() - 1);
+    finmath::timeseries::log_returns_fn()(prices.data(), prices.size(), log_returns.data());
     return log_returns;
 }
 
@@ -33,17 +116,12 @@ double compute_std(const std::vector<double> &data)
 // Function to compute rolling volatility
 std::vector<double> rolling_volatility(const std::vector<double> &prices, size_t window_size)
 {
-    std::vector<double> volatilities;
-
-    // Compute log returns
-    std::vector<double> log_returns = compute_log_returns(prices);
-
     // Check if window size is valid relative to log returns size
     if (window_size == 0)
     {
         throw std::runtime_error("Window size cannot be zero.");
     }
-    if (log_returns.empty() || log_returns.size() < window_size)
+    if (prices.size() < 2 || prices.size() - 1 < window_size)
     {
         // Cannot compute volatility if not enough log returns for the window
         // Option 1: Throw error
@@ -52,40 +130,48 @@ std::vector<double> rolling_volatility(const std::vector<double> &prices, size_t
         // return {};
     }
 
-    // Rolling window calculation
-    volatilities.reserve(log_returns.size() - window_size + 1); // Reserve space
-    for (size_t i = 0; i <= log_returns.size() - window_size; ++i)
+    std::vector<double> volatilities(prices.size() - window_size);
+    if (!rolling_volatility(prices.data(), prices.size(), window_size, volatilities.data()))
     {
-        // Get the window of log returns
-        std::vector<double> window(log_returns.begin() + i, log_returns.begin() + i + window_size);
-
-        // Compute the standard deviation
-        double std_dev = compute_std(window);
+        throw std::runtime_error("Price must be positive for log return calculation.");
+    }
 
-        // Annualize the standard deviation (multiply by sqrt(252))
-        double annualized_vol = std_dev * std::sqrt(252);
+    return volatilities;
+}
 
-        // Store the result
-        volatilities.push_back(annualized_vol);
+bool rolling_volatility(const double *prices, size_t num_prices, size_t window_size, double *volatilities)
+{
+    // 1. Compute log returns (vectorized log on AVX2/AVX-512)
+    //    into a per-thread buffer that is reused across calls (grown, never shrunk)
+    thread_local std::vector<double> tls_scratch;
+    if (tls_scratch.size() < num_prices - 1)
+    {
+        tls_scratch.resize(num_prices - 1);
+    }
+    double *log_returns = tls_scratch.data();
+    if (!finmath::timeseries::log_returns_fn()(prices, num_prices, log_returns))
+    {
+        return false;
     }
 
-    return volatilities;
+    // 2. Rolling window calculation: O(1) Welford update per step (add the entering
+    //    return, drop the leaving one) via the kernel selected for this CPU.
+    //    Log returns size is num_prices - 1, so there are (num_prices - 1) - window_size + 1 windows
+    finmath::timeseries::rolling_vol_fn()(log_returns, num_prices - window_size, window_size, volatilities);
+    return true;
 }
 
 // Implementation for the NumPy array version
-std::vector<double> rolling_volatility_np(py::array_t<double> prices_arr, size_t window_size)
+std::vector<double> rolling_volatility_np(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr, size_t window_size)
 {
-    // Request buffer information from the NumPy array
-    py::buffer_info buf_info = prices_arr.request();
-
-    // Check dimensions (should be 1D)
-    if (buf_info.ndim != 1)
+    // c_style | forcecast: float64 C-contiguous input is read in place, anything
+    // else is converted once by pybind11 before we get here
+    if (prices_arr.ndim() != 1)
     {
         throw std::runtime_error("Input array must be 1-dimensional.");
     }
 
-    // Get size after checking dimension
-    size_t num_prices = buf_info.size;
+    size_t num_prices = static_cast<size_t>(prices_arr.shape(0));
 
     // Check if window size and input size are valid *before* accessing pointer or calculating reserves
     if (window_size == 0)
@@ -105,46 +191,36 @@ std::vector<double> rolling_volatility_np(py::array_t<double> prices_arr, size_t
         throw std::runtime_error("Window size must be smaller than the number of prices.");
     }
 
-    // Get pointer to the data only after size checks pass
-    const double *prices_ptr = static_cast<const double *>(buf_info.ptr);
+    std::vector<double> volatilities(num_prices - window_size);
+    if (!rolling_volatility(prices_arr.data(), num_prices, window_size, volatilities.data()))
+    {
+        throw std::runtime_error("Price must be positive for log return calculation.");
+    }
 
-    std::vector<double> volatilities;
-    // Now it's safe to calculate reserve size: num_prices >= 2, window_size >= 1, num_prices > window_size
-    // Log returns size will be num_prices - 1. Result size will be (num_prices - 1) - window_size + 1
-    size_t expected_result_size = num_prices - window_size;
-    volatilities.reserve(expected_result_size);
+    return volatilities;
+}
 
-    // 1. Compute log returns
-    std::vector<double> log_returns;
-    log_returns.reserve(num_prices - 1);
-    for (size_t i = 1; i < num_prices; ++i)
+// Single Python entry point: NumPy arrays (any layout or dtype) and Pandas Series
+// go to the buffer path, so a strided float64 view is copied once into a contiguous
+// array instead of matching a std::vector overload and being unboxed element by element
+std::vector<double> rolling_volatility_obj(py::object prices, size_t window_size)
+{
+    if (!py::isinstance<py::array>(prices) && py::hasattr(prices, "values"))
     {
-        if (prices_ptr[i - 1] <= 0)
-            throw std::runtime_error("Price must be positive for log return calculation.");
-        log_returns.push_back(std::log(prices_ptr[i] / prices_ptr[i - 1]));
+        prices = prices.attr("values");
     }
-
-    // This check might be redundant now given the earlier checks, but keep for safety
-    if (log_returns.size() < window_size)
+    if (py::isinstance<py::array>(prices))
     {
-        throw std::runtime_error("Window size is larger than the number of log returns.");
+        return rolling_volatility_np(prices.cast<py::array_t<double, py::array::c_style | py::array::forcecast>>(), window_size);
     }
-
-    // 2. Rolling window calculation using SIMD-accelerated stddev
-    for (size_t i = 0; i <= log_returns.size() - window_size; ++i)
+    std::vector<double> values;
+    try
     {
-        // Get pointer to current window (zero-copy, no vector creation needed)
-        const double* window_data = &log_returns[i];
-        
-        // Use SIMD-accelerated standard deviation calculation
-        double std_dev = finmath::simd::vector_stddev(window_data, window_size);
-
-        // Annualize the standard deviation
-        double annualized_vol = std_dev * std::sqrt(252);
-
-        // Store the result
-        volatilities.push_back(annualized_vol);
+        values = prices.cast<std::vector<double>>();
     }
-
-    return volatilities;
-}
\ No newline at end of file
+    catch (const py::cast_error &)
+    {
+        throw py::type_error("prices must be a list, NumPy array or Pandas Series of numbers");
+    }
+    return rolling_volatility(values, window_size);
+}
@@ -0,0 +1,303 @@
+// AVX2 + FMA rolling volatility kernel. Built with -mavx2 -mfma (see CMakeLists.txt);
+// only reached through rolling_vol_fn() when the CPU reports AVX2 and FMA.
+#include "finmath/TimeSeries/rolling_volatility_kernels.h"
+
+#if defined(FINMATH_ARCH_X86)
+#include <immintrin.h>
+#include <cfloat>
+#include <cmath>
+
+namespace finmath {
+namespace timeseries {
+
+namespace {
+
+inline double hsum(__m256d v) {
+    __m128d lo = _mm256_castpd256_pd128(v);
+    __m128d hi = _mm256_extractf128_pd(v, 1);
+    lo = _mm_add_pd(lo, hi);
+    return _mm_cvtsd_f64(_mm_add_sd(lo, _mm_unpackhi_pd(lo, lo)));
+}
+
+inline __m256d load4(const double* x) { return _mm256_loadu_pd(x); }
+
+// Widened sum of the 8 float lanes, as 4 double lanes
+inline __m256d widen_sum(__m256 v)
+{
+    return _mm256_add_pd(_mm256_cvtps_pd(_mm256_castps256_ps128(v)), _mm256_cvtps_pd(_mm256_extractf128_ps(v, 1)));
+}
+
+// Mean and sum of squared deviations of the first window
+void window_moments(const double* x, size_t window_size, double& mean, double& m2)
+{
+    // Mean. Four independent accumulators (16 doubles per iteration)
+    // keep four adds in flight instead of serialising on one register.
+    __m256d s0 = _mm256_setzero_pd();
+    __m256d s1 = _mm256_setzero_pd();
+    __m256d s2 = _mm256_setzero_pd();
+    __m256d s3 = _mm256_setzero_pd();
+    size_t i = 0;
+    for (; i + 16 <= window_size; i += 16) {
+        s0 = _mm256_add_pd(s0, load4(x + i));
+        s1 = _mm256_add_pd(s1, load4(x + i + 4));
+        s2 = _mm256_add_pd(s2, load4(x + i + 8));
+        s3 = _mm256_add_pd(s3, load4(x + i + 12));
+    }
+    for (; i + 4 <= window_size; i += 4) {
+        s0 = _mm256_add_pd(s0, load4(x + i));
+    }
+    double sum = hsum(_mm256_add_pd(_mm256_add_pd(s0, s1), _mm256_add_pd(s2, s3)));
+    for (; i < window_size; ++i) {
+        sum += x[i];
+    }
+    mean = sum / static_cast<double>(window_size);
+
+    // Sum of squared deviations, fused as diff * diff + acc across
+    // four chains so the 4-cycle FMA latency is hidden. Fold order is fixed
+    // so results are deterministic run to run.
+    const __m256d vmean = _mm256_set1_pd(mean);
+    __m256d ss0 = _mm256_setzero_pd();
+    __m256d ss1 = _mm256_setzero_pd();
+    __m256d ss2 = _mm256_setzero_pd();
+    __m256d ss3 = _mm256_setzero_pd();
+    i = 0;
+    for (; i + 16 <= window_size; i += 16) {
+        __m256d d0 = _mm256_sub_pd(load4(x + i), vmean);
+        __m256d d1 = _mm256_sub_pd(load4(x + i + 4), vmean);
+        __m256d d2 = _mm256_sub_pd(load4(x + i + 8), vmean);
+        __m256d d3 = _mm256_sub_pd(load4(x + i + 12), vmean);
+        ss0 = _mm256_fmadd_pd(d0, d0, ss0);
+        ss1 = _mm256_fmadd_pd(d1, d1, ss1);
+        ss2 = _mm256_fmadd_pd(d2, d2, ss2);
+        ss3 = _mm256_fmadd_pd(d3, d3, ss3);
+    }
+    for (; i + 4 <= window_size; i += 4) {
+        __m256d d = _mm256_sub_pd(load4(x + i), vmean);
+        ss0 = _mm256_fmadd_pd(d, d, ss0);
+    }
+    double sum_sq = hsum(_mm256_add_pd(_mm256_add_pd(ss0, ss1), _mm256_add_pd(ss2, ss3)));
+    for (; i < window_size; ++i) {
+        double diff = x[i] - mean;
+        sum_sq += diff * diff;
+    }
+    m2 = sum_sq;
+}
+
+// Knuth TwoSum on every lane: s + x == s' + e exactly, and e goes into the compensation c
+inline void two_sum(__m256& s, __m256& c, __m256 x)
+{
+    const __m256 t = _mm256_add_ps(s, x);
+    const __m256 z = _mm256_sub_ps(t, s);
+    c = _mm256_add_ps(c, _mm256_add_ps(_mm256_sub_ps(s, _mm256_sub_ps(t, z)), _mm256_sub_ps(x, z)));
+    s = t;
+}
+
+// (x - mean_f)^2 as sq + corr: sq is the rounded float square, corr carries the exact
+// residuals of the subtraction (TwoSum) and of the product (FMA)
+inline void centred_square(__m256 x, __m256 vmean, __m256& sq, __m256& corr)
+{
+    const __m256 d = _mm256_sub_ps(x, vmean);
+    const __m256 z = _mm256_sub_ps(d, x);
+    const __m256 d_err = _mm256_sub_ps(_mm256_sub_ps(x, _mm256_sub_ps(d, z)), _mm256_add_ps(vmean, z));
+    sq = _mm256_mul_ps(d, d);
+    corr = _mm256_fmadd_ps(_mm256_add_ps(d, d), d_err, _mm256_fmsub_ps(d, d, sq));
+}
+
+// float counterpart: packed float lanes (8 per register, two chains) with compensated
+// accumulation, widened to double only for the final reduction. The slide carries any
+// seed error forward as an absolute error in M2, so the seed is kept near double accuracy.
+void window_moments(const float* x, size_t window_size, double& mean, double& m2)
+{
+    const size_t packed = window_size - window_size % 16;
+
+    __m256 s0 = _mm256_setzero_ps(), c0 = _mm256_setzero_ps();
+    __m256 s1 = _mm256_setzero_ps(), c1 = _mm256_setzero_ps();
+    for (size_t i = 0; i < packed; i += 16) {
+        two_sum(s0, c0, _mm256_loadu_ps(x + i));
+        two_sum(s1, c1, _mm256_loadu_ps(x + i + 8));
+    }
+    const double packed_sum = hsum(_mm256_add_pd(_mm256_add_pd(widen_sum(s0), widen_sum(s1)),
+                                                 _mm256_add_pd(widen_sum(c0), widen_sum(c1))));
+    double sum = packed_sum;
+    for (size_t i = packed; i < window_size; ++i) {
+        sum += x[i];
+    }
+    mean = sum / static_cast<double>(window_size);
+
+    const float mean_f = static_cast<float>(mean);
+    const __m256 vmean = _mm256_set1_ps(mean_f);
+    __m256 ss0 = _mm256_setzero_ps(), cs0 = _mm256_setzero_ps(), r0 = _mm256_setzero_ps();
+    __m256 ss1 = _mm256_setzero_ps(), cs1 = _mm256_setzero_ps(), r1 = _mm256_setzero_ps();
+    for (size_t i = 0; i < packed; i += 16) {
+        __m256 sq, corr;
+        centred_square(_mm256_loadu_ps(x + i), vmean, sq, corr);
+        two_sum(ss0, cs0, sq);
+        r0 = _mm256_add_ps(r0, corr);
+        centred_square(_mm256_loadu_ps(x + i + 8), vmean, sq, corr);
+        two_sum(ss1, cs1, sq);
+        r1 = _mm256_add_ps(r1, corr);
+    }
+    double sum_sq = hsum(_mm256_add_pd(_mm256_add_pd(widen_sum(ss0), widen_sum(ss1)),
+                                       _mm256_add_pd(_mm256_add_pd(widen_sum(cs0), widen_sum(cs1)),
+                                                     _mm256_add_pd(widen_sum(r0), widen_sum(r1)))));
+    // Re-centre the packed part from mean_f on mean:
+    // sum (x - mean)^2 = sum (x - mean_f)^2 - shift * (2 * sum (x - mean) + packed * shift)
+    const double shift = mean - static_cast<double>(mean_f);
+    sum_sq -= shift * (2.0 * (packed_sum - static_cast<double>(packed) * mean) + static_cast<double>(packed) * shift);
+    for (size_t i = packed; i < window_size; ++i) {
+        double diff = x[i] - mean;
+        sum_sq += diff * diff;
+    }
+    m2 = sum_sq;
+}
+
+// log(x) for positive normal x: x = m * 2^e with m in [sqrt(1/2), sqrt(2)), then
+// log(m) = 2 atanh(s), s = (m - 1) / (m + 1), |s| < 0.172, summed through s^23.
+inline __m256d log_pd(__m256d x)
+{
+    const __m256i bits = _mm256_castpd_si256(x);
+
+    // Biased exponent -> double via the 2^52 trick (AVX2 has no int64 -> double convert)
+    const __m256d two52 = _mm256_set1_pd(4503599627370496.0);
+    __m256d e = _mm256_sub_pd(
+        _mm256_castsi256_pd(_mm256_or_si256(_mm256_srli_epi64(bits, 52), _mm256_castpd_si256(two52))), two52);
+    e = _mm256_sub_pd(e, _mm256_set1_pd(1023.0));
+
+    // Mantissa in [1, 2), folded to [sqrt(1/2), sqrt(2))
+    __m256d m = _mm256_castsi256_pd(_mm256_or_si256(
+        _mm256_and_si256(bits, _mm256_set1_epi64x(0x000FFFFFFFFFFFFFLL)),
+        _mm256_set1_epi64x(0x3FF0000000000000LL)));
+    const __m256d fold = _mm256_cmp_pd(m, _mm256_set1_pd(M_SQRT2), _CMP_GT_OQ);
+    m = _mm256_blendv_pd(m, _mm256_mul_pd(m, _mm256_set1_pd(0.5)), fold);
+    e = _mm256_add_pd(e, _mm256_and_pd(fold, _mm256_set1_pd(1.0)));
+
+    const __m256d one = _mm256_set1_pd(1.0);
+    const __m256d s = _mm256_div_pd(_mm256_sub_pd(m, one), _mm256_add_pd(m, one));
+    const __m256d z = _mm256_mul_pd(s, s);
+    __m256d poly = _mm256_set1_pd(1.0 / 23.0);
+    for (int k = 10; k >= 0; --k) {
+        poly = _mm256_fmadd_pd(poly, z, _mm256_set1_pd(1.0 / (2 * k + 1)));
+    }
+    const __m256d log_m = _mm256_mul_pd(_mm256_add_pd(s, s), poly);
+
+    // e * ln2 split so the high product is exact
+    const __m256d ln2_hi = _mm256_set1_pd(6.93147180369123816490e-01);
+    const __m256d ln2_lo = _mm256_set1_pd(1.90821492927058770002e-10);
+    return _mm256_fmadd_pd(e, ln2_hi, _mm256_fmadd_pd(e, ln2_lo, log_m));
+}
+
+// Single-precision log, same reduction: m in [sqrt(1/2), sqrt(2)), 2 atanh(s)
+// summed through s^11 (the next term is below half a float ulp).
+inline __m256 log_ps(__m256 x)
+{
+    const __m256i bits = _mm256_castps_si256(x);
+    __m256 e = _mm256_sub_ps(_mm256_cvtepi32_ps(_mm256_srli_epi32(bits, 23)), _mm256_set1_ps(127.0f));
+    __m256 m = _mm256_castsi256_ps(_mm256_or_si256(
+        _mm256_and_si256(bits, _mm256_set1_epi32(0x007FFFFF)), _mm256_set1_epi32(0x3F800000)));
+    const __m256 fold = _mm256_cmp_ps(m, _mm256_set1_ps(static_cast<float>(M_SQRT2)), _CMP_GT_OQ);
+    m = _mm256_blendv_ps(m, _mm256_mul_ps(m, _mm256_set1_ps(0.5f)), fold);
+    e = _mm256_add_ps(e, _mm256_and_ps(fold, _mm256_set1_ps(1.0f)));
+
+    const __m256 one = _mm256_set1_ps(1.0f);
+    const __m256 s = _mm256_div_ps(_mm256_sub_ps(m, one), _mm256_add_ps(m, one));
+    const __m256 z = _mm256_mul_ps(s, s);
+    __m256 poly = _mm256_set1_ps(1.0f / 11.0f);
+    for (int k = 4; k >= 0; --k) {
+        poly = _mm256_fmadd_ps(poly, z, _mm256_set1_ps(1.0f / static_cast<float>(2 * k + 1)));
+    }
+    const __m256 log_m = _mm256_mul_ps(_mm256_add_ps(s, s), poly);
+
+    // e * ln2 split so the high product is exact (ln2_hi has 9 significant bits)
+    const __m256 ln2_hi = _mm256_set1_ps(0.693359375f);
+    const __m256 ln2_lo = _mm256_set1_ps(-2.12194440e-4f);
+    return _mm256_fmadd_ps(e, ln2_hi, _mm256_fmadd_ps(e, ln2_lo, log_m));
+}
+
+} // namespace
+
+bool log_returns_avx2(const double* prices, size_t num_prices, double* out)
+{
+    if (num_prices == 0) {
+        return true;
+    }
+    bool all_positive = prices[0] > 0;
+    const size_t n = num_prices - 1;
+    const __m256d zero = _mm256_setzero_pd();
+    const __m256d lo = _mm256_set1_pd(DBL_MIN);
+    const __m256d hi = _mm256_set1_pd(DBL_MAX);
+    size_t i = 0;
+    for (; i + 4 <= n; i += 4) {
+        const __m256d next = _mm256_loadu_pd(prices + i + 1);
+        const __m256d ratio = _mm256_div_pd(next, _mm256_loadu_pd(prices + i));
+        // Every price after the first is some lane's `next`, so this covers the series
+        const __m256d ok = _mm256_and_pd(_mm256_cmp_pd(next, zero, _CMP_GT_OQ),
+                                         _mm256_and_pd(_mm256_cmp_pd(ratio, lo, _CMP_GE_OQ),
+                                                       _mm256_cmp_pd(ratio, hi, _CMP_LE_OQ)));
+        if (_mm256_movemask_pd(ok) == 0xF) {
+            _mm256_storeu_pd(out + i, log_pd(ratio));
+        } else {
+            // Non-positive, subnormal, inf or NaN somewhere: keep std::log semantics
+            for (size_t j = i; j < i + 4; ++j) {
+                all_positive &= prices[j + 1] > 0;
+                out[j] = std::log(prices[j + 1] / prices[j]);
+            }
+        }
+    }
+    for (; i < n; ++i) {
+        all_positive &= prices[i + 1] > 0;
+        out[i] = std::log(prices[i + 1] / prices[i]);
+    }
+    return all_positive;
+}
+
+bool log_returns_avx2(const float* prices, size_t num_prices, float* out)
+{
+    if (num_prices == 0) {
+        return true;
+    }
+    bool all_positive = prices[0] > 0;
+    const size_t n = num_prices - 1;
+    const __m256 zero = _mm256_setzero_ps();
+    const __m256 lo = _mm256_set1_ps(FLT_MIN);
+    const __m256 hi = _mm256_set1_ps(FLT_MAX);
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8) {
+        const __m256 next = _mm256_loadu_ps(prices + i + 1);
+        const __m256 ratio = _mm256_div_ps(next, _mm256_loadu_ps(prices + i));
+        const __m256 ok = _mm256_and_ps(_mm256_cmp_ps(next, zero, _CMP_GT_OQ),
+                                        _mm256_and_ps(_mm256_cmp_ps(ratio, lo, _CMP_GE_OQ),
+                                                      _mm256_cmp_ps(ratio, hi, _CMP_LE_OQ)));
+        if (_mm256_movemask_ps(ok) == 0xFF) {
+            _mm256_storeu_ps(out + i, log_ps(ratio));
+        } else {
+            for (size_t j = i; j < i + 8; ++j) {
+                all_positive &= prices[j + 1] > 0;
+                out[j] = std::log(prices[j + 1] / prices[j]);
+            }
+        }
+    }
+    for (; i < n; ++i) {
+        all_positive &= prices[i + 1] > 0;
+        out[i] = std::log(prices[i + 1] / prices[i]);
+    }
+    return all_positive;
+}
+
+void rolling_vol_avx2(const float* log_returns, size_t num_windows, size_t window_size, float* out)
+{
+    double mean, m2;
+    window_moments(log_returns, window_size, mean, m2);
+    rolling_vol_slide(log_returns, num_windows, window_size, mean, m2, out);
+}
+
+void rolling_vol_avx2(const double* log_returns, size_t num_windows, size_t window_size, double* out)
+{
+    double mean, m2;
+    window_moments(log_returns, window_size, mean, m2);
+    rolling_vol_slide(log_returns, num_windows, window_size, mean, m2, out);
+}
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // FINMATH_ARCH_X86
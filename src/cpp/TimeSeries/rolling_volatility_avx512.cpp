@@ -0,0 +1,270 @@
+// AVX-512 rolling volatility kernel. Built with -mavx512f -mavx512dq (see CMakeLists.txt);
+// only reached through rolling_vol_fn() when the CPU reports AVX-512F and AVX-512DQ.
+#include "finmath/TimeSeries/rolling_volatility_kernels.h"
+
+#if defined(FINMATH_ARCH_X86)
+#include <immintrin.h>
+#include <cfloat>
+#include <cmath>
+
+namespace finmath {
+namespace timeseries {
+
+namespace {
+
+// Mean and sum of squared deviations of the first window
+void window_moments(const double* x, size_t window_size, double& mean, double& m2)
+{
+    const size_t full = window_size / 8;
+    const __mmask8 tail_mask = static_cast<__mmask8>((1u << (window_size % 8)) - 1u);
+
+    // Single pass, Welford-style: each of the 8 lanes keeps its own running
+    // (mean, M2) over every 8th element, with the squared-deviation step fused.
+    __m512d vmean = _mm512_setzero_pd();
+    __m512d vm2 = _mm512_setzero_pd();
+    for (size_t k = 0; k < full; ++k) {
+        const __m512d vx = _mm512_loadu_pd(x + 8 * k);
+        const __m512d vinv = _mm512_set1_pd(1.0 / static_cast<double>(k + 1));
+        const __m512d delta = _mm512_sub_pd(vx, vmean);
+        vmean = _mm512_fmadd_pd(delta, vinv, vmean);
+        vm2 = _mm512_fmadd_pd(delta, _mm512_sub_pd(vx, vmean), vm2);
+    }
+
+    // Tail (window_size % 8 elements): masked update so only the live lanes advance
+    __m512d vcount = _mm512_set1_pd(static_cast<double>(full));
+    if (tail_mask) {
+        const __m512d vx = _mm512_maskz_loadu_pd(tail_mask, x + 8 * full);
+        const __m512d vinv = _mm512_set1_pd(1.0 / static_cast<double>(full + 1));
+        const __m512d delta = _mm512_sub_pd(vx, vmean);
+        vmean = _mm512_mask3_fmadd_pd(delta, vinv, vmean, tail_mask);
+        vm2 = _mm512_mask3_fmadd_pd(delta, _mm512_sub_pd(vx, vmean), vm2, tail_mask);
+        vcount = _mm512_mask_add_pd(vcount, tail_mask, vcount, _mm512_set1_pd(1.0));
+    }
+
+    // Merge the lanes (Chan et al.): one reduction for the mean, one for M2
+    mean = _mm512_reduce_add_pd(_mm512_mul_pd(vcount, vmean)) / static_cast<double>(window_size);
+    const __m512d spread = _mm512_sub_pd(vmean, _mm512_set1_pd(mean));
+    m2 = _mm512_reduce_add_pd(_mm512_fmadd_pd(_mm512_mul_pd(vcount, spread), spread, vm2));
+}
+
+// Widened sum of the 16 float lanes, as 8 double lanes
+inline __m512d widen_sum(__m512 v)
+{
+    return _mm512_add_pd(_mm512_cvtps_pd(_mm512_castps512_ps256(v)), _mm512_cvtps_pd(_mm512_extractf32x8_ps(v, 1)));
+}
+
+inline __mmask16 lane_mask(size_t n)
+{
+    return static_cast<__mmask16>(n >= 16 ? 0xFFFFu : (1u << n) - 1u);
+}
+
+// Knuth TwoSum on every lane: s + x == s' + e exactly, and e goes into the compensation c
+inline void two_sum(__m512& s, __m512& c, __m512 x)
+{
+    const __m512 t = _mm512_add_ps(s, x);
+    const __m512 z = _mm512_sub_ps(t, s);
+    c = _mm512_add_ps(c, _mm512_add_ps(_mm512_sub_ps(s, _mm512_sub_ps(t, z)), _mm512_sub_ps(x, z)));
+    s = t;
+}
+
+// (x - mean_f)^2 as sq + corr: sq is the rounded float square, corr carries the exact
+// residuals of the subtraction (TwoSum) and of the product (FMA). Lanes outside
+// `live` give zero in both.
+inline void centred_square(__m512 x, __m512 vmean, __mmask16 live, __m512& sq, __m512& corr)
+{
+    const __m512 d = _mm512_maskz_sub_ps(live, x, vmean);
+    const __m512 z = _mm512_sub_ps(d, x);
+    const __m512 d_err = _mm512_sub_ps(_mm512_sub_ps(x, _mm512_sub_ps(d, z)), _mm512_add_ps(vmean, z));
+    sq = _mm512_mul_ps(d, d);
+    corr = _mm512_fmadd_ps(_mm512_add_ps(d, d), d_err, _mm512_fmsub_ps(d, d, sq));
+}
+
+// float counterpart: packed float lanes (16 per register, two chains) with compensated
+// accumulation, widened to double only for the final reduction. The slide carries any
+// seed error forward as an absolute error in M2, so the seed is kept near double accuracy.
+void window_moments(const float* x, size_t window_size, double& mean, double& m2)
+{
+    const size_t packed = window_size - window_size % 32;
+    const size_t tail = window_size - packed;
+    const __mmask16 tail_lo = lane_mask(tail);
+    const __mmask16 tail_hi = lane_mask(tail > 16 ? tail - 16 : 0);
+
+    __m512 s0 = _mm512_setzero_ps(), c0 = _mm512_setzero_ps();
+    __m512 s1 = _mm512_setzero_ps(), c1 = _mm512_setzero_ps();
+    for (size_t i = 0; i < packed; i += 32) {
+        two_sum(s0, c0, _mm512_loadu_ps(x + i));
+        two_sum(s1, c1, _mm512_loadu_ps(x + i + 16));
+    }
+    // Tail (window_size % 32 elements): masked loads, dead lanes read as zero
+    two_sum(s0, c0, _mm512_maskz_loadu_ps(tail_lo, x + packed));
+    two_sum(s1, c1, _mm512_maskz_loadu_ps(tail_hi, x + packed + 16));
+    mean = _mm512_reduce_add_pd(_mm512_add_pd(_mm512_add_pd(widen_sum(s0), widen_sum(s1)),
+                                              _mm512_add_pd(widen_sum(c0), widen_sum(c1))))
+         / static_cast<double>(window_size);
+
+    const float mean_f = static_cast<float>(mean);
+    const __m512 vmean = _mm512_set1_ps(mean_f);
+    __m512 ss0 = _mm512_setzero_ps(), cs0 = _mm512_setzero_ps(), r0 = _mm512_setzero_ps();
+    __m512 ss1 = _mm512_setzero_ps(), cs1 = _mm512_setzero_ps(), r1 = _mm512_setzero_ps();
+    __m512 sq, corr;
+    for (size_t i = 0; i < packed; i += 32) {
+        centred_square(_mm512_loadu_ps(x + i), vmean, 0xFFFF, sq, corr);
+        two_sum(ss0, cs0, sq);
+        r0 = _mm512_add_ps(r0, corr);
+        centred_square(_mm512_loadu_ps(x + i + 16), vmean, 0xFFFF, sq, corr);
+        two_sum(ss1, cs1, sq);
+        r1 = _mm512_add_ps(r1, corr);
+    }
+    centred_square(_mm512_maskz_loadu_ps(tail_lo, x + packed), vmean, tail_lo, sq, corr);
+    two_sum(ss0, cs0, sq);
+    r0 = _mm512_add_ps(r0, corr);
+    centred_square(_mm512_maskz_loadu_ps(tail_hi, x + packed + 16), vmean, tail_hi, sq, corr);
+    two_sum(ss1, cs1, sq);
+    r1 = _mm512_add_ps(r1, corr);
+
+    // Every element was centred on mean_f, and sum (x - mean) == 0, so
+    // sum (x - mean)^2 = sum (x - mean_f)^2 - window_size * shift^2
+    const double shift = mean - static_cast<double>(mean_f);
+    m2 = _mm512_reduce_add_pd(_mm512_add_pd(_mm512_add_pd(widen_sum(ss0), widen_sum(ss1)),
+                                            _mm512_add_pd(_mm512_add_pd(widen_sum(cs0), widen_sum(cs1)),
+                                                          _mm512_add_pd(widen_sum(r0), widen_sum(r1)))))
+       - static_cast<double>(window_size) * shift * shift;
+}
+
+// log(x) for positive normal x: getexp/getmant give x = m * 2^e with m in [1, 2),
+// folded to [sqrt(1/2), sqrt(2)); log(m) = 2 atanh(s), s = (m - 1) / (m + 1),
+// |s| < 0.172, summed through s^23.
+inline __m512d log_pd(__m512d x)
+{
+    __m512d e = _mm512_getexp_pd(x);
+    __m512d m = _mm512_getmant_pd(x, _MM_MANT_NORM_1_2, _MM_MANT_SIGN_src);
+    const __mmask8 fold = _mm512_cmp_pd_mask(m, _mm512_set1_pd(M_SQRT2), _CMP_GT_OQ);
+    m = _mm512_mask_mul_pd(m, fold, m, _mm512_set1_pd(0.5));
+    e = _mm512_mask_add_pd(e, fold, e, _mm512_set1_pd(1.0));
+
+    const __m512d one = _mm512_set1_pd(1.0);
+    const __m512d s = _mm512_div_pd(_mm512_sub_pd(m, one), _mm512_add_pd(m, one));
+    const __m512d z = _mm512_mul_pd(s, s);
+    __m512d poly = _mm512_set1_pd(1.0 / 23.0);
+    for (int k = 10; k >= 0; --k) {
+        poly = _mm512_fmadd_pd(poly, z, _mm512_set1_pd(1.0 / (2 * k + 1)));
+    }
+    const __m512d log_m = _mm512_mul_pd(_mm512_add_pd(s, s), poly);
+
+    // e * ln2 split so the high product is exact
+    const __m512d ln2_hi = _mm512_set1_pd(6.93147180369123816490e-01);
+    const __m512d ln2_lo = _mm512_set1_pd(1.90821492927058770002e-10);
+    return _mm512_fmadd_pd(e, ln2_hi, _mm512_fmadd_pd(e, ln2_lo, log_m));
+}
+
+// Single-precision log, same reduction, summed through s^11
+inline __m512 log_ps(__m512 x)
+{
+    __m512 e = _mm512_getexp_ps(x);
+    __m512 m = _mm512_getmant_ps(x, _MM_MANT_NORM_1_2, _MM_MANT_SIGN_src);
+    const __mmask16 fold = _mm512_cmp_ps_mask(m, _mm512_set1_ps(static_cast<float>(M_SQRT2)), _CMP_GT_OQ);
+    m = _mm512_mask_mul_ps(m, fold, m, _mm512_set1_ps(0.5f));
+    e = _mm512_mask_add_ps(e, fold, e, _mm512_set1_ps(1.0f));
+
+    const __m512 one = _mm512_set1_ps(1.0f);
+    const __m512 s = _mm512_div_ps(_mm512_sub_ps(m, one), _mm512_add_ps(m, one));
+    const __m512 z = _mm512_mul_ps(s, s);
+    __m512 poly = _mm512_set1_ps(1.0f / 11.0f);
+    for (int k = 4; k >= 0; --k) {
+        poly = _mm512_fmadd_ps(poly, z, _mm512_set1_ps(1.0f / static_cast<float>(2 * k + 1)));
+    }
+    const __m512 log_m = _mm512_mul_ps(_mm512_add_ps(s, s), poly);
+
+    const __m512 ln2_hi = _mm512_set1_ps(0.693359375f);
+    const __m512 ln2_lo = _mm512_set1_ps(-2.12194440e-4f);
+    return _mm512_fmadd_ps(e, ln2_hi, _mm512_fmadd_ps(e, ln2_lo, log_m));
+}
+
+} // namespace
+
+bool log_returns_avx512(const double* prices, size_t num_prices, double* out)
+{
+    if (num_prices == 0) {
+        return true;
+    }
+    bool all_positive = prices[0] > 0;
+    const size_t n = num_prices - 1;
+    const __m512d zero = _mm512_setzero_pd();
+    const __m512d lo = _mm512_set1_pd(DBL_MIN);
+    const __m512d hi = _mm512_set1_pd(DBL_MAX);
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8) {
+        const __m512d next = _mm512_loadu_pd(prices + i + 1);
+        const __m512d ratio = _mm512_div_pd(next, _mm512_loadu_pd(prices + i));
+        // Every price after the first is some lane's `next`, so this covers the series
+        const __mmask8 ok = _mm512_cmp_pd_mask(next, zero, _CMP_GT_OQ)
+                          & _mm512_cmp_pd_mask(ratio, lo, _CMP_GE_OQ)
+                          & _mm512_cmp_pd_mask(ratio, hi, _CMP_LE_OQ);
+        if (ok == 0xFF) {
+            _mm512_storeu_pd(out + i, log_pd(ratio));
+        } else {
+            // Non-positive, subnormal, inf or NaN somewhere: keep std::log semantics
+            for (size_t j = i; j < i + 8; ++j) {
+                all_positive &= prices[j + 1] > 0;
+                out[j] = std::log(prices[j + 1] / prices[j]);
+            }
+        }
+    }
+    for (; i < n; ++i) {
+        all_positive &= prices[i + 1] > 0;
+        out[i] = std::log(prices[i + 1] / prices[i]);
+    }
+    return all_positive;
+}
+
+bool log_returns_avx512(const float* prices, size_t num_prices, float* out)
+{
+    if (num_prices == 0) {
+        return true;
+    }
+    bool all_positive = prices[0] > 0;
+    const size_t n = num_prices - 1;
+    const __m512 zero = _mm512_setzero_ps();
+    const __m512 lo = _mm512_set1_ps(FLT_MIN);
+    const __m512 hi = _mm512_set1_ps(FLT_MAX);
+    size_t i = 0;
+    for (; i + 16 <= n; i += 16) {
+        const __m512 next = _mm512_loadu_ps(prices + i + 1);
+        const __m512 ratio = _mm512_div_ps(next, _mm512_loadu_ps(prices + i));
+        const __mmask16 ok = _mm512_cmp_ps_mask(next, zero, _CMP_GT_OQ)
+                           & _mm512_cmp_ps_mask(ratio, lo, _CMP_GE_OQ)
+                           & _mm512_cmp_ps_mask(ratio, hi, _CMP_LE_OQ);
+        if (ok == 0xFFFF) {
+            _mm512_storeu_ps(out + i, log_ps(ratio));
+        } else {
+            for (size_t j = i; j < i + 16; ++j) {
+                all_positive &= prices[j + 1] > 0;
+                out[j] = std::log(prices[j + 1] / prices[j]);
+            }
+        }
+    }
+    for (; i < n; ++i) {
+        all_positive &= prices[i + 1] > 0;
+        out[i] = std::log(prices[i + 1] / prices[i]);
+    }
+    return all_positive;
+}
+
+void rolling_vol_avx512(const float* log_returns, size_t num_windows, size_t window_size, float* out)
+{
+    double mean, m2;
+    window_moments(log_returns, window_size, mean, m2);
+    rolling_vol_slide(log_returns, num_windows, window_size, mean, m2, out);
+}
+
+void rolling_vol_avx512(const double* log_returns, size_t num_windows, size_t window_size, double* out)
+{
+    double mean, m2;
+    window_moments(log_returns, window_size, mean, m2);
+    rolling_vol_slide(log_returns, num_windows, window_size, mean, m2, out);
+}
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // FINMATH_ARCH_X86
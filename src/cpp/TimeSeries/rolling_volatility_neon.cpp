@@ -0,0 +1,55 @@
+// NEON rolling volatility kernel. Built with -march=armv8-a+simd (see CMakeLists.txt);
+// only reached through rolling_vol_fn() when the CPU reports Advanced SIMD.
+#include "finmath/TimeSeries/rolling_volatility_kernels.h"
+
+#if defined(FINMATH_ARCH_ARM64) && !defined(FINMATH_SSE2NEON)
+#include <arm_neon.h>
+
+namespace finmath {
+namespace timeseries {
+
+namespace {
+
+// Mean and sum of squared deviations of the first window (2 doubles per iteration)
+void window_moments(const double* x, size_t window_size, double& mean, double& m2)
+{
+    float64x2_t vsum = vdupq_n_f64(0.0);
+    size_t i = 0;
+    for (; i + 2 <= window_size; i += 2) {
+        vsum = vaddq_f64(vsum, vld1q_f64(x + i));
+    }
+    double sum = vaddvq_f64(vsum);
+    for (; i < window_size; ++i) {
+        sum += x[i];
+    }
+    mean = sum / static_cast<double>(window_size);
+
+    // Sum of squared deviations, fused as acc + diff * diff
+    const float64x2_t vmean = vdupq_n_f64(mean);
+    float64x2_t vsum_sq = vdupq_n_f64(0.0);
+    i = 0;
+    for (; i + 2 <= window_size; i += 2) {
+        float64x2_t diff = vsubq_f64(vld1q_f64(x + i), vmean);
+        vsum_sq = vfmaq_f64(vsum_sq, diff, diff);
+    }
+    double sum_sq = vaddvq_f64(vsum_sq);
+    for (; i < window_size; ++i) {
+        double diff = x[i] - mean;
+        sum_sq += diff * diff;
+    }
+    m2 = sum_sq;
+}
+
+} // namespace
+
+void rolling_vol_neon(const double* log_returns, size_t num_windows, size_t window_size, double* out)
+{
+    double mean, m2;
+    window_moments(log_returns, window_size, mean, m2);
+    rolling_vol_slide(log_returns, num_windows, window_size, mean, m2, out);
+}
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // FINMATH_ARCH_ARM64 && !FINMATH_SSE2NEON
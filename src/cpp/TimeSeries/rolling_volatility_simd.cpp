@@ -1,20 +1,149 @@
 #include "finmath/TimeSeries/rolling_volatility_simd.h"
-#include "finmath/Helper/simd_helper.h"
+#include "finmath/TimeSeries/rolling_volatility_kernels.h"
+#include <algorithm>
 #include <cmath>
 #include <stdexcept>
 
-std::vector<double> rolling_volatility_simd(py::array_t<double> prices_arr, size_t window_size)
+namespace finmath {
+namespace timeseries {
+
+namespace {
+
+// Sliding Welford update over the windows after the first.
+//
+// Mean and M2 are carried in double for float input too. Their rounding error is
+// absolute, so in float it would be set by the largest M2 seen since the last
+// re-seed and swamp the small M2 of a later calm stretch. Widening costs no memory
+// traffic: the log returns are still read, and the results written, as T.
+template <typename T>
+void slide(const T* log_returns, size_t num_windows, size_t window_size, double mean, double m2, T* out)
 {
-    // Get buffer info for zero-copy access
-    py::buffer_info buf_info = prices_arr.request();
+    if (window_size == 1) {
+        // A single sample has no spread; skip the update so rounding cannot invent one
+        std::fill(out, out + num_windows, T(0));
+        return;
+    }
+
+    const double annualization_factor = std::sqrt(252.0);
+    // Divisions are hoisted out of the loop: one multiply per step instead of a
+    // long-latency divide on the mean's critical path.
+    const double inv_n = 1.0 / static_cast<double>(window_size);
+
+    out[0] = static_cast<T>(std::sqrt(std::max(m2, 0.0) * inv_n) * annualization_factor);
+
+    // Same replace-one-sample update as rolling_std_dev(): the window mean moves
+    // by (x_in - x_out) / n and M2 is corrected for both samples in one step.
+    for (size_t w = 1; w < num_windows; ++w) {
+        const double x_in = log_returns[w + window_size - 1];
+        const double x_out = log_returns[w - 1];
+        const double old_mean = mean;
+        mean += (x_in - x_out) * inv_n;
+        m2 += (x_in - mean) * (x_in - old_mean) - (x_out - mean) * (x_out - old_mean);
+
+        // Rounding can push M2 a hair below zero on flat stretches
+        out[w] = static_cast<T>(std::sqrt(std::max(m2, 0.0) * inv_n) * annualization_factor);
+    }
+}
+
+template <typename T>
+void scalar(const T* log_returns, size_t num_windows, size_t window_size, T* out)
+{
+    double sum = 0;
+    for (size_t i = 0; i < window_size; ++i) {
+        sum += log_returns[i];
+    }
+    const double mean = sum / static_cast<double>(window_size);
+
+    double m2 = 0;
+    for (size_t i = 0; i < window_size; ++i) {
+        double diff = log_returns[i] - mean;
+        m2 += diff * diff;
+    }
+
+    slide(log_returns, num_windows, window_size, mean, m2, out);
+}
+
+} // namespace
+
+void rolling_vol_slide(const double* log_returns, size_t num_windows, size_t window_size,
+                       double mean, double m2, double* out)
+{
+    slide(log_returns, num_windows, window_size, mean, m2, out);
+}
+
+void rolling_vol_slide(const float* log_returns, size_t num_windows, size_t window_size,
+                       double mean, double m2, float* out)
+{
+    slide(log_returns, num_windows, window_size, mean, m2, out);
+}
+
+void rolling_vol_scalar(const double* log_returns, size_t num_windows, size_t window_size, double* out)
+{
+    scalar(log_returns, num_windows, window_size, out);
+}
+
+void rolling_vol_scalar(const float* log_returns, size_t num_windows, size_t window_size, float* out)
+{
+    scalar(log_returns, num_windows, window_size, out);
+}
+
+namespace {
+
+RollingVolFn resolve_rolling_vol_fn()
+{
+    switch (cpu::detect_simd_level()) {
+#if defined(FINMATH_ARCH_X86)
+        case cpu::SimdLevel::AVX512: return rolling_vol_avx512;
+        case cpu::SimdLevel::AVX2:   return rolling_vol_avx2;
+        case cpu::SimdLevel::SSE42:  return rolling_vol_sse42;
+#elif defined(FINMATH_SSE2NEON)
+        case cpu::SimdLevel::NEON:   return rolling_vol_sse42;
+#elif defined(FINMATH_ARCH_ARM64)
+        case cpu::SimdLevel::NEON:   return rolling_vol_neon;
+#endif
+        default:                     return rolling_vol_scalar;
+    }
+}
+
+RollingVolFnF32 resolve_rolling_vol_fn_f32()
+{
+    switch (cpu::detect_simd_level()) {
+#if defined(FINMATH_ARCH_X86)
+        case cpu::SimdLevel::AVX512: return rolling_vol_avx512;
+        case cpu::SimdLevel::AVX2:   return rolling_vol_avx2;
+#endif
+        default:                     return rolling_vol_scalar;
+    }
+}
 
-    // Validate input
+const RollingVolFn g_rolling_vol_fn = resolve_rolling_vol_fn();
+const RollingVolFnF32 g_rolling_vol_fn_f32 = resolve_rolling_vol_fn_f32();
+
+} // namespace
+
+RollingVolFn rolling_vol_fn()
+{
+    return g_rolling_vol_fn;
+}
+
+RollingVolFnF32 rolling_vol_fn_f32()
+{
+    return g_rolling_vol_fn_f32;
+}
+
+} // namespace timeseries
+} // namespace finmath
+
+namespace {
+
+void validate_rolling_volatility_input(const py::buffer_info& buf_info, size_t window_size)
+{
     if (buf_info.ndim != 1) {
-        throw std::runtime_error("Input must be a 1-dimensional array");
+        throw std::runtime_error("Input array must be 1-dimensional.");
     }
 
     size_t num_prices = static_cast<size_t>(buf_info.shape[0]);
-    
+
     if (num_prices < window_size + 1) {
         throw std::runtime_error("Need at least window_size + 1 prices");
     }
@@ -23,49 +152,181 @@ std::vector<double> rolling_volatility_simd(py::array_t<double> prices_arr, size
         throw std::runtime_error("Window size must be at least 2");
     }
 
-    // Zero-copy access to NumPy data
-    const double* prices_ptr = static_cast<const double*>(buf_info.ptr);
-    
-    if (!prices_ptr) {
+    if (!buf_info.ptr) {
         throw std::runtime_error("Invalid buffer pointer from NumPy array");
     }
+}
+
+// Both precisions use the dispatched (vectorized) log
+bool compute_log_returns_block(const double* prices, size_t num_prices, double* out)
+{
+    return finmath::timeseries::log_returns_fn()(prices, num_prices, out);
+}
+
+bool compute_log_returns_block(const float* prices, size_t num_prices, float* out)
+{
+    return finmath::timeseries::log_returns_fn_f32()(prices, num_prices, out);
+}
+
+// Per-thread log-return buffer, reused across calls: it only ever grows (to at
+// most one tile plus overlap), so repeated calls skip the allocation, the
+// zero-fill and, for buffers past the mmap threshold, the page faults.
+template <typename T>
+T* log_return_scratch(size_t count)
+{
+    thread_local std::vector<T> tls_scratch;
+    if (tls_scratch.size() < count) {
+        tls_scratch.resize(count);
+    }
+    return tls_scratch.data();
+}
+
+// Walk the series in L2-sized tiles. Each tile's log returns are computed into
+// a tile-local buffer that the kernel consumes while it is still hot, and the
+// log returns the next tile's windows still need (up to window_size - 1 of them)
+// are carried to the front of the buffer as the overlap. The kernel re-seeds
+// mean/M2 from that overlap (O(window) per tile), which also keeps sliding-update
+// drift bounded.
+//
+// Several window sizes can share one walk: every tile's log returns are computed
+// once and fed to the kernel once per window size, so a window sweep costs one
+// log pass instead of one per window. volatilities[k] receives the
+// num_prices - window_sizes[k] outputs for window_sizes[k].
+template <typename T>
+void rolling_volatility_tiled(const T* prices_ptr, size_t num_prices, const std::vector<size_t>& window_sizes,
+                              void (*kernel)(const T*, size_t, size_t, T*), T* const* volatilities)
+{
+    constexpr size_t kTileWindows = 65536;
+    const size_t min_window = *std::min_element(window_sizes.begin(), window_sizes.end());
+    const size_t max_window = *std::max_element(window_sizes.begin(), window_sizes.end());
+    const size_t num_log_returns = num_prices - 1;
+    // The smallest window has the most outputs and sets the number of tiles
+    const size_t max_windows = num_prices - min_window;
 
-    // Pre-compute log returns (vectorized)
-    std::vector<double> log_returns(num_prices - 1);
-    
-    for (size_t i = 0; i < num_prices - 1; ++i) {
-        if (prices_ptr[i] <= 0 || prices_ptr[i + 1] <= 0) {
+    T* log_returns = log_return_scratch<T>(std::min(kTileWindows + max_window - 1, num_log_returns));
+
+    // log(prices[first + 1 .. first + count] / prices[first .. first + count - 1]) into dst
+    auto fill_log_returns = [prices_ptr](size_t first, size_t count, T* dst) {
+        if (!compute_log_returns_block(prices_ptr + first, count + 1, dst)) {
             throw std::runtime_error("All prices must be positive for log return calculation");
         }
-        log_returns[i] = std::log(prices_ptr[i + 1] / prices_ptr[i]);
+    };
+
+    // log_returns[0 .. filled - first) holds log returns [first, filled)
+    size_t filled = 0;
+    for (size_t first = 0; first < max_windows; first += kTileWindows) {
+        const size_t needed = std::min(first + kTileWindows + max_window - 1, num_log_returns);
+        if (first > 0) {
+            // Carry the overlap with the previous tile to the front
+            const size_t prev_first = first - kTileWindows;
+            std::copy(log_returns + (first - prev_first), log_returns + (filled - prev_first), log_returns);
+        }
+        fill_log_returns(filled, needed - filled, log_returns + (filled - first));
+        filled = needed;
+
+        for (size_t k = 0; k < window_sizes.size(); ++k) {
+            const size_t window_size = window_sizes[k];
+            const size_t num_windows = num_prices - window_size;
+            if (first < num_windows) {
+                const size_t tile = std::min(kTileWindows, num_windows - first);
+                kernel(log_returns, tile, window_size, volatilities[k] + first);
+            }
+        }
     }
+}
 
-    // Calculate rolling volatility using SIMD
-    std::vector<double> volatilities;
-    size_t num_windows = num_prices - window_size;
-    volatilities.reserve(num_windows);
+} // namespace
 
-    const double annualization_factor = std::sqrt(252.0);
+py::array_t<double> rolling_volatility_simd(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr, size_t window_size)
+{
+    // Get buffer info for zero-copy access
+    py::buffer_info buf_info = prices_arr.request();
+    validate_rolling_volatility_input(buf_info, window_size);
+
+    // Zero-copy access to NumPy data
+    const double* prices_ptr = static_cast<const double*>(buf_info.ptr);
+    size_t num_prices = static_cast<size_t>(buf_info.shape[0]);
 
-    // Use cache-blocked version for large windows or large datasets
-    // Threshold: use cache-blocking if window > 1000 or total data > 100K
-    bool use_cache_blocking = (window_size > 1000) || (num_prices > 100000);
-    
-    for (size_t i = 0; i < num_windows; ++i) {
-        // Get pointer to current window in log returns
-        const double* window_data = &log_returns[i];
-        
-        // SIMD-accelerated standard deviation calculation
-        // Use cache-blocked version for large windows to improve cache utilization
-        double std_dev = use_cache_blocking 
-            ? finmath::simd::vector_stddev_blocked(window_data, window_size)
-            : finmath::simd::vector_stddev(window_data, window_size);
-        
-        // Annualize
-        double volatility = std_dev * annualization_factor;
-        volatilities.push_back(volatility);
+    // Results go straight into the returned array (no list boxing on the way out)
+    py::array_t<double> volatilities(num_prices - window_size);
+    double* out_ptr = volatilities.mutable_data();
+    {
+        // Everything below is plain C++ on the borrowed buffer (buf_info keeps it alive),
+        // so let other Python threads run while the kernel does.
+        py::gil_scoped_release release;
+        rolling_volatility_tiled(prices_ptr, num_prices, {window_size},
+                                 finmath::timeseries::rolling_vol_fn(), &out_ptr);
     }
+    return volatilities;
+}
+
+py::array_t<float> rolling_volatility_simd_f32(py::array_t<float, py::array::c_style | py::array::forcecast> prices_arr,
+                                               size_t window_size)
+{
+    py::buffer_info buf_info = prices_arr.request();
+    validate_rolling_volatility_input(buf_info, window_size);
+
+    const float* prices_ptr = static_cast<const float*>(buf_info.ptr);
+    size_t num_prices = static_cast<size_t>(buf_info.shape[0]);
 
+    py::array_t<float> volatilities(num_prices - window_size);
+    float* out_ptr = volatilities.mutable_data();
+    {
+        py::gil_scoped_release release;
+        rolling_volatility_tiled(prices_ptr, num_prices, {window_size},
+                                 finmath::timeseries::rolling_vol_fn_f32(), &out_ptr);
+    }
     return volatilities;
 }
 
+py::array rolling_volatility_simd_obj(py::object prices, size_t window_size)
+{
+    // Dispatch on dtype alone, so a strided float32 view is made contiguous
+    // as float32 instead of being upcast to float64
+    if (py::isinstance<py::array>(prices) &&
+        py::reinterpret_borrow<py::array>(prices).dtype().is(py::dtype::of<float>())) {
+        return rolling_volatility_simd_f32(prices.cast<py::array_t<float, py::array::c_style | py::array::forcecast>>(),
+                                           window_size);
+    }
+    py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr;
+    try {
+        prices_arr = prices.cast<py::array_t<double, py::array::c_style | py::array::forcecast>>();
+    } catch (const py::cast_error&) {
+        throw py::type_error("prices must be a NumPy array or sequence of numbers");
+    }
+    return rolling_volatility_simd(prices_arr, window_size);
+}
+
+py::list rolling_volatility_multi(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr,
+                                  const std::vector<size_t>& window_sizes)
+{
+    if (window_sizes.empty()) {
+        throw std::runtime_error("At least one window size is required");
+    }
+    py::buffer_info buf_info = prices_arr.request();
+    for (size_t window_size : window_sizes) {
+        validate_rolling_volatility_input(buf_info, window_size);
+    }
+
+    const double* prices_ptr = static_cast<const double*>(buf_info.ptr);
+    size_t num_prices = static_cast<size_t>(buf_info.shape[0]);
+
+    // One output array per window size, all filled by a single walk over the prices
+    std::vector<py::array_t<double>> volatilities;
+    std::vector<double*> out_ptrs;
+    for (size_t window_size : window_sizes) {
+        volatilities.emplace_back(num_prices - window_size);
+        out_ptrs.push_back(volatilities.back().mutable_data());
+    }
+    {
+        py::gil_scoped_release release;
+        rolling_volatility_tiled(prices_ptr, num_prices, window_sizes,
+                                 finmath::timeseries::rolling_vol_fn(), out_ptrs.data());
+    }
+
+    py::list result;
+    for (auto& out : volatilities) {
+        result.append(out);
+    }
+    return result;
+}
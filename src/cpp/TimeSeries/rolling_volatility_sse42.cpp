@@ -0,0 +1,60 @@
+// SSE4.2 rolling volatility kernel. Built with -msse4.2 (see CMakeLists.txt);
+// only reached through rolling_vol_fn() when the CPU reports SSE4.2.
+// On aarch64 builds that find sse2neon.h (FINMATH_SSE2NEON) the same source is
+// translated to NEON and replaces rolling_volatility_neon.cpp.
+#include "finmath/TimeSeries/rolling_volatility_kernels.h"
+
+#if defined(FINMATH_ARCH_X86) || defined(FINMATH_SSE2NEON)
+#if defined(FINMATH_SSE2NEON)
+#include "sse2neon.h"
+#else
+#include <nmmintrin.h>
+#endif
+
+namespace finmath {
+namespace timeseries {
+
+namespace {
+
+// Mean and sum of squared deviations of the first window (2 doubles per iteration)
+void window_moments(const double* x, size_t window_size, double& mean, double& m2)
+{
+    __m128d vsum = _mm_setzero_pd();
+    size_t i = 0;
+    for (; i + 2 <= window_size; i += 2) {
+        vsum = _mm_add_pd(vsum, _mm_loadu_pd(x + i));
+    }
+    double sum = _mm_cvtsd_f64(_mm_add_sd(vsum, _mm_unpackhi_pd(vsum, vsum)));
+    for (; i < window_size; ++i) {
+        sum += x[i];
+    }
+    mean = sum / static_cast<double>(window_size);
+
+    const __m128d vmean = _mm_set1_pd(mean);
+    __m128d vsum_sq = _mm_setzero_pd();
+    i = 0;
+    for (; i + 2 <= window_size; i += 2) {
+        __m128d diff = _mm_sub_pd(_mm_loadu_pd(x + i), vmean);
+        vsum_sq = _mm_add_pd(vsum_sq, _mm_mul_pd(diff, diff));
+    }
+    double sum_sq = _mm_cvtsd_f64(_mm_add_sd(vsum_sq, _mm_unpackhi_pd(vsum_sq, vsum_sq)));
+    for (; i < window_size; ++i) {
+        double diff = x[i] - mean;
+        sum_sq += diff * diff;
+    }
+    m2 = sum_sq;
+}
+
+} // namespace
+
+void rolling_vol_sse42(const double* log_returns, size_t num_windows, size_t window_size, double* out)
+{
+    double mean, m2;
+    window_moments(log_returns, window_size, mean, m2);
+    rolling_vol_slide(log_returns, num_windows, window_size, mean, m2, out);
+}
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // FINMATH_ARCH_X86 || FINMATH_SSE2NEON
@@ -1,9 +1,13 @@
 #include "finmath/TimeSeries/rsi.h"
 #include <pybind11/numpy.h>    // Include numpy header
 #include <pybind11/pybind11.h> // Include core pybind11 header for exceptions
+#include <pybind11/stl.h>      // list -> std::vector conversion
 
+#include <algorithm>
 #include <numeric>
 #include <cmath>
+#include <limits>
+#include <memory>
 
 namespace py = pybind11;
 
@@ -97,8 +101,57 @@ std::vector<double> compute_smoothed_rsi(const std::vector<double> &prices, size
     return rsi_values;
 }
 
+namespace
+{
+// Pointer-based core for the NumPy overload: reads num_prices prices in place and
+// writes num_prices - window_size RSI values (requires num_prices > window_size).
+void smoothed_rsi_kernel(const double *prices_ptr, size_t num_prices, size_t window_size, double *rsi_values)
+{
+    // Everything the loop carries from one price to the next, packed together.
+    // Changes are computed on the fly instead of being staged in gain/loss arrays.
+    struct alignas(32) RsiState
+    {
+        double avg_gain;
+        double avg_loss;
+        double prev;
+    };
+
+    auto rsi_of = [](const RsiState &st)
+    {
+        return (st.avg_loss == 0) ? 100.0 : 100.0 - (100.0 / (1.0 + st.avg_gain / st.avg_loss));
+    };
+
+    // Seed with the simple average of the first window_size gains and losses.
+    // std::max(d, 0.0) compiles to maxsd, so the gain/loss split has no branch.
+    RsiState st{0.0, 0.0, prices_ptr[0]};
+    for (size_t i = 1; i <= window_size; i++)
+    {
+        const double d = prices_ptr[i] - st.prev;
+        st.avg_gain += std::max(d, 0.0);
+        st.avg_loss += std::max(-d, 0.0);
+        st.prev = prices_ptr[i];
+    }
+    const double inv_window = 1.0 / window_size;
+    st.avg_gain *= inv_window;
+    st.avg_loss *= inv_window;
+    rsi_values[0] = rsi_of(st);
+
+    // Wilder smoothing, avg = (avg * (n - 1) + x) / n, with the divide hoisted out of
+    // the carried dependency: one multiply-add per step instead of a divide
+    const double decay = (window_size - 1) * inv_window;
+    for (size_t i = window_size + 1; i < num_prices; i++)
+    {
+        const double d = prices_ptr[i] - st.prev;
+        st.avg_gain = st.avg_gain * decay + std::max(d, 0.0) * inv_window;
+        st.avg_loss = st.avg_loss * decay + std::max(-d, 0.0) * inv_window;
+        st.prev = prices_ptr[i];
+        rsi_values[i - window_size] = rsi_of(st);
+    }
+}
+} // namespace
+
 // Implementation for the NumPy array version
-std::vector<double> compute_smoothed_rsi_np(py::array_t<double> prices_arr, size_t window_size)
+py::array_t<double> compute_smoothed_rsi_np(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr, size_t window_size)
 {
     py::buffer_info buf_info = prices_arr.request();
 
@@ -110,66 +163,56 @@ std::vector<double> compute_smoothed_rsi_np(py::array_t<double> prices_arr, size
 
     if (num_prices <= window_size)
     { // Need > window_size prices for window_size changes
-        // Return empty vector if not enough data
+        // Return empty array if not enough data
         // Could also throw: throw std::runtime_error("Insufficient data for the given window size.");
-        return {};
+        return py::array_t<double>(0);
     }
     if (window_size < 1)
     {
         throw std::runtime_error("Window size must be at least 1.");
     }
 
+    // Read the input buffer in place and write straight into the returned array
     const double *prices_ptr = static_cast<const double *>(buf_info.ptr);
+    py::array_t<double> rsi_values(num_prices - window_size);
+    double *rsi_ptr = rsi_values.mutable_data();
+    {
+        // Pure C++ on raw pointers: no Python objects are touched until the GIL is back
+        py::gil_scoped_release release;
+        smoothed_rsi_kernel(prices_ptr, num_prices, window_size, rsi_ptr);
+    }
 
-    // --- Replicate logic using pointers ---
-    std::vector<double> rsi_values;
-    std::vector<double> price_changes;
-    price_changes.reserve(num_prices - 1);
+    return rsi_values;
+}
 
-    for (size_t i = 1; i < num_prices; i++)
+// Single Python entry point, like rolling_volatility: NumPy arrays (any layout) and
+// Pandas Series go to the buffer path; other sequences run the std::vector
+// implementation, whose buffer is handed to NumPy through a capsule so no
+// per-element Python floats are created and nothing is copied.
+py::array_t<double> compute_smoothed_rsi_obj(py::object prices, size_t window_size)
+{
+    if (!py::isinstance<py::array>(prices) && py::hasattr(prices, "values"))
     {
-        price_changes.push_back(prices_ptr[i] - prices_ptr[i - 1]);
+        prices = prices.attr("values");
     }
-
-    // Note: The original compute_avg_gain/loss need modifying or
-    //       we compute the initial gain/loss directly here.
-    // Compute initial avg gain/loss directly from price_changes vector
-    double initial_gain = 0.0;
-    double initial_loss = 0.0;
-    for (size_t i = 0; i < window_size; ++i)
+    if (py::isinstance<py::array>(prices))
     {
-        if (price_changes[i] > 0)
-            initial_gain += price_changes[i];
-        else
-            initial_loss += (-1 * price_changes[i]);
+        return compute_smoothed_rsi_np(prices.cast<py::array_t<double, py::array::c_style | py::array::forcecast>>(), window_size);
     }
-    double avg_gain = initial_gain / window_size;
-    double avg_loss = initial_loss / window_size;
-
-    double rs = (avg_loss == 0) ? std::numeric_limits<double>::infinity() : avg_gain / avg_loss;
-    double rsi = (avg_loss == 0) ? 100.0 : 100.0 - (100.0 / (1.0 + rs));
-
-    rsi_values.push_back(rsi);
-    rsi_values.reserve(num_prices - window_size); // Reserve estimated size
-
-    // Compute subsequent smoothed RSI values
-    for (size_t i = window_size; i < price_changes.size(); i++)
+    std::vector<double> values;
+    try
     {
-        double change = price_changes[i];
-
-        avg_gain = (avg_gain * (window_size - 1) + (change > 0 ? change : 0)) / window_size;
-        avg_loss = (avg_loss * (window_size - 1) + (change < 0 ? -change : 0)) / window_size; // Fixed: was subtracting negative change
-
-        if (avg_loss == 0)
-        {
-            rsi_values.push_back(100.0);
-            continue;
-        }
-
-        rs = avg_gain / avg_loss;
-        rsi = 100.0 - (100.0 / (1.0 + rs));
-        rsi_values.push_back(rsi);
+        values = prices.cast<std::vector<double>>();
+    }
+    catch (const py::cast_error &)
+    {
+        throw py::type_error("prices must be a list, NumPy array or Pandas Series of numbers");
     }
 
-    return rsi_values;
+    auto rsi_values = std::make_unique<std::vector<double>>(compute_smoothed_rsi(values, window_size));
+    py::capsule owner(rsi_values.get(), [](void *p)
+                      { delete static_cast<std::vector<double> *>(p); });
+    // The capsule owns the vector from here on (and frees it if the array constructor throws)
+    std::vector<double> *result = rsi_values.release();
+    return py::array_t<double>(result->size(), result->data(), owner);
 }
@@ -5,20 +5,20 @@
 #include <vector>
 #include <limits>
 
-std::vector<double> compute_smoothed_rsi_simd(py::array_t<double> prices_arr, size_t window_size)
+py::array_t<double> compute_smoothed_rsi_simd(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr, size_t window_size)
 {
     // Get buffer info for zero-copy access
     py::buffer_info buf_info = prices_arr.request();
 
     // Validate input
     if (buf_info.ndim != 1) {
-        throw std::runtime_error("Input must be a 1-dimensional array");
+        throw std::runtime_error("Input array must be 1-dimensional.");
     }
 
     size_t num_prices = static_cast<size_t>(buf_info.shape[0]);
     
     if (num_prices <= window_size) {
-        return {};
+        return py::array_t<double>(0);
     }
     
     if (window_size < 1) {
@@ -32,52 +32,52 @@ std::vector<double> compute_smoothed_rsi_simd(py::array_t<double> prices_arr, si
         throw std::runtime_error("Invalid buffer pointer from NumPy array");
     }
 
-    // Pre-compute price changes
-    // Note: Cannot use vector_sub directly due to offset (prices[i+1] - prices[i])
-    // This is a sequential operation, but we'll use SIMD for the gain/loss calculations
-    std::vector<double> price_changes(num_prices - 1);
-    for (size_t i = 0; i < num_prices - 1; ++i) {
-        price_changes[i] = prices_ptr[i + 1] - prices_ptr[i];
+    // Split price changes into separate gain and loss arrays (structure of arrays)
+    // in one SIMD pass; the smoothing loop below then streams two flat buffers
+    // instead of re-branching on the sign of every change.
+    // Both live in one per-thread scratch buffer that is reused across calls
+    // (grown, never shrunk), so repeated calls do not allocate.
+    const size_t num_changes = num_prices - 1;
+    thread_local std::vector<double> tls_scratch;
+    if (tls_scratch.size() < 2 * num_changes) {
+        tls_scratch.resize(2 * num_changes);
     }
+    double* gains = tls_scratch.data();
+    double* losses = gains + num_changes;
+    finmath::simd::vector_gains_losses(prices_ptr, num_prices, gains, losses);
 
     // Compute initial average gain and loss using SIMD
-    const double* initial_window = price_changes.data();
-    
-    // SIMD-accelerated conditional sums
-    double initial_gain = finmath::simd::vector_conditional_sum(initial_window, window_size, true);
-    double initial_loss = finmath::simd::vector_conditional_sum(initial_window, window_size, false);
+    double initial_gain = finmath::simd::vector_sum(gains, window_size);
+    double initial_loss = finmath::simd::vector_sum(losses, window_size);
     
     double avg_gain = initial_gain / static_cast<double>(window_size);
     double avg_loss = initial_loss / static_cast<double>(window_size);
 
     // Calculate first RSI value
-    std::vector<double> rsi_values;
-    rsi_values.reserve(num_prices - window_size);
-    
+    py::array_t<double> result(num_prices - window_size);
+    double* rsi_values = result.mutable_data();
+
     double rs = (avg_loss == 0) ? std::numeric_limits<double>::infinity() : avg_gain / avg_loss;
     double rsi = (avg_loss == 0) ? 100.0 : 100.0 - (100.0 / (1.0 + rs));
-    rsi_values.push_back(rsi);
+    rsi_values[0] = rsi;
 
     // Compute subsequent smoothed RSI values
-    // Note: The smoothing calculation is sequential (each depends on previous),
-    // but we've optimized the initial gain/loss calculation with SIMD
-    for (size_t i = window_size; i < price_changes.size(); ++i) {
-        double change = price_changes[i];
-
+    // Note: The smoothing calculation is sequential (each depends on previous)
+    for (size_t i = window_size; i < num_changes; ++i) {
         // Smoothed average: new_avg = (old_avg * (n-1) + new_value) / n
-        avg_gain = (avg_gain * (window_size - 1) + (change > 0 ? change : 0)) / window_size;
-        avg_loss = (avg_loss * (window_size - 1) + (change < 0 ? -change : 0)) / window_size;
+        avg_gain = (avg_gain * (window_size - 1) + gains[i]) / window_size;
+        avg_loss = (avg_loss * (window_size - 1) + losses[i]) / window_size;
 
         if (avg_loss == 0) {
-            rsi_values.push_back(100.0);
+            rsi_values[i - window_size + 1] = 100.0;
             continue;
         }
 
         rs = avg_gain / avg_loss;
         rsi = 100.0 - (100.0 / (1.0 + rs));
-        rsi_values.push_back(rsi);
+        rsi_values[i - window_size + 1] = rsi;
     }
 
-    return rsi_values;
+    return result;
 }
 
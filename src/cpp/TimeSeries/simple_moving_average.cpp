@@ -1,6 +1,8 @@
 #include "finmath/TimeSeries/simple_moving_average.h"
+#include "finmath/TimeSeries/sma_kernels.h"
 #include <pybind11/numpy.h>    // Include numpy header
 #include <pybind11/pybind11.h> // Include core pybind11 header for exceptions
+#include <pybind11/stl.h>      // list -> std::vector conversion
 
 #include <numeric>
 #include <vector>
@@ -9,8 +11,6 @@ namespace py = pybind11;
 
 std::vector<double> simple_moving_average(const std::vector<double> &data, size_t window_size)
 {
-    std::vector<double> averages;
-
     // Check for valid window size
     if (window_size == 0)
     {
@@ -22,31 +22,98 @@ std::vector<double> simple_moving_average(const std::vector<double> &data, size_
         return {};
     }
 
-    // Compute moving averages using a sliding window
-    for (size_t i = 0; i <= data.size() - window_size; ++i)
+    std::vector<double> averages(data.size() - window_size + 1);
+    simple_moving_average(data.data(), data.size(), window_size, averages.data());
+    return averages;
+}
+
+void simple_moving_average(const double *data, size_t num_data, size_t window_size, double *averages)
+{
+    finmath::timeseries::sma_fn()(data, num_data, window_size, averages);
+}
+
+namespace finmath {
+namespace timeseries {
+
+void sma_scalar(const double *data, size_t num_data, size_t window_size, double *averages)
+{
+    // Seed with the first window, then slide: add the entering value, drop the leaving one.
+    // Each input is read twice in total instead of window_size times.
+    const double inv_window = 1.0 / static_cast<double>(window_size);
+    double current_sum = std::accumulate(data, data + window_size, 0.0);
+    averages[0] = current_sum * inv_window;
+
+    for (size_t i = window_size; i < num_data; ++i)
     {
-        // Calculate the sum of the current window
-        double sum = std::accumulate(data.begin() + i, data.begin() + i + window_size, 0.0);
+        current_sum += data[i] - data[i - window_size];
+        averages[i - window_size + 1] = current_sum * inv_window;
+    }
+}
+
+void sma_scalar(const float *data, size_t num_data, size_t window_size, float *averages)
+{
+    const double inv_window = 1.0 / static_cast<double>(window_size);
+    double current_sum = std::accumulate(data, data + window_size, 0.0);
+    averages[0] = static_cast<float>(current_sum * inv_window);
 
-        // Compute the average and store it
-        double avg = sum / static_cast<double>(window_size);
-        averages.push_back(avg);
+    for (size_t i = window_size; i < num_data; ++i)
+    {
+        current_sum += static_cast<double>(data[i]) - static_cast<double>(data[i - window_size]);
+        averages[i - window_size + 1] = static_cast<float>(current_sum * inv_window);
     }
+}
 
-    return averages;
+namespace {
+
+SmaFn resolve_sma_fn()
+{
+    switch (cpu::detect_simd_level()) {
+#if defined(FINMATH_ARCH_X86)
+        case cpu::SimdLevel::AVX512: return sma_avx512;
+        case cpu::SimdLevel::AVX2:   return sma_avx2;
+#endif
+        default:                     return sma_scalar;
+    }
 }
 
-// Implementation for the NumPy array version
-std::vector<double> simple_moving_average_np(py::array_t<double> data_arr, size_t window_size)
+SmaFnF32 resolve_sma_fn_f32()
+{
+    switch (cpu::detect_simd_level()) {
+#if defined(FINMATH_ARCH_X86)
+        case cpu::SimdLevel::AVX512: return sma_avx512;
+        case cpu::SimdLevel::AVX2:   return sma_avx2;
+#endif
+        default:                     return sma_scalar;
+    }
+}
+
+const SmaFn g_sma_fn = resolve_sma_fn();
+const SmaFnF32 g_sma_fn_f32 = resolve_sma_fn_f32();
+
+} // namespace
+
+SmaFn sma_fn()
+{
+    return g_sma_fn;
+}
+
+SmaFnF32 sma_fn_f32()
 {
-    py::buffer_info buf_info = data_arr.request();
+    return g_sma_fn_f32;
+}
 
-    if (buf_info.ndim != 1)
+} // namespace timeseries
+} // namespace finmath
+
+// Implementation for the NumPy array version
+std::vector<double> simple_moving_average_np(py::array_t<double, py::array::c_style | py::array::forcecast> data_arr, size_t window_size)
+{
+    if (data_arr.ndim() != 1)
     {
         throw std::runtime_error("Input array must be 1-dimensional.");
     }
 
-    size_t num_data = buf_info.size;
+    size_t num_data = static_cast<size_t>(data_arr.shape(0));
 
     if (window_size == 0)
     {
@@ -60,20 +127,34 @@ std::vector<double> simple_moving_average_np(py::array_t<double> data_arr, size_
         return {};
     }
 
-    const double *data_ptr = static_cast<const double *>(buf_info.ptr);
-    std::vector<double> averages;
-    averages.reserve(num_data - window_size + 1);
+    std::vector<double> averages(num_data - window_size + 1);
+    simple_moving_average(data_arr.data(), num_data, window_size, averages.data());
 
-    // Compute moving averages using a sliding window over the pointer
-    double current_sum = std::accumulate(data_ptr, data_ptr + window_size, 0.0);
-    averages.push_back(current_sum / static_cast<double>(window_size));
+    return averages;
+}
 
-    for (size_t i = window_size; i < num_data; ++i)
+// Single Python entry point. NumPy arrays and anything exposing a NumPy array as
+// .values (Pandas Series/Index) go straight to the buffer path above; a float64
+// Series' .values is its own storage, so nothing is copied or iterated. Only
+// other sequences (plain lists) are converted element-by-element.
+std::vector<double> simple_moving_average_obj(py::object data, size_t window_size)
+{
+    if (!py::isinstance<py::array>(data) && py::hasattr(data, "values"))
     {
-        current_sum += data_ptr[i] - data_ptr[i - window_size]; // More efficient sliding window sum
-        double avg = current_sum / static_cast<double>(window_size);
-        averages.push_back(avg);
+        data = data.attr("values");
     }
-
-    return averages;
+    if (py::isinstance<py::array>(data))
+    {
+        return simple_moving_average_np(data.cast<py::array_t<double, py::array::c_style | py::array::forcecast>>(), window_size);
+    }
+    std::vector<double> values;
+    try
+    {
+        values = data.cast<std::vector<double>>();
+    }
+    catch (const py::cast_error &)
+    {
+        throw py::type_error("prices must be a list, NumPy array or Pandas Series of numbers");
+    }
+    return simple_moving_average(values, window_size);
 }
@@ -1,16 +1,31 @@
 #include "finmath/TimeSeries/simple_moving_average_simd.h"
-#include "finmath/Helper/simd_helper.h"
+#include "finmath/TimeSeries/sma_kernels.h"
 #include <cmath>
 #include <stdexcept>
 
-std::vector<double> simple_moving_average_simd(py::array_t<double> data_arr, size_t window_size)
+namespace {
+
+// Both precisions run the kernel selected for the CPU (blocked prefix-sum scan
+// on AVX2/AVX-512); float32 data is summed in double inside the kernel.
+void sliding_average(const double* data, size_t num_data, size_t window_size, double* averages)
+{
+    finmath::timeseries::sma_fn()(data, num_data, window_size, averages);
+}
+
+void sliding_average(const float* data, size_t num_data, size_t window_size, float* averages)
+{
+    finmath::timeseries::sma_fn_f32()(data, num_data, window_size, averages);
+}
+
+template <typename T>
+py::array_t<T> sma_simd_impl(py::array_t<T, py::array::c_style | py::array::forcecast> data_arr, size_t window_size)
 {
     // Get buffer info for zero-copy access
     py::buffer_info buf_info = data_arr.request();
 
     // Validate input
     if (buf_info.ndim != 1) {
-        throw std::runtime_error("Input must be a 1-dimensional array");
+        throw std::runtime_error("Input array must be 1-dimensional.");
     }
 
     size_t num_data = static_cast<size_t>(buf_info.shape[0]);
@@ -20,41 +35,50 @@ std::vector<double> simple_moving_average_simd(py::array_t<double> data_arr, siz
     }
 
     if (num_data < window_size) {
-        return {};
+        return py::array_t<T>(0);
     }
 
     // Zero-copy access to NumPy data
-    const double* data_ptr = static_cast<const double*>(buf_info.ptr);
+    const T* data_ptr = static_cast<const T*>(buf_info.ptr);
     
     if (!data_ptr) {
         throw std::runtime_error("Invalid buffer pointer from NumPy array");
     }
 
-    // Calculate moving averages using SIMD
-    std::vector<double> averages;
+    // Running window sum: the first window is summed once, then each step adds
+    // the entering value and drops the leaving one (O(1) per output)
     size_t num_windows = num_data - window_size + 1;
-    averages.reserve(num_windows);
+    py::array_t<T> result(num_windows);
+    sliding_average(data_ptr, num_data, window_size, result.mutable_data());
 
-    // Use cache-blocked version for large windows or large datasets
-    // Threshold: use cache-blocking if window > 1000 or total data > 100K
-    bool use_cache_blocking = (window_size > 1000) || (num_data > 100000);
-    
-    // Use SIMD-accelerated sum for each window
-    for (size_t i = 0; i < num_windows; ++i) {
-        // Get pointer to current window
-        const double* window_data = &data_ptr[i];
-        
-        // SIMD-accelerated sum calculation
-        // Use cache-blocked version for large windows to improve cache utilization
-        double sum = use_cache_blocking
-            ? finmath::simd::vector_sum_blocked(window_data, window_size)
-            : finmath::simd::vector_sum(window_data, window_size);
-        
-        // Compute average
-        double avg = sum / static_cast<double>(window_size);
-        averages.push_back(avg);
-    }
+    return result;
+}
 
-    return averages;
+} // namespace
+
+py::array_t<double> simple_moving_average_simd(py::array_t<double, py::array::c_style | py::array::forcecast> data_arr, size_t window_size)
+{
+    return sma_simd_impl<double>(data_arr, window_size);
+}
+
+py::array_t<float> simple_moving_average_simd_f32(py::array_t<float, py::array::c_style | py::array::forcecast> data_arr, size_t window_size)
+{
+    return sma_simd_impl<float>(data_arr, window_size);
 }
 
+py::array simple_moving_average_simd_obj(py::object data, size_t window_size)
+{
+    // Same dtype-only dispatch as rolling_volatility_simd_obj()
+    if (py::isinstance<py::array>(data) &&
+        py::reinterpret_borrow<py::array>(data).dtype().is(py::dtype::of<float>())) {
+        return simple_moving_average_simd_f32(data.cast<py::array_t<float, py::array::c_style | py::array::forcecast>>(),
+                                              window_size);
+    }
+    py::array_t<double, py::array::c_style | py::array::forcecast> data_arr;
+    try {
+        data_arr = data.cast<py::array_t<double, py::array::c_style | py::array::forcecast>>();
+    } catch (const py::cast_error&) {
+        throw py::type_error("data must be a NumPy array or sequence of numbers");
+    }
+    return simple_moving_average_simd(data_arr, window_size);
+}
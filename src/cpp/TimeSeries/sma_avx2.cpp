@@ -0,0 +1,68 @@
+// AVX2 SMA kernel. Built with -mavx2 (see CMakeLists.txt);
+// only reached through sma_fn() when the CPU reports AVX2.
+#include "finmath/TimeSeries/sma_kernels.h"
+
+#if defined(FINMATH_ARCH_X86)
+#include <immintrin.h>
+
+namespace finmath {
+namespace timeseries {
+
+namespace {
+
+// float data is widened on load and narrowed on store; the scan and the carried sum stay in double
+inline __m256d load4(const double* p) { return _mm256_loadu_pd(p); }
+inline __m256d load4(const float* p) { return _mm256_cvtps_pd(_mm_loadu_ps(p)); }
+inline void store4(double* p, __m256d v) { _mm256_storeu_pd(p, v); }
+inline void store4(float* p, __m256d v) { _mm_storeu_ps(p, _mm256_cvtpd_ps(v)); }
+
+template <typename T>
+void blocked_scan(const T* data, size_t num_data, size_t window_size, T* averages)
+{
+    constexpr size_t B = 4;
+    const double inv_window = 1.0 / static_cast<double>(window_size);
+    const __m256d inv = _mm256_set1_pd(inv_window);
+    const __m256d zero = _mm256_setzero_pd();
+
+    double sum = 0.0;
+    for (size_t i = 0; i < window_size; ++i) {
+        sum += data[i];
+    }
+    averages[0] = static_cast<T>(sum * inv_window);
+
+    // i indexes the entering value; block outputs go to averages[i - window_size + 1 ..]
+    __m256d carry = _mm256_set1_pd(sum);
+    size_t i = window_size;
+    for (; i + B <= num_data; i += B) {
+        __m256d d = _mm256_sub_pd(load4(data + i), load4(data + i - window_size));
+        // Inclusive prefix sum across the 4 lanes: shift by one lane, then by two
+        d = _mm256_add_pd(d, _mm256_blend_pd(zero, _mm256_permute4x64_pd(d, 0x90), 0xE));
+        d = _mm256_add_pd(d, _mm256_blend_pd(zero, _mm256_permute4x64_pd(d, 0x40), 0xC));
+        store4(averages + (i - window_size + 1), _mm256_mul_pd(_mm256_add_pd(carry, d), inv));
+        // Next block's carry, already broadcast: the shuffle works on d, off the carried chain
+        carry = _mm256_add_pd(carry, _mm256_permute4x64_pd(d, 0xFF));
+    }
+
+    sum = _mm256_cvtsd_f64(carry);
+    for (; i < num_data; ++i) {
+        sum += static_cast<double>(data[i]) - static_cast<double>(data[i - window_size]);
+        averages[i - window_size + 1] = static_cast<T>(sum * inv_window);
+    }
+}
+
+} // namespace
+
+void sma_avx2(const double* data, size_t num_data, size_t window_size, double* averages)
+{
+    blocked_scan(data, num_data, window_size, averages);
+}
+
+void sma_avx2(const float* data, size_t num_data, size_t window_size, float* averages)
+{
+    blocked_scan(data, num_data, window_size, averages);
+}
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // FINMATH_ARCH_X86
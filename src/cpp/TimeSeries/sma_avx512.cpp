@@ -0,0 +1,73 @@
+// AVX-512 SMA kernel. Built with -mavx512f (see CMakeLists.txt);
+// only reached through sma_fn() when the CPU reports AVX-512F.
+#include "finmath/TimeSeries/sma_kernels.h"
+
+#if defined(FINMATH_ARCH_X86)
+#include <immintrin.h>
+
+namespace finmath {
+namespace timeseries {
+
+namespace {
+
+// float data is widened on load and narrowed on store; the scan and the carried sum stay in double
+inline __m512d load8(const double* p) { return _mm512_loadu_pd(p); }
+inline __m512d load8(const float* p) { return _mm512_cvtps_pd(_mm256_loadu_ps(p)); }
+inline void store8(double* p, __m512d v) { _mm512_storeu_pd(p, v); }
+inline void store8(float* p, __m512d v) { _mm256_storeu_ps(p, _mm512_cvtpd_ps(v)); }
+
+template <typename T>
+void blocked_scan(const T* data, size_t num_data, size_t window_size, T* averages)
+{
+    constexpr size_t B = 8;
+    const double inv_window = 1.0 / static_cast<double>(window_size);
+    const __m512d inv = _mm512_set1_pd(inv_window);
+    // Lane k takes lane k - s (masked to zero for k < s) for shifts s = 1, 2, 4
+    const __m512i shift1 = _mm512_set_epi64(6, 5, 4, 3, 2, 1, 0, 0);
+    const __m512i shift2 = _mm512_set_epi64(5, 4, 3, 2, 1, 0, 0, 0);
+    const __m512i shift4 = _mm512_set_epi64(3, 2, 1, 0, 0, 0, 0, 0);
+    const __m512i last = _mm512_set1_epi64(7);
+
+    double sum = 0.0;
+    for (size_t i = 0; i < window_size; ++i) {
+        sum += data[i];
+    }
+    averages[0] = static_cast<T>(sum * inv_window);
+
+    // i indexes the entering value; block outputs go to averages[i - window_size + 1 ..]
+    __m512d carry = _mm512_set1_pd(sum);
+    size_t i = window_size;
+    for (; i + B <= num_data; i += B) {
+        __m512d d = _mm512_sub_pd(load8(data + i), load8(data + i - window_size));
+        // Inclusive prefix sum across the 8 lanes in three shift-and-add steps
+        d = _mm512_add_pd(d, _mm512_maskz_permutexvar_pd(0xFE, shift1, d));
+        d = _mm512_add_pd(d, _mm512_maskz_permutexvar_pd(0xFC, shift2, d));
+        d = _mm512_add_pd(d, _mm512_maskz_permutexvar_pd(0xF0, shift4, d));
+        store8(averages + (i - window_size + 1), _mm512_mul_pd(_mm512_add_pd(carry, d), inv));
+        // Next block's carry, already broadcast: the shuffle works on d, off the carried chain
+        carry = _mm512_add_pd(carry, _mm512_permutexvar_pd(last, d));
+    }
+
+    sum = _mm512_cvtsd_f64(carry);
+    for (; i < num_data; ++i) {
+        sum += static_cast<double>(data[i]) - static_cast<double>(data[i - window_size]);
+        averages[i - window_size + 1] = static_cast<T>(sum * inv_window);
+    }
+}
+
+} // namespace
+
+void sma_avx512(const double* data, size_t num_data, size_t window_size, double* averages)
+{
+    blocked_scan(data, num_data, window_size, averages);
+}
+
+void sma_avx512(const float* data, size_t num_data, size_t window_size, float* averages)
+{
+    blocked_scan(data, num_data, window_size, averages);
+}
+
+} // namespace timeseries
+} // namespace finmath
+
+#endif // FINMATH_ARCH_X86
@@ -11,6 +11,8 @@
 #include "finmath/OptionPricing/binomial_tree.h"
 #include "finmath/TimeSeries/rolling_volatility.h"
 #include "finmath/TimeSeries/rolling_volatility_simd.h"
+#include "finmath/TimeSeries/rolling_statistics.h"
+#include "finmath/TimeSeries/price_path.h"
 #include "finmath/TimeSeries/simple_moving_average.h"
 #include "finmath/TimeSeries/simple_moving_average_simd.h"
 #include "finmath/TimeSeries/rsi.h"
@@ -24,9 +26,13 @@
 namespace py = pybind11;
 
 // Forward declarations for NumPy-compatible functions
-std::vector<double> rolling_volatility_np(py::array_t<double> prices_arr, size_t window_size);
-std::vector<double> simple_moving_average_np(py::array_t<double> data_arr, size_t window_size);
-std::vector<double> compute_smoothed_rsi_np(py::array_t<double> prices_arr, size_t window_size);
+std::vector<double> rolling_volatility_np(py::array_t<double, py::array::c_style | py::array::forcecast> prices_arr, size_t window_size);
+std::vector<double> rolling_volatility_obj(py::object prices, size_t window_size);
+std::vector<double> simple_moving_average_np(py::array_t<double, py::array::c_style | py::array::forcecast> data_arr, size_t window_size);
+std::vector<double> simple_moving_average_obj(py::object data, size_t window_size);
+py::array_t<double> compute_smoothed_rsi_obj(py::object prices, size_t window_size);
+py::object compute_ema_obj(py::object prices, size_t window);
+py::object compute_ema_with_smoothing_obj(py::object prices, double smoothing_factor);
 
 PYBIND11_MODULE(finmath, m)
 {
@@ -51,35 +57,48 @@ PYBIND11_MODULE(finmath, m)
             py::arg("type"), py::arg("S0"), py::arg("K"), py::arg("T"), py::arg("r"), py::arg("sigma"), py::arg("N"));
 
       // Bind rolling volatility
-      m.def("rolling_volatility", &rolling_volatility, "Rolling Volatility (List input)",
+      // One entry, like simple_moving_average: with separate overloads, any array the
+      // c_style overload rejects without conversion (strided or Fortran-ordered views)
+      // would match the std::vector overload and be unboxed element by element
+      m.def("rolling_volatility", &rolling_volatility_obj, "Rolling Volatility (list, NumPy or Pandas input)",
             py::arg("prices"), py::arg("window_size"));
-      m.def("rolling_volatility", &rolling_volatility_np, "Rolling Volatility (NumPy/Pandas input)",
+      // One entry that dispatches on dtype: float32 arrays (strided views included)
+      // stay float32, everything else (lists, ints, float64) is converted to float64
+      m.def("rolling_volatility_simd", &rolling_volatility_simd_obj, "Rolling Volatility (SIMD-optimized, zero-copy NumPy)",
             py::arg("prices"), py::arg("window_size"));
-      m.def("rolling_volatility_simd", &rolling_volatility_simd, "Rolling Volatility (SIMD-optimized, zero-copy NumPy)",
+      m.def("rolling_volatility_multi", &rolling_volatility_multi, "Rolling Volatility for several window sizes in one pass (NumPy input)",
+            py::arg("prices"), py::arg("window_sizes"));
+      m.def("rolling_volatility_simd_f32", &rolling_volatility_simd_f32, "Rolling Volatility (SIMD-optimized, float32)",
             py::arg("prices"), py::arg("window_size"));
 
       // Bind simple moving average
-      m.def("simple_moving_average", &simple_moving_average, "Simple Moving Average (List input)",
+      // One entry for lists, NumPy arrays and Pandas Series: a std::vector overload
+      // would also accept float64 arrays/Series (their elements are float subclasses)
+      // and unbox them one by one, so arrays and .values are routed to the buffer path
+      m.def("simple_moving_average", &simple_moving_average_obj, "Simple Moving Average (list, NumPy or Pandas input)",
             py::arg("prices"), py::arg("window_size"));
-      m.def("simple_moving_average", &simple_moving_average_np, "Simple Moving Average (NumPy/Pandas input)",
-            py::arg("prices"), py::arg("window_size"));
-      m.def("simple_moving_average_simd", &simple_moving_average_simd, "Simple Moving Average (SIMD-optimized, zero-copy NumPy)",
+
+      // Same dtype dispatch as rolling_volatility_simd
+      m.def("simple_moving_average_simd", &simple_moving_average_simd_obj, "Simple Moving Average (SIMD-optimized, zero-copy NumPy)",
             py::arg("prices"), py::arg("window_size"));
 
       // Bind RSI
-      m.def("smoothed_rsi", &compute_smoothed_rsi, "Relative Strength Index(RSI) (List input)",
-            py::arg("prices"), py::arg("window_size"));
-      m.def("smoothed_rsi", &compute_smoothed_rsi_np, "Relative Strength Index(RSI) (NumPy/Pandas input)",
+      // One entry, like rolling_volatility: arrays of any layout and Pandas Series take
+      // the buffer path, other sequences the std::vector path. Both return a NumPy array
+      // (call .tolist() for a list).
+      m.def("smoothed_rsi", &compute_smoothed_rsi_obj, "Relative Strength Index(RSI) (list, NumPy or Pandas input)",
             py::arg("prices"), py::arg("window_size"));
       m.def("smoothed_rsi_simd", &compute_smoothed_rsi_simd, "Relative Strength Index (SIMD-optimized, zero-copy NumPy)",
             py::arg("prices"), py::arg("window_size"));
 
       // Bind EMA (window)
-      m.def("ema_window", &compute_ema, "Exponential Moving Average - Window (List input)",
+      // One entry, like rolling_volatility: NumPy arrays return an array, any other
+      // sequence (list, tuple, Pandas Series) keeps the list result
+      m.def("ema_window", &compute_ema_obj, "Exponential Moving Average - Window (list, NumPy or Pandas input)",
             py::arg("prices"), py::arg("window_size"));
 
       // Bind EMA (smoothing factor)
-      m.def("ema_smoothing", &compute_ema_with_smoothing, "Exponential Moving Average - Smoothing Factor (List input)",
+      m.def("ema_smoothing", &compute_ema_with_smoothing_obj, "Exponential Moving Average - Smoothing Factor (list, NumPy or Pandas input)",
             py::arg("prices"), py::arg("smoothing_factor"));
 
       // Bind SIMD-optimized EMA
@@ -88,8 +107,21 @@ PYBIND11_MODULE(finmath, m)
       m.def("ema_smoothing_simd", &compute_ema_with_smoothing_simd, "Exponential Moving Average - Smoothing Factor (SIMD-optimized, zero-copy NumPy)",
             py::arg("prices"), py::arg("smoothing_factor"));
 
+      // Fused SMA / rolling variance / EMA (one pass over the prices); also bound as
+      // rolling_statistics
+      m.def("rolling_statistics_np", &rolling_statistics_np, "Rolling mean, sample variance and EMA in a single pass (NumPy input); returns a dict of arrays",
+            py::arg("prices"), py::arg("window_size"));
+      m.def("rolling_statistics", &rolling_statistics_np, "Rolling mean, sample variance and EMA in a single pass (NumPy input); returns a dict of arrays",
+            py::arg("prices"), py::arg("window_size"));
+      m.def("rolling_variance", &rolling_variance_np, "Rolling sample variance (the \"var\" entry of rolling_statistics_np)",
+            py::arg("prices"), py::arg("window_size"));
+
+      // Simulated GBM price path (test fixtures and benchmarks)
+      m.def("make_price_path", &make_price_path, "Geometric Brownian motion price path: s0 * exp(cumsum(normal(drift, vol, n)))",
+            py::arg("n"), py::arg("drift"), py::arg("vol"), py::arg("seed"), py::arg("s0") = 100.0);
+
       // Utility function to get SIMD backend
-      m.def("get_simd_backend", &finmath::simd::get_simd_backend, "Get the active SIMD backend (AVX, SSE, NEON, or Scalar)");
+      m.def("get_simd_backend", &finmath::simd::get_simd_backend, "Get the SIMD backend selected at runtime (AVX-512, AVX2, SSE4.2, NEON, or Scalar)");
 
       // Bellman-based arbitrage detection (from main)
       m.def("detect_arbitrage", &detectArbitrageBellman<std::string>,
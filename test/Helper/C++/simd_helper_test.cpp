@@ -177,6 +177,19 @@ int main() {
         std::cout << "✓ Test 17 (Large Vector Operations) Passed" << std::endl;
     }
 
+    // Test 18: Cache-blocked variance (several chunks plus a ragged tail)
+    {
+        constexpr size_t large_size = 10003;
+        std::vector<double> large_a(large_size);
+        for (size_t i = 0; i < large_size; ++i) {
+            large_a[i] = static_cast<double>(i % 7) - 3.0;
+        }
+        const double expected = finmath::simd::vector_variance(large_a.data(), large_size);
+        FINMATH_TEST_ASSERT_NEAR(finmath::simd::vector_variance_blocked(large_a.data(), large_size, 1024), expected, kEpsilon);
+        FINMATH_TEST_ASSERT_NEAR(finmath::simd::vector_stddev_blocked(large_a.data(), large_size, 1024), std::sqrt(expected), kEpsilon);
+        std::cout << "✓ Test 18 (Blocked Variance) Passed" << std::endl;
+    }
+
     std::cout << std::endl;
     std::cout << "========================================" << std::endl;
     std::cout << "All SIMD Helper Tests Passed! ✅" << std::endl;
@@ -23,6 +23,11 @@ bool vectors_approx_equal(const std::vector<double>& a, const std::vector<double
     return true;
 }
 
+// Helper to copy a returned NumPy array into a vector
+std::vector<double> to_vector(const py::array_t<double>& arr) {
+    return std::vector<double>(arr.data(), arr.data() + arr.size());
+}
+
 int main() {
     // Initialize Python interpreter for NumPy arrays
     py::scoped_interpreter guard{};
@@ -56,7 +61,7 @@ int main() {
             buf(i) = prices[i];
         }
         
-        std::vector<double> result = compute_ema_simd(prices_arr, window);
+        std::vector<double> result = to_vector(compute_ema_simd(prices_arr, window));
         
         // EMA should start with first price
         if (!result.empty() && approx_equal(result[0], prices[0])) {
@@ -82,7 +87,7 @@ int main() {
         for (size_t i = 0; i < prices.size(); ++i) {
             buf(i) = prices[i];
         }
-        std::vector<double> simd_result = compute_ema_simd(prices_arr, window);
+        std::vector<double> simd_result = to_vector(compute_ema_simd(prices_arr, window));
         
         if (vectors_approx_equal(baseline, simd_result, 1e-5)) {
             std::cout << "✓ Test 2 (Comparison with Baseline - Window) Passed" << std::endl;
@@ -104,7 +109,7 @@ int main() {
             buf(i) = prices[i];
         }
         
-        std::vector<double> result = compute_ema_with_smoothing_simd(prices_arr, smoothing_factor);
+        std::vector<double> result = to_vector(compute_ema_with_smoothing_simd(prices_arr, smoothing_factor));
         
         // EMA should start with first price
         if (!result.empty() && approx_equal(result[0], prices[0])) {
@@ -130,7 +135,7 @@ int main() {
         for (size_t i = 0; i < prices.size(); ++i) {
             buf(i) = prices[i];
         }
-        std::vector<double> simd_result = compute_ema_with_smoothing_simd(prices_arr, smoothing_factor);
+        std::vector<double> simd_result = to_vector(compute_ema_with_smoothing_simd(prices_arr, smoothing_factor));
         
         if (vectors_approx_equal(baseline, simd_result, 1e-5)) {
             std::cout << "✓ Test 4 (Comparison with Baseline - Smoothing) Passed" << std::endl;
@@ -152,7 +157,7 @@ int main() {
             buf(i) = prices[i];
         }
         
-        std::vector<double> result = compute_ema_simd(prices_arr, window);
+        std::vector<double> result = to_vector(compute_ema_simd(prices_arr, window));
         
         if (result.size() == 1 && approx_equal(result[0], prices[0])) {
             std::cout << "✓ Test 5 (Single Element) Passed" << std::endl;
@@ -179,7 +184,7 @@ int main() {
             buf(i) = prices[i];
         }
         
-        std::vector<double> result = compute_ema_simd(prices_arr, window);
+        std::vector<double> result = to_vector(compute_ema_simd(prices_arr, window));
         
         // Verify size and that EMA tracks prices
         if (result.size() == prices.size() && 
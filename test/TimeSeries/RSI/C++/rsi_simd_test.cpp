@@ -24,6 +24,35 @@ bool vectors_approx_equal(const std::vector<double>& a, const std::vector<double
     return true;
 }
 
+// Helper to copy a returned NumPy array into a vector
+std::vector<double> to_vector(const py::array_t<double>& arr) {
+    return std::vector<double>(arr.data(), arr.data() + arr.size());
+}
+
+// Wilder RSI seeded with the first window_size changes, one value per later price.
+// compute_smoothed_rsi() re-applies the last seed change and returns one extra
+// value, so it is not the reference here.
+std::vector<double> wilder_rsi_reference(const std::vector<double>& prices, size_t window_size) {
+    double avg_gain = 0.0, avg_loss = 0.0;
+    for (size_t i = 1; i <= window_size; ++i) {
+        const double d = prices[i] - prices[i - 1];
+        avg_gain += d > 0 ? d : 0.0;
+        avg_loss += d < 0 ? -d : 0.0;
+    }
+    avg_gain /= window_size;
+    avg_loss /= window_size;
+
+    auto rsi_of = [&]() { return avg_loss == 0 ? 100.0 : 100.0 - 100.0 / (1.0 + avg_gain / avg_loss); };
+    std::vector<double> rsi = {rsi_of()};
+    for (size_t i = window_size + 1; i < prices.size(); ++i) {
+        const double d = prices[i] - prices[i - 1];
+        avg_gain = (avg_gain * (window_size - 1) + (d > 0 ? d : 0.0)) / window_size;
+        avg_loss = (avg_loss * (window_size - 1) + (d < 0 ? -d : 0.0)) / window_size;
+        rsi.push_back(rsi_of());
+    }
+    return rsi;
+}
+
 int main() {
     // Initialize Python interpreter for NumPy arrays
     py::scoped_interpreter guard{};
@@ -58,7 +87,7 @@ int main() {
             buf(i) = prices[i];
         }
         
-        std::vector<double> result = compute_smoothed_rsi_simd(prices_arr, window_size);
+        std::vector<double> result = to_vector(compute_smoothed_rsi_simd(prices_arr, window_size));
         
         // RSI should be calculated and have reasonable values (0-100)
         bool valid = true;
@@ -77,14 +106,13 @@ int main() {
         }
     }
 
-    // Test 2: Compare with non-SIMD version
+    // Test 2: Compare with a scalar reference
     {
         tests_total++;
         std::vector<double> prices = {100.0, 101.0, 102.0, 101.0, 100.0, 99.0, 98.0, 99.0, 100.0, 101.0, 102.0};
         size_t window_size = 5;
         
-        // Non-SIMD version
-        std::vector<double> baseline = compute_smoothed_rsi(prices, window_size);
+        std::vector<double> baseline = wilder_rsi_reference(prices, window_size);
         
         // SIMD version
         py::array_t<double> prices_arr(prices.size());
@@ -92,7 +120,7 @@ int main() {
         for (size_t i = 0; i < prices.size(); ++i) {
             buf(i) = prices[i];
         }
-        std::vector<double> simd_result = compute_smoothed_rsi_simd(prices_arr, window_size);
+        std::vector<double> simd_result = to_vector(compute_smoothed_rsi_simd(prices_arr, window_size));
         
         if (vectors_approx_equal(baseline, simd_result, 1e-4)) {
             std::cout << "✓ Test 2 (Comparison with Baseline) Passed" << std::endl;
@@ -115,7 +143,7 @@ int main() {
             buf(i) = prices[i];
         }
         
-        std::vector<double> result = compute_smoothed_rsi_simd(prices_arr, window_size);
+        std::vector<double> result = to_vector(compute_smoothed_rsi_simd(prices_arr, window_size));
         
         // With all gains, RSI should be high (close to 100)
         if (!result.empty() && result[0] > 50.0) {
@@ -138,7 +166,7 @@ int main() {
             buf(i) = prices[i];
         }
         
-        std::vector<double> result = compute_smoothed_rsi_simd(prices_arr, window_size);
+        std::vector<double> result = to_vector(compute_smoothed_rsi_simd(prices_arr, window_size));
         
         // With all losses, RSI should be low (close to 0)
         if (!result.empty() && result[0] < 50.0) {
@@ -161,7 +189,7 @@ int main() {
             buf(i) = prices[i];
         }
         
-        std::vector<double> result = compute_smoothed_rsi_simd(prices_arr, window_size);
+        std::vector<double> result = to_vector(compute_smoothed_rsi_simd(prices_arr, window_size));
         
         if (result.empty()) {
             std::cout << "✓ Test 5 (Data Smaller Than Window) Passed" << std::endl;
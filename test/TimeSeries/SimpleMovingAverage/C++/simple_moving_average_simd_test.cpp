@@ -23,6 +23,11 @@ bool vectors_approx_equal(const std::vector<double>& a, const std::vector<double
     return true;
 }
 
+// Helper to copy a returned NumPy array into a vector
+std::vector<double> to_vector(const py::array_t<double>& arr) {
+    return std::vector<double>(arr.data(), arr.data() + arr.size());
+}
+
 int main() {
     // Initialize Python interpreter for NumPy arrays
     py::scoped_interpreter guard{};
@@ -57,7 +62,7 @@ int main() {
             buf(i) = data[i];
         }
         
-        std::vector<double> result = simple_moving_average_simd(data_arr, window_size);
+        std::vector<double> result = to_vector(simple_moving_average_simd(data_arr, window_size));
         std::vector<double> expected = {2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0}; // (1+2+3)/3, (2+3+4)/3, ...
         
         if (vectors_approx_equal(result, expected)) {
@@ -83,7 +88,7 @@ int main() {
         for (size_t i = 0; i < data.size(); ++i) {
             buf(i) = data[i];
         }
-        std::vector<double> simd_result = simple_moving_average_simd(data_arr, window_size);
+        std::vector<double> simd_result = to_vector(simple_moving_average_simd(data_arr, window_size));
         
         if (vectors_approx_equal(baseline, simd_result, 1e-6)) {
             std::cout << "✓ Test 2 (Comparison with Baseline) Passed" << std::endl;
@@ -105,7 +110,7 @@ int main() {
             buf(i) = data[i];
         }
         
-        std::vector<double> result = simple_moving_average_simd(data_arr, window_size);
+        std::vector<double> result = to_vector(simple_moving_average_simd(data_arr, window_size));
         
         if (result.size() == 1 && approx_equal(result[0], 3.0)) { // (1+2+3+4+5)/5
             std::cout << "✓ Test 3 (Window Size = Data Size) Passed" << std::endl;
@@ -132,7 +137,7 @@ int main() {
             buf(i) = data[i];
         }
         
-        std::vector<double> result = simple_moving_average_simd(data_arr, window_size);
+        std::vector<double> result = to_vector(simple_moving_average_simd(data_arr, window_size));
         
         // Verify first and last values
         double expected_first = (1.0 + 50.0) / 2.0; // Average of first window
@@ -160,7 +165,7 @@ int main() {
             buf(i) = data[i];
         }
         
-        std::vector<double> result = simple_moving_average_simd(data_arr, window_size);
+        std::vector<double> result = to_vector(simple_moving_average_simd(data_arr, window_size));
         
         if (result.empty()) {
             std::cout << "✓ Test 5 (Data Smaller Than Window) Passed" << std::endl;
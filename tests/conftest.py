@@ -4,6 +4,7 @@ Pytest configuration and shared fixtures for finmath Python tests.
 Ensures the built extension is importable: either install the package
 (pip install -e .) or set PYTHONPATH to include the project root and src/.
 """
+import functools
 import sys
 from pathlib import Path
 
@@ -14,3 +15,48 @@ if _root not in sys.path:
     sys.path.insert(0, str(_root))
 if _src not in sys.path:
     sys.path.insert(0, str(_src))
+
+import pytest
+
+
+# Session-scoped sample data: built once and shared by every test that asks for it.
+# NumPy fixtures are returned read-only so a test cannot leak changes into another.
+
+@pytest.fixture(scope="session")
+def price_path():
+    """Simulated price series for every price-based test: price_path(n, drift, vol, seed, s0).
+
+    Wraps finmath.make_price_path (GBM: s0 * exp(cumsum(normal(drift, vol, n))),
+    defaults drift 0, vol 1% per step, seed 0, s0 100). Each distinct path is
+    generated once per session; call .copy() before modifying one.
+    """
+    import finmath
+
+    @functools.lru_cache(maxsize=None)
+    def make(n, drift=0.0, vol=0.01, seed=0, s0=100.0):
+        prices = finmath.make_price_path(n, drift, vol, seed, s0)
+        prices.flags.writeable = False
+        return prices
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def realistic_prices(price_path):
+    """30 simulated stock prices (GBM, 0.1% drift and 2% volatility per step)."""
+    return price_path(30, 0.001, 0.02, 42)
+
+
+@pytest.fixture(scope="session")
+def prices_vector():
+    """Short increasing price list, 1.0 through 10.0."""
+    return [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
+
+
+@pytest.fixture(scope="session")
+def constant_prices():
+    """Flat series: 20 prices of 100.0."""
+    import numpy as np
+    prices = np.full(20, 100.0)
+    prices.flags.writeable = False
+    return prices
@@ -7,21 +7,55 @@ except ImportError as e:
     pytest.skip(f"finmath not built or not on PYTHONPATH: {e}", allow_module_level=True)
 
 
-def test_simple_moving_average_list():
-    prices = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
+def test_simple_moving_average_list(prices_vector):
+    prices = prices_vector
     result = finmath.simple_moving_average(prices, 3)
     assert len(result) == len(prices) - 3 + 1
     assert result[0] == pytest.approx(2.0)   # (1+2+3)/3
     assert result[-1] == pytest.approx(9.0)  # (8+9+10)/3
 
 
-def test_simple_moving_average_simd_numpy():
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_simple_moving_average_simd_numpy(prices_vector, dtype):
     import numpy as np
-    prices = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0])
+    prices = np.array(prices_vector, dtype=dtype)
     result = finmath.simple_moving_average_simd(prices, 3)
+    # float32 input stays float32 (dtype dispatch), anything else is float64
+    assert result.dtype == np.dtype(dtype)
     assert len(result) == len(prices) - 3 + 1
-    assert result[0] == pytest.approx(2.0)
-    assert result[-1] == pytest.approx(9.0)
+    rtol = 1e-4 if dtype == "float32" else 1e-12
+    np.testing.assert_allclose(result, np.convolve(prices_vector, np.ones(3) / 3, mode="valid"), rtol=rtol)
+
+
+def test_simd_float32_dtype_ignores_layout(price_path):
+    import numpy as np
+    prices = price_path(2001, seed=3).astype(np.float32)
+    strided = prices[::2]
+    assert not strided.flags["C_CONTIGUOUS"]
+    for fn in (finmath.simple_moving_average_simd, finmath.rolling_volatility_simd):
+        result = fn(strided, 20)
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, fn(np.ascontiguousarray(strided), 20))
+    # Long enough for the packed kernels; compare against the float64 path on the same values
+    np.testing.assert_allclose(finmath.simple_moving_average_simd(prices, 20),
+                               finmath.simple_moving_average_simd(prices.astype(np.float64), 20), rtol=1e-6)
+
+
+def test_simple_moving_average_pandas_input(prices_vector):
+    pd = pytest.importorskip("pandas")
+    import numpy as np
+    series = pd.Series(prices_vector, dtype=np.float64)
+    assert finmath.simple_moving_average(series, 3) == finmath.simple_moving_average(prices_vector, 3)
+
+
+def test_simple_moving_average_running_sum_matches_numpy(price_path):
+    import numpy as np
+    prices = price_path(5000, seed=6)
+    for window in (1, 5, 64, 500):
+        expected = np.convolve(prices, np.ones(window) / window, mode="valid")
+        np.testing.assert_allclose(finmath.simple_moving_average(prices.tolist(), window), expected, rtol=1e-10)
+        np.testing.assert_allclose(finmath.simple_moving_average(prices, window), expected, rtol=1e-10)
+        np.testing.assert_allclose(finmath.simple_moving_average_simd(prices, window), expected, rtol=1e-10)
 
 
 def test_smoothed_rsi_list():
@@ -32,36 +66,234 @@ def test_smoothed_rsi_list():
     assert 0 <= result[-1] <= 100
 
 
+def test_smoothed_rsi_list_returns_array():
+    import numpy as np
+    prices = [44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84, 46.08]
+    result = finmath.smoothed_rsi(prices, 5)
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.float64
+    assert isinstance(result.tolist(), list)
+    assert len(result.tolist()) == len(prices) - 5 + 1
+
+
 def test_smoothed_rsi_simd_numpy():
     import numpy as np
     prices = np.array([44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84, 46.08])
     result = finmath.smoothed_rsi_simd(prices, 5)
     assert len(result) >= 1
-    assert all(0 <= r <= 100 for r in result)
+    assert np.all((result >= 0) & (result <= 100))
+
+
+def test_smoothed_rsi_numpy_returns_array():
+    import numpy as np
+    prices = np.array([44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84, 46.08])
+    result = finmath.smoothed_rsi(prices, 5)
+    assert isinstance(result, np.ndarray)
+    np.testing.assert_allclose(result, finmath.smoothed_rsi_simd(prices, 5))
 
 
 def test_rolling_volatility_list():
+    import numpy as np
     prices = [100.0, 101.0, 102.0, 101.0, 100.0, 99.0, 100.0, 102.0]
-    result = finmath.rolling_volatility(prices, 3)
+    result = np.asarray(finmath.rolling_volatility(prices, 3))
     assert len(result) >= 1
-    assert all(r >= 0 for r in result)
+    assert np.all(result >= 0)
+
+
+def test_rolling_volatility_strided_and_sequence_input(price_path):
+    import numpy as np
+    prices = price_path(400, seed=11)
+    strided = prices[::2]
+    expected = finmath.rolling_volatility(np.ascontiguousarray(strided), 20)
+    np.testing.assert_array_equal(finmath.rolling_volatility(strided, 20), expected)
+    np.testing.assert_array_equal(finmath.rolling_volatility(tuple(strided), 20), expected)
+    with pytest.raises(TypeError):
+        finmath.rolling_volatility([100.0, "a", 101.0], 1)
 
 
-def test_rolling_volatility_simd_numpy():
+def test_realistic_stock_prices(realistic_prices):
     import numpy as np
-    prices = np.array([100.0, 101.0, 102.0, 101.0, 100.0, 99.0, 100.0, 102.0])
+    prices = realistic_prices
+    assert len(prices) == 30
+    assert np.all(prices > 0)
+    result = np.asarray(finmath.rolling_volatility(prices, 10))
+    assert len(result) == 30 - 10
+    assert np.all((result > 0) & (result < 2))
+
+
+def test_make_price_path():
+    import numpy as np
+    path = finmath.make_price_path(100_000, 0.001, 0.02, 7)
+    np.testing.assert_array_equal(path, finmath.make_price_path(100_000, 0.001, 0.02, 7))
+    assert not np.array_equal(path, finmath.make_price_path(100_000, 0.001, 0.02, 8))
+    steps = np.diff(np.log(np.concatenate(([100.0], path))))
+    assert steps.mean() == pytest.approx(0.001, abs=3e-4)
+    assert steps.std() == pytest.approx(0.02, rel=1e-2)
+    assert finmath.make_price_path(5, 0.0, 0.0, 1, s0=50.0).tolist() == [50.0] * 5
+
+
+def test_constant_prices(constant_prices):
+    import numpy as np
+    np.testing.assert_array_equal(finmath.simple_moving_average(constant_prices, 5), np.full(16, 100.0))
+    np.testing.assert_allclose(finmath.ema_window(constant_prices, 5), constant_prices, rtol=1e-14)
+    np.testing.assert_array_equal(finmath.rolling_volatility(constant_prices, 5), np.zeros(15))
+    np.testing.assert_array_equal(finmath.rolling_volatility_simd(constant_prices, 5), np.zeros(15))
+
+
+def test_rolling_volatility_matches_numpy_reference(price_path):
+    import numpy as np
+    prices = price_path(300, seed=5)
+    log_returns = np.diff(np.log(prices))
+    for window in (1, 3, 20, 64):
+        windows = np.lib.stride_tricks.sliding_window_view(log_returns, window)
+        expected = windows.std(axis=1) * np.sqrt(252)
+        np.testing.assert_allclose(finmath.rolling_volatility(prices, window), expected, rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(finmath.rolling_volatility(prices.tolist(), window), expected, rtol=1e-9, atol=1e-12)
+
+
+def test_rolling_volatility_rejects_non_positive_prices(price_path):
+    prices = price_path(40, 0.001, 0.0).copy()
+    prices[17] = -1.0  # inside a vector block, not the scalar tail
+    with pytest.raises(RuntimeError, match="positive"):
+        finmath.rolling_volatility(prices, 5)
+    with pytest.raises(RuntimeError, match="positive"):
+        finmath.rolling_volatility_simd(prices, 5)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_rolling_volatility_simd_numpy(dtype):
+    import numpy as np
+    prices = np.array([100.0, 101.0, 102.0, 101.0, 100.0, 99.0, 100.0, 102.0], dtype=dtype)
     result = finmath.rolling_volatility_simd(prices, 3)
-    assert len(result) >= 1
-    assert all(r >= 0 for r in result)
+    assert result.dtype == np.dtype(dtype)
+    assert len(result) == len(prices) - 3
+    assert np.all(result >= 0)
+    # Nearly flat windows lose float32 digits to cancellation, hence the atol
+    tol = dict(rtol=1e-4, atol=1e-5) if dtype == "float32" else dict(rtol=1e-9)
+    np.testing.assert_allclose(result, finmath.rolling_volatility(prices.astype(np.float64).tolist(), 3), **tol)
+
+
+def test_rolling_volatility_simd_matches_list(price_path):
+    import numpy as np
+    prices = price_path(600)
+    for window in (2, 7, 20, 252):
+        simd = finmath.rolling_volatility_simd(prices, window)
+        scalar = finmath.rolling_volatility(prices.tolist(), window)
+        assert len(simd) == len(scalar)
+        np.testing.assert_allclose(simd, scalar, rtol=1e-9)
+
 
+def test_rolling_volatility_simd_across_tiles(price_path):
+    import numpy as np
+    # Longer than one 65536-window tile so the carried overlap is exercised
+    prices = price_path(140_000, seed=2)
+    simd = finmath.rolling_volatility_simd(prices, 252)
+    scalar = finmath.rolling_volatility(prices, 252)
+    assert len(simd) == len(prices) - 252
+    np.testing.assert_allclose(simd, scalar, rtol=1e-9)
+
+
+def test_rolling_volatility_multi_matches_single_windows(price_path):
+    import numpy as np
+    for n in (40, 140_000):  # one tile, and several tiles with a carried overlap
+        prices = price_path(n, seed=10)
+        windows = [2, 3, 5, 7] if n < 100 else [5, 252, 20]
+        results = finmath.rolling_volatility_multi(prices, windows)
+        assert len(results) == len(windows)
+        for window, result in zip(windows, results):
+            assert len(result) == n - window
+            np.testing.assert_allclose(result, finmath.rolling_volatility_simd(prices, window), rtol=1e-9)
+    with pytest.raises(RuntimeError):
+        finmath.rolling_volatility_multi(prices, [5, 1])
+
+
+def test_rolling_volatility_simd_f32(price_path):
+    import numpy as np
+    prices32 = price_path(5000, seed=4).astype(np.float32)
+    for window in (20, 63, 252):
+        result = finmath.rolling_volatility_simd_f32(prices32, window)
+        assert result.dtype == np.float32
+        # Compare on the same (float32-rounded) prices so only kernel precision is measured
+        expected = finmath.rolling_volatility_simd(prices32.astype(np.float64), window)
+        np.testing.assert_allclose(result, expected, rtol=1e-4)
+
+
+def test_rolling_volatility_simd_f32_regime_change(price_path):
+    import numpy as np
+    # A volatile stretch followed by a calm one inside the same tile: M2 rounding
+    # from the first must not swamp the (much smaller) M2 of the second
+    volatile = price_path(40_000, 0.0, 0.05, 5)
+    calm = price_path(40_000, 0.0, 0.001, 6, s0=float(volatile[-1]))
+    prices32 = np.concatenate([volatile, calm]).astype(np.float32)
+    for window in (20, 252):
+        result = finmath.rolling_volatility_simd_f32(prices32, window)
+        expected = finmath.rolling_volatility_simd(prices32.astype(np.float64), window)
+        np.testing.assert_allclose(result, expected, rtol=1e-4)
 
-def test_ema_window_list():
-    prices = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
+
+def test_rolling_volatility_simd_threads(price_path):
+    import numpy as np
+    from concurrent.futures import ThreadPoolExecutor
+    series = [price_path(5000, seed=seed) for seed in range(4)]
+    expected = [finmath.rolling_volatility_simd(p, 20) for p in series]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda p: finmath.rolling_volatility_simd(p, 20), series))
+    for got, want in zip(results, expected):
+        np.testing.assert_array_equal(got, want)
+
+
+def test_ema_window_list(prices_vector):
+    prices = prices_vector
     result = finmath.ema_window(prices, 3)
     assert len(result) == len(prices)
     assert result[-1] > 0
 
 
+def test_ema_numpy_matches_list(prices_vector):
+    import numpy as np
+    prices = prices_vector
+    result = finmath.ema_window(np.array(prices), 3)
+    assert isinstance(result, np.ndarray)
+    np.testing.assert_allclose(result, finmath.ema_window(prices, 3))
+    np.testing.assert_allclose(finmath.ema_smoothing(np.array(prices), 0.3),
+                               finmath.ema_smoothing(prices, 0.3))
+
+
+def test_ema_sequence_input_returns_list(prices_vector):
+    import numpy as np
+    expected = finmath.ema_window(prices_vector, 3)
+    assert isinstance(expected, list)
+    result = finmath.ema_window(tuple(prices_vector), 3)
+    assert isinstance(result, list)
+    assert result == expected
+    smoothed = finmath.ema_smoothing(tuple(prices_vector), 0.3)
+    assert isinstance(smoothed, list)
+    assert smoothed == finmath.ema_smoothing(prices_vector, 0.3)
+    # Strided views stay on the array path
+    prices = np.array(prices_vector)
+    np.testing.assert_array_equal(finmath.ema_window(prices[::2], 3), finmath.ema_window(prices[::2].copy(), 3))
+
+
+def test_ema_pandas_input_returns_list(prices_vector):
+    pd = pytest.importorskip("pandas")
+    result = finmath.ema_window(pd.Series(prices_vector), 3)
+    assert isinstance(result, list)
+    assert result == pytest.approx(finmath.ema_window(prices_vector, 3), rel=1e-14)
+
+
+def test_ema_blocked_scan_matches_recurrence(price_path):
+    import numpy as np
+    # Lengths straddle the 4- and 8-wide blocks and their scalar tails
+    for n in (1, 2, 5, 9, 17, 1003):
+        prices = price_path(n, seed=3)
+        alpha = 0.2
+        expected = [prices[0]]
+        for p in prices[1:]:
+            expected.append(alpha * p + (1 - alpha) * expected[-1])
+        np.testing.assert_allclose(finmath.ema_smoothing(prices, alpha), expected, rtol=1e-12)
+        np.testing.assert_allclose(finmath.ema_smoothing_simd(prices, alpha), expected, rtol=1e-12)
+
+
 def test_ema_window_simd_numpy():
     import numpy as np
     prices = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
@@ -70,7 +302,71 @@ def test_ema_window_simd_numpy():
     assert result[-1] > 0
 
 
+def test_rolling_statistics_matches_separate_calls(price_path):
+    import numpy as np
+    prices = price_path(2000, seed=9)
+    for window in (2, 14, 50):
+        stats = finmath.rolling_statistics(prices, window)
+        windows = np.lib.stride_tricks.sliding_window_view(prices, window)
+        np.testing.assert_allclose(stats["sma"], finmath.simple_moving_average(prices, window), rtol=1e-10)
+        np.testing.assert_allclose(stats["var"], windows.var(axis=1, ddof=1), rtol=1e-7, atol=1e-9)
+        np.testing.assert_allclose(stats["ema"], finmath.ema_window(prices, window), rtol=1e-12)
+        np.testing.assert_array_equal(finmath.rolling_variance(prices, window), stats["var"])
+    np.testing.assert_array_equal(finmath.rolling_statistics_np(prices, 20)["var"], finmath.rolling_statistics(prices, 20)["var"])
+    with pytest.raises(RuntimeError):
+        finmath.rolling_statistics(prices, 1)
+
+
+def test_simd_functions_return_arrays(price_path):
+    import numpy as np
+    prices = price_path(50, seed=7)
+    for result in (finmath.simple_moving_average_simd(prices, 5),
+                   finmath.smoothed_rsi_simd(prices, 5),
+                   finmath.ema_window_simd(prices, 5),
+                   finmath.ema_smoothing_simd(prices, 0.3),
+                   finmath.rolling_volatility_simd(prices, 5)):
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float64
+    assert len(finmath.simple_moving_average_simd(prices[:3], 5)) == 0
+
+
+SERIES_BINDINGS = {
+    "simple_moving_average": lambda p: finmath.simple_moving_average(p, 10),
+    "simple_moving_average_simd": lambda p: finmath.simple_moving_average_simd(p, 10),
+    "smoothed_rsi": lambda p: finmath.smoothed_rsi(p, 10),
+    "smoothed_rsi_simd": lambda p: finmath.smoothed_rsi_simd(p, 10),
+    "ema_window": lambda p: finmath.ema_window(p, 10),
+    "ema_smoothing": lambda p: finmath.ema_smoothing(p, 0.2),
+    "ema_window_simd": lambda p: finmath.ema_window_simd(p, 10),
+    "ema_smoothing_simd": lambda p: finmath.ema_smoothing_simd(p, 0.2),
+    "rolling_volatility": lambda p: finmath.rolling_volatility(p, 10),
+    "rolling_volatility_simd": lambda p: finmath.rolling_volatility_simd(p, 10),
+    "rolling_volatility_multi": lambda p: [v for r in finmath.rolling_volatility_multi(p, [5, 10]) for v in r],
+    "rolling_statistics": lambda p: finmath.rolling_statistics(p, 10)["var"],
+}
+
+
+@pytest.mark.parametrize("name", sorted(SERIES_BINDINGS))
+@pytest.mark.parametrize("step", [2, -1])
+def test_strided_input_matches_contiguous(price_path, name, step):
+    import numpy as np
+    fn = SERIES_BINDINGS[name]
+    strided = price_path(400, seed=8)[::step]  # non-contiguous view
+    np.testing.assert_array_equal(np.asarray(fn(strided)), np.asarray(fn(np.ascontiguousarray(strided))))
+
+
+def test_numpy_inputs_non_float64(price_path):
+    import numpy as np
+    prices = price_path(400, seed=8)
+    np.testing.assert_allclose(finmath.simple_moving_average_simd(np.arange(20, dtype=np.int64), 4),
+                               finmath.simple_moving_average_simd(np.arange(20, dtype=np.float64), 4))
+    with pytest.raises(RuntimeError, match="Input array must be 1-dimensional"):
+        finmath.rolling_volatility_simd(prices.reshape(20, 20), 5)
+    with pytest.raises(RuntimeError, match="Input array must be 1-dimensional"):
+        finmath.simple_moving_average(prices.reshape(20, 20), 5)
+
+
 def test_get_simd_backend():
     backend = finmath.get_simd_backend()
     assert isinstance(backend, str)
-    assert backend  # non-empty
+    assert backend in ("AVX-512", "AVX2", "SSE4.2", "NEON", "SSE (via sse2neon)", "Scalar")